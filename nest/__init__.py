@@ -9,7 +9,8 @@ This is the entry point of NeST package.
 
 Following actions are performed as part of setup, when
 nest is imported:
-1. Check if nest can manage network namespace
+1. Check if nest can manage network namespace (unless it is used
+   offline, see `_is_offline`)
 2. Store SUDO user and group id information
 """
 
@@ -63,7 +64,17 @@ def _test_netns_creation() -> bool:
     raise OSError(exit_code, os.strerror(exit_code))
 
 
-if not _test_netns_creation():
+def _is_offline() -> bool:
+    """
+    Whether NeST only works with the results of earlier experiments
+    (through the `nest` command, or with NEST_OFFLINE environment
+    variable set), hence doesn't need to manage network namespaces
+    """
+    program = os.path.basename((sys.argv or [""])[0])
+    return bool(os.environ.get("NEST_OFFLINE")) or program == "nest"
+
+
+if not _is_offline() and not _test_netns_creation():
     print("nest: Unable to create network namespaces", file=sys.stderr)
     print("nest: Python package requires root access or CAP_SYS_ADMIN", file=sys.stderr)
     sys.exit(1)
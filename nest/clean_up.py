@@ -9,6 +9,8 @@ and delete all namespaces after the experiment is complete.
 import atexit
 import logging
 import shutil
+import sys
+from contextlib import contextmanager
 from pathlib import Path
 from nest.network_utilities import ipv6_dad_check
 from nest.mpeg_dash_encoder import MpegDashEncoder
@@ -27,6 +29,12 @@ logger = logging.getLogger(__name__)
 def tcp_modules_clean_up():
     """Clean up the modified TCP modules"""
 
+    # Modules are only modified by experiments. Importing them at exit
+    # (when no experiment was set up) fails once the interpreter is
+    # shutting down.
+    if "nest.experiment.experiment" not in sys.modules:
+        return
+
     from .experiment.experiment import Experiment
 
     # Remove newly loaded modules
@@ -40,6 +48,28 @@ def tcp_modules_clean_up():
     (Experiment.old_cong_algos).clear()
 
 
+# Processes not killed by `kill_processes`, see `keep_running_processes`
+_kept_pids = None  # pylint: disable=invalid-name
+
+
+def kill_ns_processes(ns_id):
+    """
+    Kill any running processes in a namespace, except those kept
+    running (See `keep_running_processes`)
+
+    Parameters
+    ----------
+    ns_id : str
+        Namespace id
+    """
+    if _kept_pids is None:
+        engine.kill_all_processes(ns_id)
+    else:
+        engine.kill_processes(
+            [pid for pid in engine.get_ns_pids(ns_id) if pid not in _kept_pids]
+        )
+
+
 def kill_processes():
     """
     Kill any running processes in namespaces
@@ -47,7 +77,26 @@ def kill_processes():
     nodes = TopologyMap.get_nodes()
 
     for ns_id in nodes:
-        engine.kill_all_processes(ns_id)
+        kill_ns_processes(ns_id)
+
+
+@contextmanager
+def keep_running_processes():
+    """
+    Keep the processes running in the namespaces now (For eg., routing
+    daemons) running while in the block, so that experiments run in the
+    block only kill the tools they started. All the processes are killed
+    on leaving the block.
+    """
+    global _kept_pids  # pylint: disable=global-statement
+    _kept_pids = {
+        pid for ns_id in TopologyMap.get_nodes() for pid in engine.get_ns_pids(ns_id)
+    }
+    try:
+        yield
+    finally:
+        _kept_pids = None
+        kill_processes()
 
 
 @atexit.register
@@ -57,6 +106,9 @@ def delete_namespaces():
     Delete all the newly generated namespaces
     """
     nodes = TopologyMap.get_nodes()
+    if not nodes:
+        # For eg., NeST used offline, through the `nest` command
+        return
 
     if config.get_value("delete_namespaces_on_termination"):
         for ns_id in nodes:
@@ -0,0 +1,402 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Command line interface of NeST, to work with the results stored in the
+dump of an earlier experiment (For eg., on another machine, without
+root access). For eg.,
+
+    nest plot "tcp(01-01-2026-10:00:00)_dump" --node h1 --metric cwnd
+    nest summarize "tcp(01-01-2026-10:00:00)_dump" --tool ss
+    nest compare "fq_codel(...)_dump" "pie(...)_dump" --output comparison
+
+Run `nest <command> --help` for all the options.
+"""
+
+import argparse
+import json
+import os
+import sys
+import numpy as np
+from nest import config
+from nest.experiment.compare import METRICS, compare
+from nest.experiment.pack import ARCHIVE_SUFFIXES, Pack
+from nest.experiment.results import Results
+from nest.experiment.run_exp import PLOTTERS, replot
+from nest.experiment.series import FlowSeries
+
+# Keys of records which aren't metrics
+_NOT_METRICS = ("meta", "timestamp", "kind")
+
+
+def _matches(name, flows):
+    """
+    Whether the flow `name` is one of `flows`. An address also
+    matches its flows to different ports (For eg., "10.0.0.2" matches
+    "10.0.0.2:5000").
+    """
+    return any(name == flow or name.startswith(f"{flow}:") for flow in flows)
+
+
+def _filter_flows(entries, flows):
+    """
+    Keep only the `flows` of the results of a node
+
+    Parameters
+    ----------
+    entries : List[dict]
+        Results of a node, keyed by flow (destination address,
+        interface...). Flows of ss are keyed by destination address
+        and then by port.
+    flows : List[str]
+        Flows to be kept
+
+    Returns
+    -------
+    List[dict]
+    """
+    filtered = []
+    for entry in entries:
+        kept = {}
+        for key, value in entry.items():
+            if _matches(str(key), flows):
+                kept[key] = value
+            elif isinstance(value, dict):
+                ports = {
+                    port: flow
+                    for port, flow in value.items()
+                    if _matches(f"{key}:{port}", flows)
+                }
+                if ports:
+                    kept[key] = ports
+        if kept:
+            filtered.append(kept)
+    return filtered
+
+
+def filter_results(results, tools=None, nodes=None, flows=None):
+    """
+    Keep only the results of the given tools, nodes and flows
+
+    Parameters
+    ----------
+    results : dict
+        Tool names mapped to their results, keyed by node name
+    tools : List[str]
+        Tools to be kept (Default: all)
+    nodes : List[str]
+        Nodes to be kept (Default: all)
+    flows : List[str]
+        Flows to be kept, as "<address>", "<address>:<port>" or
+        "<interface>" (Default: all)
+
+    Returns
+    -------
+    dict
+    """
+    filtered = {}
+    for toolname, tool_results in results.items():
+        if tools and toolname not in tools:
+            continue
+        if not isinstance(tool_results, dict):
+            continue
+        tool_results = {
+            node: entries
+            for node, entries in tool_results.items()
+            if not nodes or node in nodes
+        }
+        if flows:
+            tool_results = {
+                node: _filter_flows(entries, flows)
+                for node, entries in tool_results.items()
+                if isinstance(entries, list)
+            }
+            tool_results = {
+                node: entries for node, entries in tool_results.items() if entries
+            }
+        if tool_results:
+            filtered[toolname] = tool_results
+    return filtered
+
+
+def _as_series(value):
+    """`value` as a FlowSeries, if it is a list of timestamped records"""
+    if isinstance(value, FlowSeries):
+        return value
+    if (
+        isinstance(value, list)
+        and value
+        and all(isinstance(item, dict) for item in value)
+        and any("timestamp" in item for item in value)
+    ):
+        try:
+            return FlowSeries.from_records(value)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _iter_series(value, path):
+    """
+    Find every metric sampled over time in `value`
+
+    Parameters
+    ----------
+    value : object
+        Results (or a part of them)
+    path : List[str]
+        Keys leading to `value`
+
+    Yields
+    ------
+    (List[str], str, numpy.ndarray)
+        Path to the flow, name of the metric and its values
+    """
+    series = _as_series(value)
+    if series is not None:
+        for name, column in series.columns.items():
+            if name not in _NOT_METRICS and column.dtype != object:
+                yield path, name, column.astype(np.float64)
+    elif isinstance(value, dict) and "timestamp" in value:
+        # Metrics stored as lists of values (For eg., link stats)
+        for name, column in value.items():
+            if name in _NOT_METRICS or not isinstance(column, list):
+                continue
+            try:
+                yield path, name, np.array(column, dtype=np.float64)
+            except (TypeError, ValueError):
+                continue
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _iter_series(item, path + [str(key)])
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_series(item, path)
+
+
+def summarize(results, metrics=None):
+    """
+    Summarize every metric sampled over time in `results`
+
+    Parameters
+    ----------
+    results : dict
+        Tool names mapped to their results, keyed by node name
+    metrics : List[str]
+        Metrics to be summarized (Default: all)
+
+    Returns
+    -------
+    List[dict]
+        A row per tool, node, flow and metric with the number of
+        samples and their mean, minimum, 95th percentile and maximum
+    """
+    rows = []
+    for toolname, tool_results in results.items():
+        for path, metric, values in _iter_series(tool_results, []):
+            if metrics and metric not in metrics:
+                continue
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                continue
+            rows.append(
+                {
+                    "tool": toolname,
+                    "node": path[0] if path else "",
+                    "flow": ":".join(path[1:]),
+                    "metric": metric,
+                    "samples": len(values),
+                    "mean": float(values.mean()),
+                    "min": float(values.min()),
+                    "p95": float(np.percentile(values, 95)),
+                    "max": float(values.max()),
+                }
+            )
+    return rows
+
+
+def _format_table(rows):
+    """Format the rows of `summarize` as an aligned table"""
+    header = ["tool", "node", "flow", "metric", "samples", "mean", "min", "p95", "max"]
+    lines = [header]
+    for row in rows:
+        lines.append(
+            [
+                (
+                    str(row[key])
+                    if key not in ("mean", "min", "p95", "max")
+                    else f"{row[key]:.3f}"
+                )
+                for key in header
+            ]
+        )
+    widths = [max(len(line[index]) for line in lines) for index in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+        for line in lines
+    )
+
+
+def _load(dump, tools):
+    """Read the results stored in a dump folder or archive"""
+    if dump.endswith(ARCHIVE_SUFFIXES):
+        return Pack.load_archive(dump, tools)
+    return Results.load_dump(dump, tools)
+
+
+def _plot(args):
+    """Run `nest plot`"""
+    if args.dump.endswith(ARCHIVE_SUFFIXES) and args.output is None:
+        print("nest: --output is required to plot an archive", file=sys.stderr)
+        return 2
+
+    results = filter_results(
+        _load(args.dump, args.tool or list(PLOTTERS)), args.tool, args.node, args.flow
+    )
+    if not results:
+        print("nest: No results to plot", file=sys.stderr)
+        return 1
+
+    output = args.output or args.dump
+    os.makedirs(output, exist_ok=True)
+    if args.incremental:
+        config.set_value("plot_incremental", True)
+    if args.max_points is not None:
+        config.set_value("plot_max_points", args.max_points)
+
+    replot(output, results, args.metric)
+    return 0
+
+
+def _summarize(args):
+    """Run `nest summarize`"""
+    results = filter_results(
+        _load(args.dump, args.tool), args.tool, args.node, args.flow
+    )
+    rows = summarize(results, args.metric)
+    if args.json:
+        print(json.dumps(rows, indent=4))
+    elif rows:
+        print(_format_table(rows))
+    else:
+        print("nest: No results to summarize", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _compare(args):
+    """Run `nest compare`"""
+    comparison = compare(args.dumps, args.output, args.metric, args.jobs)
+    if comparison is None:
+        print("nest: No flows to compare", file=sys.stderr)
+        return 1
+    print(f"Comparison written to {args.output}")
+    return 0
+
+
+def _get_parser():
+    """Parser of the command line arguments"""
+    parser = argparse.ArgumentParser(
+        prog="nest",
+        description="Work with the results of NeST experiments",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument(
+        "dump", help="Experiment dump folder (or archive created by compress_dump)"
+    )
+    filters.add_argument(
+        "--tool", action="append", help="Only results of this tool (For eg., ss)"
+    )
+    filters.add_argument("--node", action="append", help="Only results of this node")
+    filters.add_argument(
+        "--flow",
+        action="append",
+        help="Only this flow: <address>, <address>:<port> or <interface>",
+    )
+    filters.add_argument(
+        "--metric", action="append", help="Only this metric (For eg., cwnd)"
+    )
+
+    plot = commands.add_parser(
+        "plot",
+        parents=[filters],
+        help="Plot the results again, in parallel",
+        description="Plot the results again, in parallel. Plots are "
+        "written to the dump folder, unless --output is given. With "
+        "--metric, only plots whose file name has the metric are rendered.",
+    )
+    plot.add_argument("--output", help="Folder to write the plots to")
+    plot.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip plots whose data hasn't changed (see plot_incremental config)",
+    )
+    plot.add_argument(
+        "--max-points",
+        type=int,
+        help="Maximum points plotted per series (see plot_max_points config)",
+    )
+    plot.set_defaults(run=_plot)
+
+    summary = commands.add_parser(
+        "summarize",
+        parents=[filters],
+        help="Summarize every metric sampled over time",
+        description="Print the number of samples, mean, minimum, 95th "
+        "percentile and maximum of every metric of every flow.",
+    )
+    summary.add_argument("--json", action="store_true", help="Print as JSON")
+    summary.set_defaults(run=_summarize)
+
+    comparison = commands.add_parser(
+        "compare",
+        help="Compare the results of several experiments",
+        description="Compare the throughput, RTT, queue delay and drops of "
+        "several experiments, with flows aligned by node, destination and "
+        "order. Tables (CSV and HTML) and plots are written to --output.",
+    )
+    comparison.add_argument(
+        "dumps", nargs="+", help="Experiment dump folders, the first being the baseline"
+    )
+    comparison.add_argument(
+        "--output", required=True, help="Folder to write the comparison to"
+    )
+    comparison.add_argument(
+        "--metric", action="append", choices=list(METRICS), help="Only this metric"
+    )
+    comparison.add_argument(
+        "--jobs",
+        type=int,
+        help="Maximum number of dumps read at once (Default: number of cores)",
+    )
+    comparison.set_defaults(run=_compare)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point of the `nest` command
+
+    Parameters
+    ----------
+    argv : List[str]
+        Command line arguments (Default: `sys.argv[1:]`)
+
+    Returns
+    -------
+    int
+        Exit status
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    for dump in getattr(args, "dumps", [getattr(args, "dump", None)]):
+        if not os.path.exists(dump):
+            parser.error(f"{dump} doesn't exist")
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
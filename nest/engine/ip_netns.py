@@ -41,3 +41,35 @@ def kill_all_processes(ns_name):
     """
 
     exec_subprocess(f"kill $(ip netns pids {ns_name})", shell=True)
+
+
+def get_ns_pids(ns_name):
+    """
+    Ids of the processes in a namespace
+
+    Parameters
+    ----------
+    ns_name : str
+        Namespace name
+
+    Returns
+    -------
+    List[int]
+    """
+    return [
+        int(pid)
+        for pid in exec_subprocess(f"ip netns pids {ns_name}", output=True).split()
+    ]
+
+
+def kill_processes(pids):
+    """
+    Kill processes
+
+    Parameters
+    ----------
+    pids : List[int]
+        Ids of the processes
+    """
+    if pids:
+        exec_subprocess(f"kill {' '.join(map(str, pids))}")
@@ -8,7 +8,16 @@ from .exec import exec_exp_commands
 
 # pylint: disable=too-many-arguments
 def run_ss(
-    ns_id, iterator, destination_ip, duration, ss_filter, start_time, ipv6, out, err
+    ns_id,
+    iterator,
+    destination_ip,
+    duration,
+    ss_filter,
+    start_time,
+    ipv6,
+    interval,
+    out,
+    err,
 ):
     """
     Executes the ss iterator script
@@ -29,6 +38,8 @@ def run_ss(
         filter to remove unnecessary output from ss
     ipv6 : bool
         determines if destination_ip is ipv4/ipv6
+    interval : float
+        time (in seconds) between two runs of ss
     out : File
         temporary file to hold the stats
     err : File
@@ -42,21 +53,21 @@ def run_ss(
     if ipv6:
         return exec_exp_commands(
             f"ip netns exec {ns_id} /bin/bash {iterator} [{destination_ip}] \
-                                    {duration} {ss_filter}  {start_time}",
+                                    {duration} {ss_filter}  {start_time} {interval}",
             stdout=out,
             stderr=err,
         )
 
     return exec_exp_commands(
         f"ip netns exec {ns_id} /bin/bash {iterator} {destination_ip} \
-                                {duration} {ss_filter}  {start_time}",
+                                {duration} {ss_filter}  {start_time} {interval}",
         stdout=out,
         stderr=err,
     )
 
 
 # pylint: disable=too-many-arguments
-def run_tc(ns_id, iterator, dev, duration, out, err):
+def run_tc(ns_id, iterator, dev, duration, interval, out, err):
     """
     Executes the tc iterator script
 
@@ -70,6 +81,8 @@ def run_tc(ns_id, iterator, dev, duration, out, err):
         dev id to collect tc stats from
     duration : num
         total time to run tc for
+    interval : float
+        time (in seconds) between two runs of tc
     out : File
         temporary file to hold the stats
     err : File
@@ -81,7 +94,7 @@ def run_tc(ns_id, iterator, dev, duration, out, err):
         return code of the command executed
     """
     return exec_exp_commands(
-        f"ip netns exec {ns_id} /bin/bash {iterator} {dev} {duration}",
+        f"ip netns exec {ns_id} /bin/bash {iterator} {dev} {duration} {interval}",
         stdout=out,
         stderr=err,
     )
@@ -0,0 +1,217 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Minimal netlink client used to query the kernel directly (without
+running `ss`, `tc` or `ip`) while collecting statistics.
+
+Refer `man 7 netlink` for the message format.
+"""
+
+import itertools
+import os
+import socket
+import struct
+
+NETLINK_ROUTE = 0
+NETLINK_SOCK_DIAG = 4
+
+NLM_F_REQUEST = 0x1
+NLM_F_ROOT = 0x100
+NLM_F_MATCH = 0x200
+NLM_F_DUMP = NLM_F_ROOT | NLM_F_MATCH
+
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+
+NLA_TYPE_MASK = 0x3FFF
+
+# struct nlmsghdr: length, type, flags, sequence number, port id
+_NLMSG_HEADER = struct.Struct("=IHHII")
+
+# struct nlattr: length, type
+_NLA_HEADER = struct.Struct("=HH")
+
+_RECEIVE_BUFFER_SIZE = 1 << 20
+
+
+def align(length):
+    """
+    Round `length` up to the 4 byte alignment used by netlink
+
+    Parameters
+    ----------
+    length : int
+        Length in bytes
+
+    Returns
+    -------
+    int
+    """
+    return (length + 3) & ~3
+
+
+def pack_attr(attr_type, payload):
+    """
+    Pack a netlink attribute (struct nlattr followed by `payload`)
+
+    Parameters
+    ----------
+    attr_type : int
+        Type of the attribute
+    payload : bytes
+        Value of the attribute
+
+    Returns
+    -------
+    bytes
+    """
+    length = _NLA_HEADER.size + len(payload)
+    padding = b"\0" * (align(length) - length)
+    return _NLA_HEADER.pack(length, attr_type) + payload + padding
+
+
+def parse_attrs(data, offset=0, end=None):
+    """
+    Parse a stream of netlink attributes
+
+    Parameters
+    ----------
+    data : bytes/memoryview
+        Buffer holding the attributes
+    offset : int
+        Offset of the first attribute in `data`
+    end : int
+        Offset at which the attributes end (Default value = `len(data)`)
+
+    Returns
+    -------
+    dict
+        Attribute type mapped to the attribute payload (a memoryview).
+        If a type occurs more than once, the last occurrence is kept.
+    """
+    if end is None:
+        end = len(data)
+    data = memoryview(data)
+    attrs = {}
+    while offset + _NLA_HEADER.size <= end:
+        length, attr_type = _NLA_HEADER.unpack_from(data, offset)
+        if length < _NLA_HEADER.size:
+            break
+        attrs[attr_type & NLA_TYPE_MASK] = data[
+            offset + _NLA_HEADER.size : offset + length
+        ]
+        offset += align(length)
+    return attrs
+
+
+def parse_string(payload):
+    """
+    Decode a NUL terminated string attribute
+
+    Parameters
+    ----------
+    payload : bytes/memoryview
+        Value of the attribute
+
+    Returns
+    -------
+    str
+    """
+    return bytes(payload).split(b"\0", 1)[0].decode()
+
+
+class NetlinkSocket:
+    """
+    Netlink socket used for dump requests.
+
+    The socket belongs to the network namespace of the thread that
+    creates it, hence it must be created after entering the required
+    namespace (See `nest.engine.setns.ns_context`).
+
+    Attributes
+    ----------
+    sock : socket.socket
+        Underlying netlink socket
+    """
+
+    def __init__(self, protocol):
+        """
+        Parameters
+        ----------
+        protocol : int
+            Netlink protocol (For eg., `NETLINK_SOCK_DIAG`)
+        """
+        # pylint: disable=no-member
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, protocol)
+        self.sock.bind((0, 0))
+        self._sequence = itertools.count(1)
+        self._buffer = bytearray(_RECEIVE_BUFFER_SIZE)
+
+    def dump(self, msg_type, payload, flags=NLM_F_DUMP):
+        """
+        Send a dump request and yield the replies
+
+        Parameters
+        ----------
+        msg_type : int
+            Type of the request message
+        payload : bytes
+            Request, excluding the netlink header
+        flags : int
+            Flags (other than `NLM_F_REQUEST`) of the request
+
+        Yields
+        ------
+        (int, memoryview)
+            Type and payload (excluding the netlink header) of every reply.
+            The payload is only valid until the next reply is requested.
+
+        Raises
+        ------
+        OSError
+            If the kernel rejects the request
+        """
+        sequence = next(self._sequence)
+        header = _NLMSG_HEADER.pack(
+            _NLMSG_HEADER.size + len(payload),
+            msg_type,
+            NLM_F_REQUEST | flags,
+            sequence,
+            0,
+        )
+        self.sock.send(header + payload)
+
+        while True:
+            size = self.sock.recv_into(self._buffer)
+            data = memoryview(self._buffer)[:size]
+            offset = 0
+            while offset + _NLMSG_HEADER.size <= size:
+                length, reply_type, _, reply_sequence, _ = _NLMSG_HEADER.unpack_from(
+                    data, offset
+                )
+                if length < _NLMSG_HEADER.size:
+                    return
+                body = data[offset + _NLMSG_HEADER.size : offset + length]
+                offset += align(length)
+
+                if reply_sequence != sequence:
+                    continue
+                if reply_type == NLMSG_DONE:
+                    return
+                if reply_type == NLMSG_ERROR:
+                    (error,) = struct.unpack_from("=i", body)
+                    if error:
+                        raise OSError(-error, os.strerror(-error))
+                    return
+                yield reply_type, body
+
+    def close(self):
+        """Close the socket"""
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -8,6 +8,7 @@ Inspired from: https://github.com/larsks/python-netns
 """
 
 import os
+from contextlib import contextmanager
 from ctypes import CDLL, get_errno
 
 CLONE_NEWNET = 0x40000000
@@ -62,3 +63,24 @@ def set_ns(ns_name=None):
     with open(ns_path) as file:
         fd = file.fileno()  # pylint: disable=invalid-name
         libc.setns(fd, CLONE_NEWNET)
+
+
+@contextmanager
+def ns_context(ns_name):
+    """
+    Run the enclosed block in a network namespace and switch the calling
+    thread back to its original namespace afterwards.
+
+    Sockets created within the block stay in `ns_name`.
+
+    Parameters
+    ----------
+    ns_name : str/None
+        namespace name
+    """
+    with open("/proc/thread-self/ns/net") as file:
+        set_ns(ns_name)
+        try:
+            yield
+        finally:
+            libc.setns(file.fileno(), CLONE_NEWNET)
@@ -18,3 +18,13 @@ from .experiment import (
     SipApplication,
     HttpApplication,
 )
+from .experiment_results import ExperimentResults, FlowKey
+from .sweep import (
+    Sweep,
+    SweepParameter,
+    qdisc_parameter,
+    link_parameter,
+    flow_option_parameter,
+    flow_attribute_parameter,
+)
+from .replicas import run_replicas
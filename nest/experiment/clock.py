@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Clock shared by all the runners of an experiment"""
+
+import threading
+import time
+
+
+class ExperimentClock:
+    """
+    Monotonic experiment clock.
+
+    The epoch (t=0 of the experiment) is set once by `run_experiment`,
+    slightly in the future, so that every runner can be spawned and
+    blocked before the epoch. Runners are then released against
+    absolute deadlines (epoch + start time of the runner) instead of
+    sleeping relative to whenever they happened to be spawned.
+
+    Attributes
+    ----------
+    EPOCH : float/None
+        `time.monotonic()` value at t=0 of the experiment
+    WALL_EPOCH : float/None
+        `time.time()` value at t=0 of the experiment
+    """
+
+    # Time (in seconds) between setting the epoch and the epoch itself,
+    # to pre-spawn all the runners
+    START_LEAD_TIME = 0.5
+
+    EPOCH = None
+    WALL_EPOCH = None
+    _aborted = threading.Event()
+
+    @staticmethod
+    def start(lead_time=None):
+        """
+        Set the experiment epoch
+
+        Parameters
+        ----------
+        lead_time : float
+            Time from now (in seconds) to the epoch
+            (Default value = `START_LEAD_TIME`)
+        """
+        if lead_time is None:
+            lead_time = ExperimentClock.START_LEAD_TIME
+        ExperimentClock._aborted.clear()
+        ExperimentClock.EPOCH = time.monotonic() + lead_time
+        ExperimentClock.WALL_EPOCH = time.time() + lead_time
+
+    @staticmethod
+    def is_started():
+        """Whether the epoch of the experiment is set"""
+        return ExperimentClock.EPOCH is not None
+
+    @staticmethod
+    def deadline(offset):
+        """
+        Absolute (monotonic) time corresponding to `offset` seconds
+        into the experiment
+
+        Parameters
+        ----------
+        offset : num
+            Time since epoch (in seconds)
+
+        Returns
+        -------
+        float
+        """
+        return ExperimentClock.EPOCH + (offset or 0)
+
+    @staticmethod
+    def wait_until(offset):
+        """
+        Block until `offset` seconds into the experiment.
+
+        If the epoch isn't set (For eg., a runner used outside
+        `run_experiment`), wait for `offset` seconds from now.
+
+        Parameters
+        ----------
+        offset : num
+            Time since epoch (in seconds)
+
+        Returns
+        -------
+        bool
+            False if the experiment was aborted while waiting
+        """
+        if ExperimentClock.EPOCH is None:
+            deadline = time.monotonic() + (offset or 0)
+        else:
+            deadline = ExperimentClock.deadline(offset)
+
+        timeout = deadline - time.monotonic()
+        if timeout > 0:
+            return not ExperimentClock._aborted.wait(timeout)
+        return not ExperimentClock._aborted.is_set()
+
+    @staticmethod
+    def sleep(duration):
+        """
+        Sleep for `duration` seconds, unless the experiment is aborted
+
+        Parameters
+        ----------
+        duration : num
+            Time to sleep (in seconds)
+
+        Returns
+        -------
+        bool
+            False if the experiment was aborted while sleeping
+        """
+        if duration > 0:
+            return not ExperimentClock._aborted.wait(duration)
+        return not ExperimentClock._aborted.is_set()
+
+    @staticmethod
+    def skew(offset):
+        """
+        Difference between now and `offset` seconds into the experiment
+
+        Parameters
+        ----------
+        offset : num
+            Time since epoch (in seconds)
+
+        Returns
+        -------
+        float/None
+            Skew in seconds, None if the epoch isn't set
+        """
+        if ExperimentClock.EPOCH is None:
+            return None
+        return time.monotonic() - ExperimentClock.deadline(offset)
+
+    @staticmethod
+    def elapsed():
+        """
+        Time since epoch (in seconds). Negative before the epoch.
+
+        Returns
+        -------
+        float/None
+            None if the epoch isn't set
+        """
+        if ExperimentClock.EPOCH is None:
+            return None
+        return time.monotonic() - ExperimentClock.EPOCH
+
+    @staticmethod
+    def abort():
+        """Release all runners waiting on the clock, without running them"""
+        ExperimentClock._aborted.set()
+
+    @staticmethod
+    def reset():
+        """Unset the epoch at the end of the experiment"""
+        ExperimentClock.EPOCH = None
+        ExperimentClock.WALL_EPOCH = None
@@ -0,0 +1,222 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Configuration of the stats collected during an experiment"""
+
+from typing import Optional, Union
+from nest import config
+from nest.input_validator import input_validator
+from nest.topology import Node
+from nest.topology.interface import BaseInterface
+
+
+class CollectorConfig:
+    """
+    Stats to be collected during an experiment, and how often they are
+    sampled. Inherited by `Experiment`.
+
+    Attributes
+    ----------
+    qdisc_stats : List[dict]
+        Qdiscs whose stats are collected
+    node_stats : List[dict]
+        Nodes whose SNMP and netstat counters are collected
+    link_stats : List[BaseInterface]
+        Interfaces whose counters are collected (None for all)
+    sampling_intervals : dict
+        Collector mapped to the time between two samples of its stats
+    adaptive_sampling : float/None
+        Longest time between two samples with adaptive sampling
+    """
+
+    # Collectors whose sampling interval can be set
+    SAMPLING_COLLECTORS = (
+        "socket_stats",
+        "qdisc_stats",
+        "snmp_stats",
+        "link_stats",
+        "netperf",
+    )
+
+    def __init__(self):
+        self.qdisc_stats = []
+        self.node_stats = []
+        self.link_stats = []
+        self.sampling_intervals = {}
+        self.adaptive_sampling = None
+
+    @input_validator
+    def require_qdisc_stats(self, interface: BaseInterface, stats=""):
+        """
+        Stats to be obtained from qdisc in interface
+
+        Parameters
+        ----------
+        interface : BaseInterface
+            Interface containing the qdisc
+        stats : list(str)
+            Stats required, named as in the output of `tc -s -j qdisc show`.
+            All stats are collected if empty. (Default value = '')
+        """
+        # TODO: Leads to rewrite if the function is called
+        # twice with same 'interface'
+
+        # for stat in stats:
+        #     if stat not in Experiment.qdisc_stats:
+        #         raise ValueError('{} is not a valid Queue property.'.format(stat))
+
+        if interface.get_qdisc() is None:
+            raise ValueError("Given interface hasn't been assigned any qdisc.")
+
+        self.qdisc_stats.append(
+            {
+                "ns_id": interface.node_id,
+                "int_id": interface.ifb_id,
+                "qdisc": interface.get_qdisc().qdisc,
+                "stats": [stats] if isinstance(stats, str) and stats else stats,
+            }
+        )
+
+    @input_validator
+    def require_node_stats(self, node: Optional[Node] = None, stats=""):
+        """
+        Sample the SNMP and netstat counters of a node (`/proc/net/snmp`,
+        `/proc/net/netstat` and `/proc/net/snmp6`) during the experiment,
+        For eg., retransmissions, reordering, listen overflows and UDP drops
+
+        Parameters
+        ----------
+        node : Node
+            Node to sample counters from. If None, counters are sampled
+            from every node which sends or receives a flow. (Default value = None)
+        stats : list(str)
+            Counters required, prefixed with the protocol [eg. 'TcpRetransSegs',
+            'TcpExtListenOverflows', 'Udp6InErrors']. All the counters which
+            change during the experiment are stored if empty. (Default value = '')
+        """
+        self.node_stats.append(
+            {
+                "ns_id": None if node is None else node.id,
+                "stats": [stats] if isinstance(stats, str) and stats else list(stats),
+            }
+        )
+
+    @input_validator
+    def require_link_stats(
+        self, interfaces: Optional[Union[BaseInterface, list]] = None
+    ):
+        """
+        Sample the counters (bytes, packets, drops and errors) of interfaces
+        during the experiment, along with their throughput and utilization
+        of the bandwidth set on them. All the interfaces are sampled from
+        a single thread.
+
+        Parameters
+        ----------
+        interfaces : Union[BaseInterface,list]
+            Interface(s) to be sampled. If None, every interface of every
+            node in the topology is sampled. (Default value = None)
+        """
+        if interfaces is None:
+            self.link_stats.append(None)
+            return
+
+        if isinstance(interfaces, BaseInterface):
+            interfaces = [interfaces]
+        for interface in interfaces:
+            if not isinstance(interface, BaseInterface):
+                raise ValueError(
+                    "require_link_stats takes either a BaseInterface "
+                    "object or a list of the same only."
+                )
+            self.link_stats.append(interface)
+
+    @input_validator
+    def set_sampling_interval(
+        self, interval: Union[int, float], collector: Optional[str] = None
+    ):
+        """
+        Set the time between two samples of stats, for this experiment.
+        Overrides the `<collector>_interval` config.
+
+        Parameters
+        ----------
+        interval : float
+            Time (in seconds) between two samples
+        collector : str
+            One of "socket_stats", "qdisc_stats", "snmp_stats", "link_stats"
+            or "netperf".
+            If None, the interval is set for all the collectors.
+            (Default value = None)
+        """
+        if interval <= 0:
+            raise ValueError("Sampling interval should be a positive number.")
+
+        if collector is None:
+            collectors = CollectorConfig.SAMPLING_COLLECTORS
+        elif collector in CollectorConfig.SAMPLING_COLLECTORS:
+            collectors = [collector]
+        else:
+            raise ValueError(
+                f"{collector} is not a valid collector. Valid collectors "
+                f"are {CollectorConfig.SAMPLING_COLLECTORS}"
+            )
+
+        for name in collectors:
+            self.sampling_intervals[name] = interval
+
+    @input_validator
+    def enable_adaptive_sampling(
+        self, max_interval: Optional[Union[int, float]] = None
+    ):
+        """
+        Sample stats at the configured interval around flow start and stop
+        times, and whenever the stats change, but back off up to
+        `max_interval` while they are steady. Applies to socket stats
+        collected with "sock_diag", qdisc stats collected with "netlink",
+        SNMP counters and link stats.
+
+        Parameters
+        ----------
+        max_interval : float
+            Longest time (in seconds) between two samples
+            (Default value = `adaptive_sampling_max_interval` config)
+        """
+        if max_interval is None:
+            max_interval = config.get_value("adaptive_sampling_max_interval")
+        if max_interval <= 0:
+            raise ValueError("Maximum sampling interval should be a positive number.")
+        self.adaptive_sampling = max_interval
+
+    def get_sampling_interval(self, collector):
+        """
+        Time between two samples of the stats of `collector`
+
+        Parameters
+        ----------
+        collector : str
+            One of "socket_stats", "qdisc_stats", "snmp_stats", "link_stats"
+            or "netperf"
+
+        Returns
+        -------
+        float
+        """
+        if collector in self.sampling_intervals:
+            return self.sampling_intervals[collector]
+        return config.get_value(f"{collector}_interval")
+
+    def get_max_sampling_interval(self):
+        """
+        Longest time between two samples with adaptive sampling
+
+        Returns
+        -------
+        float/None
+            None if adaptive sampling is disabled
+        """
+        if self.adaptive_sampling is not None:
+            return self.adaptive_sampling
+        if config.get_value("adaptive_sampling"):
+            return config.get_value("adaptive_sampling_max_interval")
+        return None
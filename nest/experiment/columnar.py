@@ -0,0 +1,337 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Binary columnar output of the results, as an alternative to JSON.
+
+Every flow (every list of timestamped records) of a tool is stored as a
+separate table, with a column per parameter. The rest of the results of
+the tool, along with references to the tables, are stored in a small
+JSON manifest. Tables are stored either as a folder of NumPy `.npy`
+files (one per column) or, if pyarrow is installed, as a Parquet file.
+Both are memory-mapped when loaded with `load_results`.
+"""
+
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+import numpy as np
+from ..engine.util import is_package_installed
+from .pack import Pack
+from .series import FlowSeries, is_record_list, json_default
+
+logger = logging.getLogger(__name__)
+
+# Folder (inside the experiment dump) holding the columnar results
+RESULTS_FOLDER = "results"
+
+# Key identifying a reference to a table in the manifest
+TABLE_KEY = "__table__"
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+@lru_cache(maxsize=None)
+def _is_parquet_supported():
+    """Check (once) if pyarrow is installed, else warn"""
+    if is_package_installed("pyarrow"):
+        return True
+    logger.warning(
+        "pyarrow is not installed, hence results are stored as .npy "
+        "files instead of Parquet."
+    )
+    return False
+
+
+def _table_name(path):
+    """Name of the table at `path` (keys from the tool's results)"""
+    return "_".join(re.sub(r"[^\w.:-]", "_", str(key)) for key in path)
+
+
+def _extract_tables(value, path, tables):
+    """
+    Replace the flows in `value` with references to tables
+
+    Parameters
+    ----------
+    value : object
+        Results (or a part of them)
+    path : List[str]
+        Keys (and list indices) leading to `value`
+    tables : dict
+        Table names mapped to their series, filled in by this function
+
+    Returns
+    -------
+    object
+        `value`, with every flow replaced by a reference to its table
+    """
+    series = None
+    if isinstance(value, FlowSeries):
+        series = value
+    elif is_record_list(value):
+        try:
+            series = FlowSeries.from_records(value)
+        except (TypeError, ValueError):
+            # Timestamps that aren't numbers
+            series = None
+
+    if series is not None:
+        name = _table_name(path)
+        tables[name] = series
+        return {TABLE_KEY: name, "meta": series.meta}
+    if isinstance(value, dict):
+        return {
+            key: _extract_tables(item, path + [key], tables)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [
+            _extract_tables(item, path + [index], tables)
+            for index, item in enumerate(value)
+        ]
+    return value
+
+
+def _write_npy_table(directory, series):
+    """
+    Store `series` as a folder of .npy files. Columns which aren't
+    numeric are stored as JSON files.
+
+    Parameters
+    ----------
+    directory : str
+        Folder of the table
+    series : FlowSeries
+    """
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, "timestamp.npy"), series.timestamp)
+    for name, column in series.columns.items():
+        if column.dtype == object:
+            with open(
+                os.path.join(directory, f"{name}.json"), "w", encoding="utf-8"
+            ) as file:
+                json.dump(column.tolist(), file, default=json_default)
+        else:
+            np.save(os.path.join(directory, f"{name}.npy"), column)
+
+
+def _write_parquet_table(path, series):
+    """
+    Store `series` as a Parquet file
+
+    Parameters
+    ----------
+    path : str
+        Path of the table
+    series : FlowSeries
+    """
+    # pylint: disable=import-outside-toplevel,import-error
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = {"timestamp": series.timestamp}
+    columns.update(series.columns)
+    pq.write_table(
+        pa.table({name: pa.array(column) for name, column in columns.items()}),
+        path,
+    )
+
+
+def dump_columnar(toolname, results, results_format="npy"):
+    """
+    Store the results of a tool in the experiment dump, as tables and
+    a manifest (`results/<toolname>.manifest.json`)
+
+    Parameters
+    ----------
+    toolname : str
+        Like ss, tc, netperf
+    results : dict
+        Results of the tool, keyed by node name
+    results_format : str
+        "npy" or "parquet"
+    """
+    if results_format == "parquet" and not _is_parquet_supported():
+        results_format = "npy"
+
+    tables = {}
+    manifest = {
+        "format": results_format,
+        "results": _extract_tables(results, [], tables),
+    }
+
+    Pack.create_subfolder(RESULTS_FOLDER)
+    tool_folder = os.path.join(RESULTS_FOLDER, toolname)
+    if tables:
+        Pack.create_subfolder(tool_folder)
+    for name, series in tables.items():
+        if results_format == "parquet":
+            path = Pack.get_path(tool_folder, f"{name}.parquet")
+            _write_parquet_table(path, series)
+        else:
+            path = Pack.get_path(tool_folder, name)
+            _write_npy_table(path, series)
+        Pack.set_owner(path)
+
+    Pack.dump_file(
+        os.path.join(RESULTS_FOLDER, f"{toolname}{MANIFEST_SUFFIX}"),
+        json.dumps(manifest, indent=4, default=json_default),
+    )
+
+
+def _load_npy_table(directory):
+    """
+    Load a table stored as .npy files, memory-mapped
+
+    Parameters
+    ----------
+    directory : str
+        Folder of the table
+
+    Returns
+    -------
+    (numpy.ndarray, dict)
+        Timestamps, and column names mapped to their values
+    """
+    timestamp = None
+    columns = {}
+    for filename in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(filename)
+        path = os.path.join(directory, filename)
+        if extension == ".npy":
+            column = np.load(path, mmap_mode="r")
+        elif extension == ".json":
+            with open(path, encoding="utf-8") as file:
+                column = np.array(json.load(file), dtype=object)
+        else:
+            continue
+        if name == "timestamp":
+            timestamp = column
+        else:
+            columns[name] = column
+    return timestamp, columns
+
+
+def _load_parquet_table(path):
+    """
+    Load a table stored as a Parquet file, memory-mapped
+
+    Parameters
+    ----------
+    path : str
+        Path of the table
+
+    Returns
+    -------
+    (numpy.ndarray, dict)
+        Timestamps, and column names mapped to their values
+    """
+    # pylint: disable=import-outside-toplevel,import-error
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, memory_map=True)
+    columns = {
+        name: table.column(name).to_numpy(zero_copy_only=False)
+        for name in table.column_names
+    }
+    return columns.pop("timestamp"), columns
+
+
+def load_table(tool_folder, reference, results_format):
+    """
+    Load a table referenced in the manifest of a tool, memory-mapped
+
+    Parameters
+    ----------
+    tool_folder : str
+        Folder holding the tables of the tool
+    reference : dict
+        Reference to the table, in the manifest
+    results_format : str
+        "npy" or "parquet"
+
+    Returns
+    -------
+    FlowSeries
+    """
+    if results_format == "parquet":
+        path = os.path.join(tool_folder, f"{reference[TABLE_KEY]}.parquet")
+        timestamp, columns = _load_parquet_table(path)
+    else:
+        path = os.path.join(tool_folder, reference[TABLE_KEY])
+        timestamp, columns = _load_npy_table(path)
+    return FlowSeries(reference["meta"], timestamp, columns)
+
+
+def _resolve_tables(value, tool_folder, results_format):
+    """Replace references to tables in `value` with the loaded tables"""
+    if isinstance(value, dict):
+        if TABLE_KEY in value:
+            return load_table(tool_folder, value, results_format)
+        return {
+            key: _resolve_tables(item, tool_folder, results_format)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_resolve_tables(item, tool_folder, results_format) for item in value]
+    return value
+
+
+def find_manifests(dump_folder):
+    """
+    Manifests of the tools whose results are stored in the columnar
+    format
+
+    Parameters
+    ----------
+    dump_folder : str
+        Experiment dump (For eg., 'tcp(01-01-2026-10:00:00)_dump')
+
+    Returns
+    -------
+    Dict[str, str]
+        Tool names mapped to the paths of their manifests
+    """
+    folder = os.path.join(dump_folder, RESULTS_FOLDER)
+    if not os.path.isdir(folder):
+        return {}
+    return {
+        filename[: -len(MANIFEST_SUFFIX)]: os.path.join(folder, filename)
+        for filename in sorted(os.listdir(folder))
+        if filename.endswith(MANIFEST_SUFFIX)
+    }
+
+
+def load_results(dump_folder, tools=None):
+    """
+    Load results stored in the columnar format. The columns are
+    memory-mapped, hence only the parts of them accessed are read.
+
+    Parameters
+    ----------
+    dump_folder : str
+        Experiment dump (For eg., 'tcp(01-01-2026-10:00:00)_dump')
+    tools : List[str]
+        Tools whose results are loaded (Default: all)
+
+    Returns
+    -------
+    dict
+        Tool names mapped to their results, in the same format as
+        returned by `Experiment.run`
+    """
+    results = {}
+    for toolname, path in find_manifests(dump_folder).items():
+        if tools is not None and toolname not in tools:
+            continue
+        with open(path, encoding="utf-8") as file:
+            manifest = json.load(file)
+        results[toolname] = _resolve_tables(
+            manifest["results"],
+            os.path.join(os.path.dirname(path), toolname),
+            manifest["format"],
+        )
+    return results
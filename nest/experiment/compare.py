@@ -0,0 +1,423 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Compare the results of several experiments (For eg., the same topology
+with different qdiscs or congestion controls).
+
+Dumps are summarized in parallel, each by a worker process which reads
+one flow at a time, so that only the summary of every dump is held in
+memory. Flows are aligned across experiments by their role, i.e., the
+node, the destination and the position of the flow among the flows
+between them (ports may differ between experiments). The summaries are
+then compared side by side, relative to the first experiment.
+"""
+
+import logging
+import os
+from functools import partial
+import numpy as np
+import pandas as pd
+from .experiment_results import ExperimentResults
+from .pack import Pack
+from .plotter.common import bar_plot, html_table
+from .plotter.render import render_plot, render_plots
+from .supervisor import run_in_pool
+
+logger = logging.getLogger(__name__)
+
+# Metrics compared, mapped to their label and the parameters they are
+# read from (the first one present in a flow is used)
+METRICS = {
+    "throughput": (
+        "Throughput (Mbps)",
+        {
+            "ss": ("delivery_rate",),
+            "netperf": ("sending_rate",),
+            "iperf3": ("sending_rate",),
+        },
+    ),
+    "rtt": ("RTT (ms)", {"ss": ("rtt",), "ping": ("rtt",)}),
+    "queue_delay": ("Queue delay", {"tc": ("ldelay", "delay")}),
+    "drops": ("Drops", {"tc": ("drops",)}),
+}
+
+# Metrics which are counters, hence summarized by their increase
+COUNTERS = ("drops",)
+
+# Statistics of every flow, and of all the flows of an experiment
+STATS = ["samples", "mean", "median", "p99", "total"]
+
+
+def _flow_roles(keys):
+    """
+    Role of every flow: "<node>-><destination>#<n>", the n-th flow
+    (ordered by port) from the node to the destination
+
+    Parameters
+    ----------
+    keys : List[FlowKey]
+
+    Returns
+    -------
+    Dict[FlowKey, str]
+    """
+
+    def port_order(key):
+        port = key.port or ""
+        return (0, int(port), "") if port.isdigit() else (1, 0, port)
+
+    roles = {}
+    counts = {}
+    for key in sorted(keys, key=port_order):
+        path = (key.tool, key.node, key.destination)
+        roles[key] = f"{key.node}->{key.destination}#{counts.get(path, 0)}"
+        counts[path] = counts.get(path, 0) + 1
+    return roles
+
+
+def _metric_values(series, params):
+    """
+    Values of the first of `params` present in `series`, as floats
+
+    Returns
+    -------
+    numpy.ndarray or None
+        None if none of `params` is present, or has numeric values
+    """
+    for param in params:
+        if param not in series.columns:
+            continue
+        try:
+            values = series.columns[param].astype(np.float64)
+        except (TypeError, ValueError):
+            # Values with units (For eg., "2ms" from older tc)
+            return None
+        return values[~np.isnan(values)]
+    return None
+
+
+def _stats(values, metric):
+    """Statistics of the values of a metric"""
+    if len(values) == 0:
+        return None
+    median, p99 = np.percentile(values, [50, 99])
+    total = values[-1] - values[0] if metric in COUNTERS else values.sum()
+    return {
+        "samples": len(values),
+        "mean": values.mean(),
+        "median": median,
+        "p99": p99,
+        "total": total,
+    }
+
+
+def _aggregate_stats(metric, values, flow_stats):
+    """
+    Statistics of a metric over all the flows
+
+    Parameters
+    ----------
+    metric : str
+    values : List[numpy.ndarray]
+        Values of the metric in every flow
+    flow_stats : List[dict]
+        Statistics of the metric of every flow
+
+    Returns
+    -------
+    dict
+    """
+    stats = _stats(np.concatenate(values), "")
+    # Over all the flows, a counter is summarized by the sum of the
+    # increases of every flow
+    per_flow = np.array(
+        [item["total"] if metric in COUNTERS else item["mean"] for item in flow_stats]
+    )
+    stats["total"] = per_flow.sum()
+    squares = (per_flow**2).sum()
+    stats["fairness"] = (
+        per_flow.sum() ** 2 / (len(per_flow) * squares)
+        if metric == "throughput" and squares
+        else np.nan
+    )
+    return stats
+
+
+def summarize_dump(dump_folder, experiment=None, metrics=None):
+    """
+    Summarize the flows of an experiment dump, reading one flow at a
+    time
+
+    Parameters
+    ----------
+    dump_folder : str
+        Experiment dump (For eg., 'tcp(01-01-2026-10:00:00)_dump')
+    experiment : str
+        Name of the experiment in the summary (Default: `dump_folder`)
+    metrics : List[str]
+        Metrics to be summarized (Default: all of `METRICS`)
+
+    Returns
+    -------
+    (pandas.DataFrame, pandas.DataFrame)
+        Statistics of every metric of every flow, and of every metric
+        over all the flows. "total" is the sum of the values (of a
+        flow), or the increase of a counter. Over all the flows, it is
+        the sum of the means (or increases) of the flows, and
+        "fairness" is Jain's fairness index of their throughputs.
+    """
+    experiment = experiment or dump_folder
+    results = ExperimentResults.load(dump_folder)
+    keys = [key for tool in _tools(metrics) for key in results.flows(tool=tool)]
+
+    flow_rows = []
+    # Metric mapped to the values of all flows, and the stats per flow
+    samples = {}
+    for key, role in _flow_roles(keys).items():
+        series = results.series(key, cache=False)
+        for metric, (_, params) in _metrics(metrics).items():
+            if key.tool not in params:
+                continue
+            values = _metric_values(series, params[key.tool])
+            stats = None if values is None else _stats(values, metric)
+            if stats is None:
+                continue
+            flow_rows.append(
+                {
+                    "experiment": experiment,
+                    "tool": key.tool,
+                    "role": role,
+                    "metric": metric,
+                    **stats,
+                }
+            )
+            samples.setdefault(metric, ([], []))
+            samples[metric][0].append(values)
+            samples[metric][1].append(stats)
+
+    aggregate_rows = [
+        {
+            "experiment": experiment,
+            "metric": metric,
+            "flows": len(flow_stats),
+            **_aggregate_stats(metric, values, flow_stats),
+        }
+        for metric, (values, flow_stats) in samples.items()
+    ]
+
+    return (
+        pd.DataFrame(
+            flow_rows, columns=["experiment", "tool", "role", "metric"] + STATS
+        ),
+        pd.DataFrame(
+            aggregate_rows,
+            columns=["experiment", "metric", "flows"] + STATS + ["fairness"],
+        ),
+    )
+
+
+def _metrics(metrics):
+    """Entries of `METRICS` to be compared"""
+    return {
+        metric: value
+        for metric, value in METRICS.items()
+        if not metrics or metric in metrics
+    }
+
+
+def _tools(metrics):
+    """Tools whose results are needed for `metrics`"""
+    return list(
+        dict.fromkeys(
+            tool for _, params in _metrics(metrics).values() for tool in params
+        )
+    )
+
+
+def _experiment_names(dump_folders):
+    """Unique names of the experiments, from the names of the dumps"""
+    names = []
+    for folder in dump_folders:
+        name = os.path.basename(os.path.normpath(folder))
+        if name.endswith("_dump"):
+            name = name[: -len("_dump")]
+        unique, count = name, 1
+        while unique in names:
+            count += 1
+            unique = f"{name} ({count})"
+        names.append(unique)
+    return names
+
+
+def _dump_size(folder):
+    """Size of the results in a dump, to summarize the largest first"""
+    size = 0
+    for root, _, filenames in os.walk(folder):
+        for filename in filenames:
+            size += os.path.getsize(os.path.join(root, filename))
+    return size
+
+
+def compare_summaries(flows, aggregate):
+    """
+    Compare the summaries of the experiments side by side
+
+    Parameters
+    ----------
+    flows : pandas.DataFrame
+        Statistics of every flow, as returned by `summarize_dump`, of
+        all the experiments
+    aggregate : pandas.DataFrame
+        Statistics over all the flows, of all the experiments
+
+    Returns
+    -------
+    (pandas.DataFrame, pandas.DataFrame)
+        Mean of every metric of every flow (the increase, for
+        counters), with a row per flow role and a column per
+        experiment. Statistics over all the flows, along with their
+        change (in %) from the first experiment.
+    """
+    experiments = list(dict.fromkeys(aggregate["experiment"]))
+    # Counters are compared by their increase
+    flows = flows.assign(
+        value=flows["total"].where(flows["metric"].isin(COUNTERS), flows["mean"])
+    )
+    flow_means = flows.pivot_table(
+        index=["metric", "tool", "role"],
+        columns="experiment",
+        values="value",
+        sort=True,
+    ).reindex(columns=experiments)
+
+    aggregate = aggregate.set_index(["metric", "experiment"]).sort_index(
+        level="metric", sort_remaining=False
+    )
+    # Change of every statistic from the first experiment, computed for
+    # all the experiments at once
+    baseline = aggregate.xs(experiments[0], level="experiment")
+    stats = ["mean", "median", "p99", "total"]
+    change = (
+        (aggregate[stats] - baseline[stats].reindex(aggregate.index, level="metric"))
+        / baseline[stats].reindex(aggregate.index, level="metric")
+        * 100
+    ).replace([np.inf, -np.inf], np.nan)
+    aggregate = aggregate.join(change.add_suffix("_change_%"))
+    return flow_means, aggregate.reset_index()
+
+
+def _format(value):
+    """Format a value of the comparison tables"""
+    if isinstance(value, float):
+        return "-" if np.isnan(value) else f"{value:.3f}"
+    return value
+
+
+def _comparison_html(flow_means, aggregate):
+    """Tables of the comparison, a pair per metric"""
+    tables = []
+    for metric, rows in aggregate.groupby("metric", sort=False):
+        label = METRICS[metric][0]
+        col_labels = [column for column in rows.columns if column != "metric"][1:]
+        tables.append(
+            html_table(
+                list(rows["experiment"]),
+                col_labels,
+                [
+                    [_format(value) for value in row]
+                    for row in rows[col_labels].itertuples(index=False)
+                ],
+                f"{label} over all flows",
+            )
+        )
+        if metric in flow_means.index.get_level_values("metric"):
+            values = flow_means.xs(metric, level="metric")
+            tables.append(
+                html_table(
+                    [f"{tool} {role}" for tool, role in values.index],
+                    list(values.columns),
+                    [[_format(value) for value in row] for row in values.to_numpy()],
+                    f"{'Total' if metric in COUNTERS else 'Mean'} {label} "
+                    "of every flow",
+                )
+            )
+    return "\n".join(tables)
+
+
+def _plot_comparison(aggregate):
+    """Plot the mean and 99th percentile of every metric across experiments"""
+    for metric, rows in aggregate.groupby("metric", sort=False):
+        label = METRICS[metric][0]
+        stats = ("total",) if metric in COUNTERS else ("mean", "p99")
+        for stat in stats:
+            render_plot(
+                "plots",
+                f"{metric}_{stat}.png",
+                bar_plot,
+                f"{label}: {stat} over all flows",
+                list(rows["experiment"]),
+                list(rows[stat]),
+                ["Experiment", label],
+            )
+
+
+def compare(dump_folders, output, metrics=None, processes=None):
+    """
+    Compare the results of several experiment dumps. Writes to `output`:
+    flows.csv and aggregate.csv (the summaries of all the dumps),
+    flow_means.csv and comparison.csv (the summaries side by side),
+    comparison.html and plots of the metrics across experiments.
+
+    Parameters
+    ----------
+    dump_folders : List[str]
+        Experiment dumps. The first is the baseline, the others are
+        compared to.
+    output : str
+        Folder to write the comparison to
+    metrics : List[str]
+        Metrics to be compared (Default: all of `METRICS`)
+    processes : int
+        Maximum number of dumps summarized at once, which bounds the
+        memory used (Default: number of cores)
+
+    Returns
+    -------
+    (pandas.DataFrame, pandas.DataFrame)
+        See `compare_summaries`
+    """
+    names = _experiment_names(dump_folders)
+    summaries = run_in_pool(
+        [
+            partial(summarize_dump, folder, name, metrics)
+            for folder, name in zip(dump_folders, names)
+        ],
+        [_dump_size(folder) for folder in dump_folders],
+        "Loading dumps",
+        processes=processes,
+        collect=True,
+    )
+    for folder, summary in zip(dump_folders, summaries):
+        if summary is None:
+            logger.warning("Results of %s couldn't be read, skipping it", folder)
+    summaries = [summary for summary in summaries if summary is not None]
+    if not summaries:
+        return None
+
+    flows = pd.concat([summary[0] for summary in summaries], ignore_index=True)
+    aggregate = pd.concat([summary[1] for summary in summaries], ignore_index=True)
+    if aggregate.empty:
+        logger.warning("No flows to compare")
+        return None
+    flow_means, comparison = compare_summaries(flows, aggregate)
+
+    os.makedirs(output, exist_ok=True)
+    Pack.FOLDER = output
+    Pack.dump_file("flows.csv", flows.to_csv(index=False))
+    Pack.dump_file("aggregate.csv", aggregate.to_csv(index=False))
+    Pack.dump_file("flow_means.csv", flow_means.to_csv())
+    Pack.dump_file("comparison.csv", comparison.to_csv(index=False))
+    Pack.dump_file("comparison.html", _comparison_html(flow_means, comparison))
+    render_plots([partial(_plot_comparison, comparison)])
+    return flow_means, comparison
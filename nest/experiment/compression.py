@@ -0,0 +1,213 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Compress experiment dumps, and the results written into them, using
+multiple threads: with zstd if the zstandard package is installed,
+else with gzip, compressing chunks in parallel
+"""
+
+import gzip
+import io
+import os
+import tarfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from ..engine.util import is_package_installed
+
+# Size of the chunks compressed in parallel by `ParallelGzipWriter`
+GZIP_CHUNK_SIZE = 4 * 1024 * 1024
+
+COMPRESSED_SUFFIXES = (".zst", ".gz")
+
+
+@lru_cache(maxsize=None)
+def is_zstd_supported():
+    """
+    Check (once) if the zstandard package is installed
+
+    Returns
+    -------
+    bool
+    """
+    return is_package_installed("zstandard")
+
+
+def get_suffix():
+    """
+    Suffix of the files compressed by NeST
+
+    Returns
+    -------
+    str
+        ".zst" if zstandard is installed, else ".gz"
+    """
+    return ".zst" if is_zstd_supported() else ".gz"
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """
+    Writes a gzip file by compressing chunks of the data in parallel,
+    each as a separate gzip member. Readers of gzip files (including
+    Python's gzip module and the gzip utility) read the concatenated
+    members as a single stream. zlib releases the GIL while
+    compressing, so the chunks are compressed in threads.
+
+    Attributes
+    ----------
+    file : File
+        Binary file to which the compressed data is written
+    """
+
+    def __init__(self, file, compresslevel=6, threads=None):
+        """
+        Parameters
+        ----------
+        file : File
+            Binary file to which the compressed data is written
+        compresslevel : int
+            gzip compression level
+        threads : int
+            Number of chunks compressed in parallel
+            (Default: number of CPUs)
+        """
+        super().__init__()
+        self.file = file
+        self._compresslevel = compresslevel
+        threads = threads or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        # Chunks being compressed, in the order they are to be written.
+        # At most two per thread, to bound the memory used.
+        self._pending = deque()
+        self._max_pending = 2 * threads
+        self._buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        while len(self._buffer) >= GZIP_CHUNK_SIZE:
+            self._submit(bytes(self._buffer[:GZIP_CHUNK_SIZE]))
+            del self._buffer[:GZIP_CHUNK_SIZE]
+        return len(data)
+
+    def _submit(self, chunk):
+        """Compress `chunk` in a thread, writing out completed chunks"""
+        if len(self._pending) >= self._max_pending:
+            self.file.write(self._pending.popleft().result())
+        self._pending.append(
+            self._executor.submit(
+                gzip.compress, chunk, compresslevel=self._compresslevel, mtime=0
+            )
+        )
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self.file.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            self.file.close()
+            super().close()
+
+
+def open_compressed(path, mode="rb"):
+    """
+    Open `path`, compressing or decompressing it based on its suffix
+    (".zst", ".gz" or none)
+
+    Parameters
+    ----------
+    path : str
+        Path of the file
+    mode : str
+        "rb", "wb", "r" or "w"
+
+    Returns
+    -------
+    File
+    """
+    binary_mode = mode.replace("b", "")[0] + "b"
+    if path.endswith(".zst"):
+        # pylint: disable=import-outside-toplevel,import-error
+        import zstandard
+
+        if binary_mode == "wb":
+            file = zstandard.open(path, "wb", cctx=zstandard.ZstdCompressor(threads=-1))
+        else:
+            file = zstandard.open(path, "rb")
+    elif path.endswith(".gz"):
+        if binary_mode == "wb":
+            # The file is closed by the writer, or here if the writer
+            # can't be created
+            with ExitStack() as stack:
+                raw = stack.enter_context(open(path, "wb"))
+                file = io.BufferedWriter(ParallelGzipWriter(raw))
+                stack.pop_all()
+        else:
+            file = gzip.open(path, "rb")
+    else:
+        file = open(path, binary_mode)  # pylint: disable=consider-using-with
+
+    if "b" not in mode:
+        file = io.TextIOWrapper(file, encoding="utf-8")
+    return file
+
+
+def compress_folder(folder, path=None):
+    """
+    Archive `folder` as a compressed tar file. Files are streamed into
+    the archive, so large files are never read into memory at once.
+
+    Parameters
+    ----------
+    folder : str
+        Folder to be archived
+    path : str
+        Path of the archive
+        (Default: `folder` followed by ".tar.zst" or ".tar.gz")
+
+    Returns
+    -------
+    str
+        Path of the archive
+    """
+    folder = os.path.normpath(folder)
+    if path is None:
+        path = f"{folder}.tar{get_suffix()}"
+
+    with open_compressed(path, "wb") as file:
+        with tarfile.open(fileobj=file, mode="w|") as archive:
+            archive.add(folder, arcname=os.path.basename(folder))
+    return path
+
+
+def open_archive_member(name, file):
+    """
+    Decompress `file`, a compressed file inside an archive
+
+    Parameters
+    ----------
+    name : str
+        Name of the file (ending with ".zst" or ".gz")
+    file : File
+        Binary file
+
+    Returns
+    -------
+    File
+    """
+    if name.endswith(".zst"):
+        # pylint: disable=import-outside-toplevel,import-error
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(file)
+    return gzip.GzipFile(fileobj=file, mode="rb")
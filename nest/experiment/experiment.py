@@ -17,6 +17,7 @@ from nest.topology import Node, Address
 from nest.topology.interface import BaseInterface
 from nest.topology_map import TopologyMap
 from .run_exp import run_experiment
+from .collectors import CollectorConfig
 from .pack import Pack
 from .tools import Iperf3Options
 from .helpers.tcp_validations import TCPValidations
@@ -135,6 +136,33 @@ class Flow:
         """Getter for protocol"""
         return self._options["protocol"]
 
+    def get_option(self, option, default=None):
+        """
+        Get an option of the flow, as set by `Experiment`
+
+        Parameters
+        ----------
+        option : str
+            For eg., "cong_algo", "port_nos"
+        default : optional
+            Returned if the option isn't set (Default value = None)
+        """
+        return self._options.get(option, default)
+
+    def set_option(self, option, value):
+        """
+        Set an option of the flow, For eg., to change the congestion
+        control algorithm between runs of a sweep
+
+        Parameters
+        ----------
+        option : str
+            For eg., "cong_algo", "port_nos"
+        value
+            Value of the option
+        """
+        self._options[option] = value
+
     @staticmethod
     @input_validator
     # pylint: disable=too-many-arguments
@@ -623,7 +651,7 @@ class HttpApplication(Application):
         )
 
 
-class Experiment:
+class Experiment(CollectorConfig):
     """Handles experiment to be run on topology"""
 
     # Stores configuration of old and new congestion algorithms for cleanup
@@ -641,7 +669,13 @@ class Experiment:
             Name of experiment
         save_path : str, optional
             Path to experiment dump
+        return_results : bool, optional
+            Return the results from `run`, as `ExperimentResults`, which
+            also index the flows by (tool, node, destination, port). The
+            stats of ss, ping and netperf flows are returned as
+            `FlowSeries`, which hold a NumPy array per parameter
         """
+        super().__init__()
         self.name = name
         self.save_path = save_path
         self.return_results = return_results
@@ -650,8 +684,6 @@ class Experiment:
         self.mpeg_dash_applications = []
         self.sip_applications = []
         self.http_applications = []
-        self.node_stats = []
-        self.qdisc_stats = []
         self.tcp_module_params = defaultdict(dict)
 
     def add_flow(self, flow):
@@ -909,37 +941,6 @@ class Experiment:
             raise ApplicationError("""The add_http_application function takes either
                 a HttpApplication object or a list of the same only.""")
 
-    @input_validator
-    def require_qdisc_stats(self, interface: BaseInterface, stats=""):
-        """
-        Stats to be obtained from qdisc in interface
-
-        Parameters
-        ----------
-        interface : BaseInterface
-            Interface containing the qdisc
-        stats : list(str)
-            Stats required (Default value = '') [NOT SUPPORTED]
-        """
-        # TODO: Leads to rewrite if the function is called
-        # twice with same 'interface'
-
-        # for stat in stats:
-        #     if stat not in Experiment.qdisc_stats:
-        #         raise ValueError('{} is not a valid Queue property.'.format(stat))
-
-        if interface.get_qdisc() is None:
-            raise ValueError("Given interface hasn't been assigned any qdisc.")
-
-        self.qdisc_stats.append(
-            {
-                "ns_id": interface.node_id,
-                "int_id": interface.ifb_id,
-                "qdisc": interface.get_qdisc().qdisc,
-                "stats": stats,
-            }
-        )
-
     def configure_tcp_module_params(self, congestion_algorithm, **kwargs):
         """
         Set TCP module parameters
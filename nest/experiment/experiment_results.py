@@ -0,0 +1,458 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Query the results of an experiment, flow by flow.
+
+`ExperimentResults` is returned by `Experiment.run` (with
+`return_results`), and can also be loaded from an experiment dump with
+`ExperimentResults.load`. It still behaves as the dict of tool names
+mapped to their results it replaces, but also indexes every flow by
+(tool, node, destination, port), so that a metric of a flow can be read
+as a NumPy array (or a pandas DataFrame) without walking the results.
+
+Results loaded from a dump are read lazily: a tool's results are read
+only when first accessed and, for the columnar and (uncompressed)
+ndjson outputs, a flow's samples are read only when the flow is.
+"""
+
+import json
+import os
+from collections import namedtuple
+from collections.abc import Mapping
+from functools import partial
+import pandas as pd
+from .columnar import TABLE_KEY, find_manifests, load_results, load_table
+from .json_writer import read_json
+from .pack import ARCHIVE_SUFFIXES, RESULT_SUFFIXES, Pack
+from .series import FlowSeries, is_record_list
+
+FlowKey = namedtuple("FlowKey", ["tool", "node", "destination", "port"])
+FlowKey.__doc__ = """
+Key of a flow in the results.
+
+`destination` is the destination address of the flow (or the interface,
+for tc and link stats), and `port` its destination port (or the qdisc
+handle, for tc stats). Either is None if the tool doesn't report it.
+"""
+
+# Tools whose flows are keyed by "<address>:<port>"
+_ADDRESS_PORT_TOOLS = ("netperf",)
+
+# Start of a line of an ndjson output, see `write_json`
+_NDJSON_PATH = '{"path": '
+_NDJSON_VALUE = ', "value": '
+
+
+def _is_column_dict(value):
+    """
+    Whether `value` is a flow stored as a list of values per parameter
+    (For eg., link stats), along with a "timestamp" list
+    """
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("timestamp"), list)
+        and all(isinstance(item, list) for key, item in value.items() if key != "meta")
+    )
+
+
+def _is_flow(value):
+    """Whether `value` holds the samples of a flow"""
+    return (
+        isinstance(value, FlowSeries)
+        or is_record_list(value)
+        or _is_column_dict(value)
+        or (isinstance(value, dict) and TABLE_KEY in value)
+    )
+
+
+def _to_series(value):
+    """Samples of a flow (see `_is_flow`) as a FlowSeries"""
+    if _is_column_dict(value):
+        columns = {
+            key: item
+            for key, item in value.items()
+            if key not in ("meta", "timestamp") and len(item) == len(value["timestamp"])
+        }
+        return FlowSeries(value.get("meta"), value["timestamp"], columns)
+    return FlowSeries.from_records(value)
+
+
+def _find_flows(value, keys):
+    """
+    Find the flows in `value`
+
+    Parameters
+    ----------
+    value : object
+        Results of a tool (or a part of them)
+    keys : List[str]
+        Keys leading to `value` (list indices are skipped)
+
+    Yields
+    ------
+    (List[str], object)
+        Keys leading to a flow, and the flow
+    """
+    if _is_flow(value):
+        yield keys, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _find_flows(item, keys + [str(key)])
+    elif isinstance(value, list):
+        for item in value:
+            yield from _find_flows(item, keys)
+
+
+def _flow_key(toolname, keys):
+    """
+    Key of a flow, given the keys leading to it in the results of
+    `toolname`
+    """
+    node = keys[0] if keys else None
+    keys = keys[1:]
+    if toolname in _ADDRESS_PORT_TOOLS and len(keys) == 1 and ":" in keys[0]:
+        keys = keys[0].rsplit(":", 1)
+    destination = keys[0] if keys else None
+    port = "/".join(keys[1:]) or None
+    return FlowKey(toolname, node, destination, port)
+
+
+def iter_flows(toolname, results):
+    """
+    Flows in the results of a tool
+
+    Parameters
+    ----------
+    toolname : str
+        Like ss, tc, netperf
+    results : dict
+        Results of the tool, keyed by node name
+
+    Yields
+    ------
+    (FlowKey, FlowSeries)
+        Key of a flow, and its samples
+    """
+    for keys, value in _find_flows(results, []):
+        yield _flow_key(toolname, keys), _to_series(value)
+
+
+class _ToolResults:
+    """
+    Results of a tool, read when first accessed
+
+    Attributes
+    ----------
+    toolname : str
+    """
+
+    def __init__(self, toolname, read=None, results=None):
+        """
+        Parameters
+        ----------
+        toolname : str
+        read : Callable
+            Reads the results of the tool
+        results : dict
+            Results of the tool, if already read
+        """
+        self.toolname = toolname
+        self._read = read
+        self._results = results
+
+    @property
+    def results(self):
+        """Results of the tool, keyed by node name"""
+        if self._results is None:
+            self._results = self._read()
+        return self._results
+
+    def flows(self):
+        """
+        Flows of the tool
+
+        Yields
+        ------
+        (FlowKey, Callable)
+            Key of a flow, and a function returning its samples as a
+            FlowSeries
+        """
+        for keys, value in _find_flows(self.results, []):
+            yield _flow_key(self.toolname, keys), partial(_to_series, value)
+
+
+class _ColumnarToolResults(_ToolResults):
+    """Results of a tool stored in the columnar format"""
+
+    def __init__(self, toolname, dump_folder, manifest_path):
+        super().__init__(
+            toolname, lambda: load_results(dump_folder, [toolname])[toolname]
+        )
+        self._manifest_path = manifest_path
+
+    def flows(self):
+        with open(self._manifest_path, encoding="utf-8") as file:
+            manifest = json.load(file)
+        tool_folder = os.path.join(os.path.dirname(self._manifest_path), self.toolname)
+
+        for keys, value in _find_flows(manifest["results"], []):
+            if TABLE_KEY in value:
+                load = partial(load_table, tool_folder, value, manifest["format"])
+            else:
+                load = partial(_to_series, value)
+            yield _flow_key(self.toolname, keys), load
+
+
+class _NdjsonToolResults(_ToolResults):
+    """
+    Results of a tool stored in an uncompressed ndjson file, where a
+    flow is read by seeking to its line(s)
+    """
+
+    def __init__(self, toolname, path):
+        super().__init__(toolname, lambda: read_json(path))
+        self._path = path
+
+    def _read_lines(self, offsets):
+        """Values of the lines at `offsets`"""
+        values = []
+        with open(self._path, "rb") as file:
+            for offset in offsets:
+                file.seek(offset)
+                values.append(json.loads(file.readline())["value"])
+        return values
+
+    def _load_columns(self, names, offsets):
+        """Flow stored as a line per parameter"""
+        return _to_series(dict(zip(names, self._read_lines(offsets))))
+
+    def flows(self):
+        decoder = json.JSONDecoder()
+        # Lines of flows stored as a list of values per parameter (see
+        # `_is_column_dict`), grouped by the path to the flow
+        columns = {}
+        offset = 0
+        with open(self._path, "rb") as file:
+            for line in file:
+                text = line.decode("utf-8")
+                path, end = decoder.raw_decode(text, len(_NDJSON_PATH))
+                keys = [str(key) for key in path if not isinstance(key, int)]
+                if text.startswith("[{", end + len(_NDJSON_VALUE)):
+                    yield _flow_key(self.toolname, keys), (
+                        lambda offset=offset: _to_series(self._read_lines([offset])[0])
+                    )
+                elif keys:
+                    columns.setdefault(tuple(keys[:-1]), []).append((keys[-1], offset))
+                offset += len(line)
+
+        for keys, lines in columns.items():
+            names = [name for name, _ in lines]
+            if "timestamp" in names:
+                offsets = [line_offset for _, line_offset in lines]
+                yield _flow_key(self.toolname, list(keys)), (
+                    lambda names=names, offsets=offsets: self._load_columns(
+                        names, offsets
+                    )
+                )
+
+
+class ExperimentResults(Mapping):
+    """
+    Results of an experiment: tool names (For eg., "ss") mapped to their
+    results, keyed by node name, along with an index of their flows.
+
+    Example
+    -------
+    >>> results = ExperimentResults.load("tcp(01-01-2026-10:00:00)_dump")
+    >>> key = results.flows(tool="ss", port="5000")[0]
+    >>> timestamp, cwnd = results.metric(key, "cwnd")
+    >>> results.frame(key)  # All the parameters, as a DataFrame
+    """
+
+    def __init__(self, results=None):
+        """
+        Parameters
+        ----------
+        results : dict
+            Tool names mapped to their results
+        """
+        self._tools = {
+            toolname: _ToolResults(toolname, results=tool_results)
+            for toolname, tool_results in (results or {}).items()
+        }
+        # Tool names mapped to their flow keys, mapped to functions
+        # reading their samples. Built when first needed.
+        self._index = {}
+        self._series = {}
+
+    @classmethod
+    def load(cls, dump_folder):
+        """
+        Load the results stored in an experiment dump (or an archive
+        created by `compress_dump`), in any of the formats they are
+        output in. Results are read lazily, see module docstring.
+
+        Parameters
+        ----------
+        dump_folder : str
+            Experiment dump (For eg., 'tcp(01-01-2026-10:00:00)_dump')
+
+        Returns
+        -------
+        ExperimentResults
+        """
+        if dump_folder.endswith(ARCHIVE_SUFFIXES):
+            # Archives can only be read in order
+            return cls(Pack.load_archive(dump_folder))
+
+        results = cls()
+        for filename in sorted(os.listdir(dump_folder)):
+            if not filename.endswith(RESULT_SUFFIXES):
+                continue
+            toolname = filename.split(".")[0]
+            path = os.path.join(dump_folder, filename)
+            if filename.endswith(".ndjson"):
+                results._tools[toolname] = _NdjsonToolResults(toolname, path)
+            else:
+                results._tools[toolname] = _ToolResults(
+                    toolname, lambda path=path: read_json(path)
+                )
+        for toolname, path in find_manifests(dump_folder).items():
+            results._tools[toolname] = _ColumnarToolResults(toolname, dump_folder, path)
+        return results
+
+    def __getitem__(self, toolname):
+        return self._tools[toolname].results
+
+    def __iter__(self):
+        return iter(self._tools)
+
+    def __len__(self):
+        return len(self._tools)
+
+    def __repr__(self):
+        return f"ExperimentResults({', '.join(self._tools)})"
+
+    def _get_index(self, toolname):
+        """
+        Flow keys of a tool mapped to the functions reading their
+        samples
+        """
+        if toolname not in self._index:
+            index = {}
+            for key, load in self._tools[toolname].flows():
+                index.setdefault(key, []).append(load)
+            self._index[toolname] = index
+        return self._index[toolname]
+
+    def flows(self, tool=None, node=None, destination=None, port=None):
+        """
+        Keys of the flows matching all the given fields
+
+        Parameters
+        ----------
+        tool : str
+            Like ss, tc, netperf
+        node : str
+            Node name
+        destination : str
+            Destination address (or interface, for tc and link stats)
+        port : str/int
+            Destination port (or qdisc handle, for tc stats)
+
+        Returns
+        -------
+        List[FlowKey]
+        """
+        if tool is None:
+            toolnames = list(self._tools)
+        else:
+            toolnames = [tool] if tool in self._tools else []
+        fields = {
+            "node": node,
+            "destination": destination,
+            "port": None if port is None else str(port),
+        }
+        return [
+            key
+            for toolname in toolnames
+            for key in self._get_index(toolname)
+            if all(
+                value is None or getattr(key, field) == value
+                for field, value in fields.items()
+            )
+        ]
+
+    def series(self, key, cache=True):
+        """
+        Samples of a flow. Samples of flows with the same key (For eg.,
+        a port reused in the experiment) are concatenated.
+
+        Parameters
+        ----------
+        key : FlowKey/tuple
+            (tool, node, destination, port) of the flow
+        cache : bool
+            Keep the samples in memory for later calls. Disable it to
+            go through many flows without holding all of them.
+
+        Returns
+        -------
+        FlowSeries
+        """
+        key = FlowKey(*key)
+        if key in self._series:
+            return self._series[key]
+
+        loads = self._get_index(key.tool)[key]
+        first = loads[0]()
+        if len(loads) == 1:
+            series = first
+        else:
+            series = FlowSeries(first.meta, first.timestamp, first.columns)
+            for load in loads[1:]:
+                series.extend(load())
+        if cache:
+            self._series[key] = series
+        return series
+
+    def metric(self, key, name):
+        """
+        Values of a metric of a flow
+
+        Parameters
+        ----------
+        key : FlowKey/tuple
+            (tool, node, destination, port) of the flow
+        name : str
+            Name of the metric (For eg., "cwnd")
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Time at which each sample was taken, and the value of the
+            metric in it (NaN if missing)
+        """
+        series = self.series(key)
+        return series.timestamp, series.column(name)
+
+    def frame(self, key):
+        """
+        Samples of a flow as a DataFrame
+
+        Parameters
+        ----------
+        key : FlowKey/tuple
+            (tool, node, destination, port) of the flow
+
+        Returns
+        -------
+        pandas.DataFrame
+            A row per sample, with a "timestamp" column and a column
+            per parameter
+        """
+        series = self.series(key)
+        columns = {"timestamp": series.timestamp}
+        columns.update(series.columns)
+        return pd.DataFrame(columns)
@@ -0,0 +1,227 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Write results as JSON incrementally, a node and a flow at a time,
+instead of building the complete JSON string in memory
+"""
+
+import json
+from .compression import COMPRESSED_SUFFIXES, open_compressed
+from .series import FlowSeries, json_default
+
+# Spaces per indentation level of "pretty" output
+INDENT = 4
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_leaf(value):
+    """
+    Whether `value` is encoded at once: scalars and dicts of scalars
+    (For eg., a single sample or the "meta" item)
+    """
+    if isinstance(value, dict):
+        return all(isinstance(item, _SCALARS) for item in value.values())
+    return not isinstance(value, (list, FlowSeries))
+
+
+def _write_pretty(file, value, level):
+    """
+    Write `value` in the same format as `json.dumps(value, indent=4)`
+
+    Parameters
+    ----------
+    file : File
+        File to be written to
+    value : object
+        Results (or a part of them)
+    level : int
+        Indentation level of `value`
+    """
+    if isinstance(value, FlowSeries):
+        # Records of a single flow are built at a time
+        value = value.to_records()
+
+    if _is_leaf(value) or not value:
+        encoded = json.dumps(value, indent=INDENT, default=json_default)
+        file.write(encoded.replace("\n", "\n" + " " * (INDENT * level)))
+        return
+
+    inner = "\n" + " " * (INDENT * (level + 1))
+    if isinstance(value, dict):
+        file.write("{")
+        for index, (key, item) in enumerate(value.items()):
+            file.write(("," if index else "") + inner)
+            file.write(json.dumps(str(key)) + ": ")
+            _write_pretty(file, item, level + 1)
+        file.write("\n" + " " * (INDENT * level) + "}")
+    else:
+        file.write("[")
+        for index, item in enumerate(value):
+            file.write(("," if index else "") + inner)
+            _write_pretty(file, item, level + 1)
+        file.write("\n" + " " * (INDENT * level) + "]")
+
+
+def _write_compact(file, value):
+    """
+    Write `value` without any whitespace
+
+    Parameters
+    ----------
+    file : File
+        File to be written to
+    value : object
+        Results (or a part of them)
+    """
+    if isinstance(value, FlowSeries):
+        value = value.to_records()
+
+    if isinstance(value, dict) and value and not _is_leaf(value):
+        file.write("{")
+        for index, (key, item) in enumerate(value.items()):
+            file.write(("," if index else "") + json.dumps(str(key)) + ":")
+            _write_compact(file, item)
+        file.write("}")
+    elif isinstance(value, list) and not all(_is_leaf(item) for item in value):
+        file.write("[")
+        for index, item in enumerate(value):
+            file.write("," if index else "")
+            _write_compact(file, item)
+        file.write("]")
+    else:
+        # Leaves and flows (lists of records) are encoded at once
+        file.write(json.dumps(value, separators=(",", ":"), default=json_default))
+
+
+def _iter_flows(value, path):
+    """
+    Split results into flows (lists of records) and other values
+
+    Parameters
+    ----------
+    value : object
+        Results (or a part of them)
+    path : List
+        Keys (and list indices) leading to `value`
+
+    Yields
+    ------
+    (List, object)
+        Path to a flow (or a value that isn't a container), and the
+        flow (or value)
+    """
+    if isinstance(value, dict) and value and not _is_leaf(value):
+        for key, item in value.items():
+            yield from _iter_flows(item, path + [key])
+    elif (
+        isinstance(value, list) and value and not all(_is_leaf(item) for item in value)
+    ):
+        for index, item in enumerate(value):
+            yield from _iter_flows(item, path + [index])
+    else:
+        yield path, value
+
+
+def write_json(path, results, style="pretty"):
+    """
+    Write `results` to `path`, a node and a flow at a time
+
+    Parameters
+    ----------
+    path : str
+        Path of the file. Compressed if it ends with ".zst" or ".gz"
+    results : dict
+        Results of a tool, keyed by node name
+    style : str
+        "pretty" (indented, same as earlier output), "compact" (no
+        whitespace) or "ndjson" (a line per flow, with the path to the
+        flow and its records, see `read_json`)
+    """
+    with open_compressed(path, "w") as file:
+        if style == "ndjson":
+            for flow_path, flow in _iter_flows(results, []):
+                file.write(
+                    json.dumps({"path": flow_path, "value": flow}, default=json_default)
+                )
+                file.write("\n")
+        elif style == "compact":
+            _write_compact(file, results)
+        else:
+            _write_pretty(file, results, 0)
+
+
+def load_json(file, ndjson=False):
+    """
+    Read results written by `write_json` from a file
+
+    Parameters
+    ----------
+    file : File
+        Text file
+    ndjson : bool
+        Whether the results were written in "ndjson" style
+
+    Returns
+    -------
+    dict
+        Results of the tool, keyed by node name
+    """
+    if not ndjson:
+        return json.load(file)
+
+    results = {}
+    for line in file:
+        line = json.loads(line)
+        container = results
+        keys = line["path"]
+        for key, next_key in zip(keys, keys[1:]):
+            empty = [] if isinstance(next_key, int) else {}
+            if isinstance(container, list):
+                if key == len(container):
+                    container.append(empty)
+            else:
+                container.setdefault(key, empty)
+            container = container[key]
+        if isinstance(container, list):
+            container.append(line["value"])
+        else:
+            container[keys[-1]] = line["value"]
+    return results
+
+
+def is_ndjson(path):
+    """
+    Whether `path` is a results file written in "ndjson" style
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    bool
+    """
+    for suffix in COMPRESSED_SUFFIXES:
+        if path.endswith(suffix):
+            path = path[: -len(suffix)]
+    return path.endswith(".ndjson")
+
+
+def read_json(path):
+    """
+    Read results written by `write_json`, in any style
+
+    Parameters
+    ----------
+    path : str
+        Path of the file
+
+    Returns
+    -------
+    dict
+        Results of the tool, keyed by node name
+    """
+    with open_compressed(path, "r") as file:
+        return load_json(file, is_ndjson(path))
@@ -0,0 +1,379 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Serve the latest samples of an experiment while it runs (See
+`live_endpoint` config), over HTTP on a TCP port or a UNIX socket:
+
+    GET  /metrics   Latest value of every parameter of every flow, in
+                    OpenMetrics format
+    GET  /json      Latest samples of every flow, and the progress of
+                    the experiment, as JSON (filtered by ?tool=<tool>)
+    POST /abort     Stop the experiment, as on pressing Ctrl-C
+
+Samples reach the feed as they are collected: from the in-process
+samplers ("sock_diag" and "netlink" collectors) and from the output of
+ss, tc, ping and netperf when it is parsed while they run (See
+`stream_parsing` config). The latest samples of every flow are kept in
+a ring buffer, so that the feed neither grows nor slows the experiment
+down. Nothing is collected unless the feed is enabled.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import signal
+import socketserver
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from nest import config
+from nest.topology_map import TopologyMap
+from .clock import ExperimentClock
+from .experiment_results import FlowKey, iter_flows
+from .series import json_default
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class LiveFeed:
+    """
+    Latest samples of every flow of the running experiment
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether samples are collected
+    """
+
+    enabled = False
+    # Flow keys mapped to ring buffers of their latest samples. Buffers
+    # are only appended to (and copied) at once, which needs no locks.
+    _flows = {}
+    _size = 0
+    _duration = None
+
+    @staticmethod
+    def enable(duration, size=None):
+        """
+        Start collecting samples
+
+        Parameters
+        ----------
+        duration : float
+            Duration of the experiment (in seconds)
+        size : int
+            Number of samples kept per flow
+            (Default value = `live_samples` config)
+        """
+        LiveFeed._flows = {}
+        LiveFeed._size = size or config.get_value("live_samples")
+        LiveFeed._duration = duration
+        LiveFeed.enabled = True
+
+    @staticmethod
+    def disable():
+        """Stop collecting samples, and drop the collected ones"""
+        LiveFeed.enabled = False
+        LiveFeed._flows = {}
+
+    @staticmethod
+    def _buffer(key):
+        """Ring buffer of the samples of the flow `key`"""
+        buffer = LiveFeed._flows.get(key)
+        if buffer is None:
+            buffer = LiveFeed._flows.setdefault(key, deque(maxlen=LiveFeed._size))
+        return buffer
+
+    @staticmethod
+    def add_sample(key, record):
+        """
+        Add a sample taken by an in-process sampler
+
+        Parameters
+        ----------
+        key : FlowKey
+            Flow of the sample, with the node name
+        record : dict
+            Sample, with its "timestamp"
+        """
+        if LiveFeed.enabled:
+            LiveFeed._buffer(key).append(record)
+
+    @staticmethod
+    def publish(toolname, ns_name, result):
+        """
+        Add the samples of a result parsed while the experiment runs
+
+        Parameters
+        ----------
+        toolname : str
+            Like ss, tc, netperf
+        ns_name : str
+            Name of the node of the result
+        result : dict
+            Parsed stats (a fragment of the result of the tool)
+        """
+        if not LiveFeed.enabled:
+            return
+        for key, series in iter_flows(toolname, {ns_name: [result]}):
+            records = series.to_records()
+            if series.meta is not None:
+                records = records[1:]
+            LiveFeed._buffer(key).extend(records[-LiveFeed._size :])
+
+    @staticmethod
+    def progress():
+        """
+        Progress of the experiment
+
+        Returns
+        -------
+        dict
+            Elapsed time and duration (in seconds) of the experiment,
+            and the fraction of the duration elapsed
+        """
+        elapsed = ExperimentClock.elapsed()
+        duration = LiveFeed._duration
+        fraction = None
+        if elapsed is not None and duration:
+            fraction = min(max(elapsed / duration, 0.0), 1.0)
+        return {
+            "elapsed": elapsed,
+            "duration": duration,
+            "progress": fraction,
+        }
+
+    @staticmethod
+    def snapshot(tools=None):
+        """
+        Latest samples of every flow
+
+        Parameters
+        ----------
+        tools : List[str]
+            Tools whose flows are included (Default: all)
+
+        Returns
+        -------
+        List[Tuple(FlowKey, List[dict])]
+        """
+        return [
+            (key, list(buffer))
+            for key, buffer in list(LiveFeed._flows.items())
+            if not tools or key.tool in tools
+        ]
+
+
+def _metric_name(toolname, param):
+    """Name of the OpenMetrics family of a parameter"""
+    return re.sub(r"\W", "_", f"nest_{toolname}_{param}")
+
+
+def _escape(value):
+    """Escape a label value"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_openmetrics(snapshot, progress):
+    """
+    Format the latest value of every parameter of every flow in
+    OpenMetrics format
+
+    Parameters
+    ----------
+    snapshot : List[Tuple(FlowKey, List[dict])]
+        Returned by `LiveFeed.snapshot`
+    progress : dict
+        Returned by `LiveFeed.progress`
+
+    Returns
+    -------
+    str
+    """
+    families = {}
+    for key, records in snapshot:
+        labels = ",".join(
+            f'{label}="{_escape(value)}"'
+            for label, value in zip(("node", "destination", "port"), key[1:])
+            if value is not None
+        )
+        # Latest value of every parameter, as some samples miss some
+        latest = {}
+        for record in reversed(records):
+            for param, value in record.items():
+                if (
+                    param == "timestamp"
+                    or isinstance(value, bool)
+                    or not isinstance(value, (int, float))
+                    or math.isnan(value)
+                ):
+                    continue
+                latest.setdefault(param, (value, record.get("timestamp")))
+
+        for param, (value, timestamp) in latest.items():
+            name = _metric_name(key.tool, param)
+            line = f"{name}{{{labels}}} {value}"
+            if isinstance(timestamp, (int, float)):
+                line += f" {timestamp}"
+            families.setdefault(name, []).append(line)
+
+    lines = []
+    for name in ("elapsed", "duration"):
+        if progress[name] is not None:
+            lines.append(f"# TYPE nest_experiment_{name}_seconds gauge")
+            lines.append(f"# UNIT nest_experiment_{name}_seconds seconds")
+            lines.append(f"nest_experiment_{name}_seconds {progress[name]}")
+    for name, samples in sorted(families.items()):
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(samples)
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class _LiveHandler(BaseHTTPRequestHandler):
+    """Handles the requests to the live endpoint"""
+
+    # Bounds the time a stalled client holds up stopping the server
+    timeout = 5
+
+    def _respond(self, status, content_type, body):
+        body = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # pylint: disable=invalid-name
+    def do_GET(self):
+        """Serve the latest samples"""
+        url = urlsplit(self.path)
+        tools = parse_qs(url.query).get("tool")
+        if url.path == "/metrics":
+            body = to_openmetrics(LiveFeed.snapshot(tools), LiveFeed.progress())
+            self._respond(200, OPENMETRICS_TYPE, body)
+        elif url.path in ("/", "/json"):
+            flows = [
+                {**key._asdict(), "samples": records}
+                for key, records in LiveFeed.snapshot(tools)
+            ]
+            body = json.dumps(
+                {"progress": LiveFeed.progress(), "flows": flows},
+                default=json_default,
+            )
+            self._respond(200, "application/json", body)
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        """Abort the experiment"""
+        if urlsplit(self.path).path != "/abort":
+            self.send_error(404)
+            return
+        logger.warning("Experiment aborted through the live endpoint")
+        self._respond(202, "application/json", json.dumps({"aborted": True}))
+        # Handled as Ctrl-C, by the main thread of the experiment
+        os.kill(os.getpid(), signal.SIGINT)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug("Live endpoint: " + format, *args)
+
+
+class _TCPHTTPServer(ThreadingHTTPServer):
+    """HTTP server on a TCP port"""
+
+    # Threads handling requests are joined when the server is closed
+    daemon_threads = False
+    # Thread serving the requests
+    serve_thread = None
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a UNIX socket"""
+
+    serve_thread = None
+
+
+def start_live_server(duration, endpoint=None):
+    """
+    Start collecting samples, and serve them from a background thread
+
+    Parameters
+    ----------
+    duration : float
+        Duration of the experiment (in seconds)
+    endpoint : str
+        "<host>:<port>", or the path of a UNIX socket
+        (Default value = `live_endpoint` config)
+
+    Returns
+    -------
+    socketserver.BaseServer or None
+        The server, None if it couldn't be started
+    """
+    endpoint = endpoint or config.get_value("live_endpoint")
+    try:
+        if "/" in endpoint:
+            if os.path.exists(endpoint):
+                os.unlink(endpoint)
+            server = _UnixHTTPServer(endpoint, _LiveHandler)
+        else:
+            host, port = endpoint.rsplit(":", 1)
+            server = _TCPHTTPServer((host.strip("[]"), int(port)), _LiveHandler)
+    except (OSError, ValueError) as error:
+        logger.error("Unable to serve live samples at %s: %s", endpoint, error)
+        return None
+
+    # Joined when the server is stopped (See `stop_live_server`)
+    server.serve_thread = threading.Thread(
+        target=server.serve_forever, name="nest-live", daemon=True
+    )
+    LiveFeed.enable(duration)
+    server.serve_thread.start()
+    logger.info("Serving live samples at %s", endpoint)
+    return server
+
+
+def stop_live_server(server):
+    """
+    Stop serving samples, and collecting them. Returns once all the
+    threads of the server are done, so that processes can be forked.
+
+    Parameters
+    ----------
+    server : socketserver.BaseServer
+        Returned by `start_live_server`
+    """
+    LiveFeed.disable()
+    if server is None:
+        return
+    server.shutdown()
+    server.serve_thread.join()
+    server.server_close()
+    if isinstance(server, _UnixHTTPServer) and os.path.exists(server.server_address):
+        os.unlink(server.server_address)
+
+
+def sample_key(toolname, ns_id, destination, port):
+    """
+    Key of a flow sampled in a namespace
+
+    Parameters
+    ----------
+    toolname : str
+    ns_id : str
+        Namespace id (internal name) of the node
+    destination : str
+    port : str
+
+    Returns
+    -------
+    FlowKey
+    """
+    return FlowKey(toolname, TopologyMap.get_node(ns_id).name, destination, port)
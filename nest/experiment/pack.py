@@ -3,15 +3,34 @@
 
 """Package all results into a folder"""
 
+import io
 import os
 import time
 import shutil
 import logging
+import tarfile
 
 from nest.user import User
+from .compression import (
+    COMPRESSED_SUFFIXES,
+    compress_folder,
+    open_archive_member,
+    open_compressed,
+)
+from .json_writer import is_ndjson, load_json
 
 logger = logging.getLogger(__name__)
 
+# Results files written by `Results.output_to_file`
+RESULT_SUFFIXES = tuple(
+    extension + suffix
+    for extension in (".json", ".ndjson")
+    for suffix in ("",) + COMPRESSED_SUFFIXES
+)
+
+# Archives created by `Pack.compress`
+ARCHIVE_SUFFIXES = tuple(f".tar{suffix}" for suffix in COMPRESSED_SUFFIXES)
+
 
 class Pack:
     """Handles packaging results"""
@@ -117,8 +136,61 @@ class Pack:
 
     @staticmethod
     def compress():
-        """Compress Pack.FOLDER into a tar archive"""
-        # TODO
+        """
+        Compress Pack.FOLDER into a tar archive next to it, using
+        multiple threads (zstd if available, else parallel gzip)
+
+        Returns
+        -------
+        str
+            Path of the archive
+        """
+        path = compress_folder(Pack.FOLDER)
+        Pack.set_owner(path)
+        return path
+
+    @staticmethod
+    def load_archive(path, tools=None):
+        """
+        Read the JSON results of an experiment directly from the
+        archive created by `Pack.compress`, without extracting it
+
+        Parameters
+        ----------
+        path : str
+            Path of the archive
+        tools : List[str]
+            Tools whose results are read (Default: all)
+
+        Returns
+        -------
+        dict
+            Tool names mapped to their results
+        """
+        results = {}
+        with open_compressed(path, "rb") as file:
+            # The archive is read as a stream, a member at a time
+            with tarfile.open(fileobj=file, mode="r|") as archive:
+                for member in archive:
+                    # Results are at the top of the dump folder
+                    filename = member.name.partition("/")[2]
+                    toolname = filename.split(".")[0]
+                    if (
+                        not member.isfile()
+                        or "/" in filename
+                        or not filename.endswith(RESULT_SUFFIXES)
+                        or (tools is not None and toolname not in tools)
+                    ):
+                        continue
+
+                    # Members of a streamed archive can't be seeked,
+                    # hence each (compressed) member is read at once
+                    member_file = io.BytesIO(archive.extractfile(member).read())
+                    if filename.endswith(COMPRESSED_SUFFIXES):
+                        member_file = open_archive_member(filename, member_file)
+                    with io.TextIOWrapper(member_file, encoding="utf-8") as text:
+                        results[toolname] = load_json(text, is_ndjson(filename))
+        return results
 
     @staticmethod
     def copy_files(src_path, dst_path=None):
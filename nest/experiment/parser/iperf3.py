@@ -156,8 +156,8 @@ class Iperf3Runner(Runner):
         iperf3_options_list = list(iperf3_options.values())
         iperf3_options_string = " ".join(iperf3_options_list)
 
-        if self.start_time != 0:
-            sleep(self.start_time)
+        if not self.wait_for_start():
+            return
 
         waiting_time = self.run_time
         while True:
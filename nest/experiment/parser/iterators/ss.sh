@@ -3,12 +3,11 @@
 
 # Runs the ss command
 
-INTERVAL=0.2
-
 destination_ip="$1"
 duration="$2"
 filter="$3"
 start_time="$4"
+INTERVAL="${5:-0.2}"
 
 command="ss -i -t "$filter" -n dst $destination_ip"
 
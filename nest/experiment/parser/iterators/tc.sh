@@ -4,10 +4,9 @@
 #!/bin/bash
 # Runs the ss command
 
-INTERVAL=0.2
-
 dev="$1"
 duration="$2"
+INTERVAL="${3:-0.2}"
 
 command="tc -s -j qdisc show dev $dev"
 
@@ -0,0 +1,212 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Samples the counters (bytes, packets, drops and errors) of interfaces
+across all the namespaces of the topology, by sending RTM_GETLINK
+requests over rtnetlink
+"""
+
+import socket
+import struct
+import time
+from functools import partial
+import numpy as np
+from nest import config
+from nest.engine.netlink import NetlinkSocket, NETLINK_ROUTE, parse_attrs
+from nest.engine.setns import ns_context
+from nest.experiment.interrupts import handle_keyboard_interrupt
+from ..results import LinkResults
+from ...topology_map import TopologyMap
+from .sampler import SamplerRunner
+
+RTM_GETLINK = 18
+
+# struct ifinfomsg is followed by the attributes
+_IFINFOMSG = struct.Struct("=BxHiII")
+
+IFLA_STATS64 = 23
+
+# Leading fields of struct rtnl_link_stats64
+_STATS64 = struct.Struct("=8Q")
+COUNTERS = (
+    "rx_packets",
+    "tx_packets",
+    "rx_bytes",
+    "tx_bytes",
+    "rx_errors",
+    "tx_errors",
+    "rx_dropped",
+    "tx_dropped",
+)
+_TX_BYTES = COUNTERS.index("tx_bytes")
+
+
+class LinkStatsRunner(SamplerRunner):
+    """
+    Samples the counters of the requested interfaces of all namespaces
+    from a single thread, with one rtnetlink socket per namespace.
+    Throughput and utilization are computed for the sending (tx)
+    direction of every interface, as the bandwidth set on an interface
+    limits the rate at which it sends.
+
+    Attributes
+    ----------
+    interfaces : dict
+        Namespace id mapped to the list of (interface id, bandwidth in
+        bits per second or None) of its requested interfaces
+    timestamps : List[float]
+        Time at which each sample was taken
+    samples : dict
+        (Namespace id, interface id) mapped to the counters at each sample
+    """
+
+    def __init__(self, interfaces, run_time, interval=None):
+        """
+        Constructor to initialize the link stats runner
+
+        Parameters
+        ----------
+        interfaces : dict
+            Namespace id mapped to the list of (interface id, bandwidth in
+            bits per second or None) of its requested interfaces
+        run_time : num
+            total time to sample counters for
+        interval : float
+            time (in seconds) between two samples
+            (Default value = `link_stats_interval` config)
+        """
+        if interval is None:
+            interval = config.get_value("link_stats_interval")
+
+        # Samples all the namespaces. Errors are logged against the
+        # namespace in which they occur.
+        super().__init__(None, 0, run_time, interval)
+        self.interfaces = interfaces
+        self.timestamps = []
+        self.samples = {}
+
+    def run(self):
+        """
+        Samples the counters from t=0 till `self.run_time`
+        """
+        if not self.wait_for_start():
+            return
+
+        # (socket, ifindex mapped to interface id) of every namespace
+        namespaces = []
+        try:
+            for ns_id, ns_interfaces in self.interfaces.items():
+                self.ns_id = ns_id
+                with ns_context(ns_id):
+                    sock = NetlinkSocket(NETLINK_ROUTE)
+                    namespaces.append((ns_id, sock, {}))
+                    for int_id, _ in ns_interfaces:
+                        namespaces[-1][2][socket.if_nametoindex(int_id)] = int_id
+                        self.samples[(ns_id, int_id)] = []
+        except (OSError, ValueError) as error:
+            self.log_error("Collecting link stats", error)
+            for _, sock, _ in namespaces:
+                sock.close()
+            return
+
+        try:
+            self.sample_periodically(
+                partial(self._sample, namespaces),
+                error_string_prefix="Collecting link stats",
+            )
+        finally:
+            for _, sock, _ in namespaces:
+                sock.close()
+
+    def _sample(self, namespaces):
+        """
+        Take one sample of the interfaces of all the namespaces
+
+        Parameters
+        ----------
+        namespaces : List[Tuple(str, NetlinkSocket, dict)]
+            Namespace id, rtnetlink socket in the namespace, and ifindex
+            mapped to interface id of the requested interfaces
+
+        Returns
+        -------
+        dict
+            Bytes sent by every interface since the previous sample,
+            to detect transients
+        """
+        # Dump all the interfaces of a namespace at once
+        request = _IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)
+        timestamp = time.time()
+        for ns_id, sock, ifindices in namespaces:
+            self.ns_id = ns_id
+            for _, msg in sock.dump(RTM_GETLINK, request):
+                _, _, ifindex, _, _ = _IFINFOMSG.unpack_from(msg)
+                if ifindex not in ifindices:
+                    continue
+                attrs = parse_attrs(msg, _IFINFOMSG.size)
+                if IFLA_STATS64 in attrs:
+                    self.samples[(ns_id, ifindices[ifindex])].append(
+                        _STATS64.unpack_from(attrs[IFLA_STATS64])
+                    )
+        self.timestamps.append(timestamp)
+
+        watched = {}
+        for key, samples in self.samples.items():
+            if len(samples) > 1:
+                watched[key] = samples[-1][_TX_BYTES] - samples[-2][_TX_BYTES]
+        return watched
+
+    @handle_keyboard_interrupt
+    def parse(self):
+        """
+        Stores the change in counters, the throughput and the utilization
+        of every interface over every interval, one result per namespace
+        """
+        durations = np.diff(self.timestamps)
+        for ns_id, ns_interfaces in self.interfaces.items():
+            result = {}
+            for int_id, bandwidth in ns_interfaces:
+                samples = self.samples.get((ns_id, int_id), [])
+                # An interface that disappeared midway isn't sampled
+                if len(samples) < 2 or len(samples) != len(self.timestamps):
+                    continue
+
+                deltas = np.diff(np.array(samples, dtype=np.int64), axis=0)
+                # In Mbps
+                throughput = deltas[:, _TX_BYTES] * 8 / durations / 1e6
+                record = {
+                    "meta": {
+                        "start_timestamp": self.timestamps[0],
+                        "bandwidth": bandwidth,
+                    },
+                    "timestamp": self.timestamps[1:],
+                    "throughput": throughput.tolist(),
+                }
+                if bandwidth:
+                    # In percentage
+                    record["utilization"] = (throughput * 1e8 / bandwidth).tolist()
+                for index, counter in enumerate(COUNTERS):
+                    record[counter] = deltas[:, index].tolist()
+
+                dev_name = TopologyMap.get_device(ns_id, int_id).name
+                result[dev_name] = record
+
+            if result:
+                LinkResults.add_result(ns_id, result)
+
+    def log_error(self, error_string_prefix, error):
+        """
+        Log an error raised while sampling
+
+        Parameters
+        ----------
+        error_string_prefix : str
+            Description of the sampler
+        error : Exception
+            Error raised
+        """
+        if self.ns_id is None:
+            self.logger.error("%s. %s", error_string_prefix, error)
+        else:
+            super().log_error(error_string_prefix, error)
@@ -9,16 +9,49 @@ and collect throughput data
 import re
 import copy
 import logging
-from time import sleep
 from functools import partial
+import numpy as np
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from ..results import NetperfResults
+from ..series import FlowSeries
 from .runnerbase import Runner
 from ...topology_map import TopologyMap
 from ...engine.netperf import run_netperf, run_netserver
 
 logger = logging.getLogger(__name__)
 
+# pattern that matches the netperf output corresponding to throughput
+_THROUGHPUT = re.compile(r"NETPERF_INTERIM_RESULT\[\d+]=(?P<throughput>\d+\.\d+)")
+
+# pattern that matches the netperf output corresponding to interval
+_TIMESTAMP = re.compile(r"NETPERF_ENDING\[\d+]=(?P<timestamp>\d+\.\d+)")
+
+# pattern that gives the remote port
+_REMOTE_PORT = re.compile(r"remote port is (?P<remote>\d+)")
+
+
+def _parse_interim_results(raw_stats):
+    """
+    Extract the interim results from netperf output
+
+    Parameters
+    ----------
+    raw_stats : str
+        netperf output
+
+    Returns
+    -------
+    (List[str], List[str])
+        Interim throughputs, and the time at which each was output
+    """
+    throughputs = [
+        throughput.group("throughput") for throughput in _THROUGHPUT.finditer(raw_stats)
+    ]
+    timestamps = [
+        timestamp.group("timestamp") for timestamp in _TIMESTAMP.finditer(raw_stats)
+    ]
+    return throughputs, timestamps
+
 
 class NetperfRunner(Runner):
     """
@@ -76,6 +109,9 @@ class NetperfRunner(Runner):
 
     # fmt: on
 
+    # Interim results are output line by line
+    STREAM_SEPARATOR = b"\n"
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -115,6 +151,11 @@ class NetperfRunner(Runner):
         self.source_ip = source_ip
         super().__init__(ns_id, start_time, run_time, destination_ip, dst_ns)
 
+        # Interim throughputs and timestamps, and the remote port,
+        # parsed while netperf runs
+        self._streamed_results = ([], [])
+        self._remote_port = None
+
     # Should this be placed somewhere else?
     @staticmethod
     def run_netserver(ns_id, is_mptcp):
@@ -143,6 +184,10 @@ class NetperfRunner(Runner):
         # Change the default run time
         netperf_options["testlen"] = f"-l {self.run_time}"
 
+        # Change the default interval of interim results
+        if "interval" in self.options:
+            netperf_options["interval"] = f"-D -{self.options['interval']}"
+
         # Set test
         netperf_options["testname"] = f"-t {self.options['testname']}"
 
@@ -158,8 +203,8 @@ class NetperfRunner(Runner):
         test_options_list = list(test_options.values())
         test_options_string = " ".join(test_options_list)
 
-        if self.start_time > 0:
-            sleep(self.start_time)
+        if not self.wait_for_start():
+            return
 
         super().run(
             partial(
@@ -183,38 +228,57 @@ class NetperfRunner(Runner):
         self.out.seek(0)  # rewind to start of the temp file
         raw_stats = self.out.read().decode()
 
-        # pattern that matches the netperf output corresponding to throughput
-        throughput_pattern = r"NETPERF_INTERIM_RESULT\[\d+]=(?P<throughput>\d+\.\d+)"
-        throughputs = [
-            throughput.group("throughput")
-            for throughput in re.finditer(throughput_pattern, raw_stats)
-        ]
+        throughputs, timestamps = _parse_interim_results(raw_stats)
+        remote_port = _REMOTE_PORT.search(raw_stats).group("remote")
+        self._add_result(throughputs, timestamps, remote_port)
 
-        # pattern that matches the netperf output corresponding to interval
-        timestamp_pattern = r"NETPERF_ENDING\[\d+]=(?P<timestamp>\d+\.\d+)"
-        timestamps = [
-            timestamp.group("timestamp")
-            for timestamp in re.finditer(timestamp_pattern, raw_stats)
-        ]
+    def parse_records(self, records):
+        """
+        Parse the interim results output by netperf while it runs. The
+        results are stored once netperf exits, as the remote port (which
+        identifies the flow) is output at the end.
 
-        # pattern that gives the remote port
-        remote_port_pattern = r"remote port is (?P<remote>\d+)"
-        remote_port = re.search(remote_port_pattern, raw_stats).group("remote")
+        Parameters
+        ----------
+        records : List[bytes]
+            Lines read from netperf at once
+        """
+        if records:
+            raw_stats = b"\n".join(records).decode()
+            throughputs, timestamps = _parse_interim_results(raw_stats)
+            self._streamed_results[0].extend(throughputs)
+            self._streamed_results[1].extend(timestamps)
+            if self._remote_port is None:
+                match = _REMOTE_PORT.search(raw_stats)
+                if match:
+                    self._remote_port = match.group("remote")
+        elif self._remote_port is not None:
+            self._add_result(*self._streamed_results, self._remote_port)
 
-        # List storing collected stats
-        # First item as "meta" item with user given information
-        stats_list = [self.get_meta_item()]
+    def _add_result(self, throughputs, timestamps, remote_port):
+        """
+        Store the parsed netperf stats
 
+        Parameters
+        ----------
+        throughputs : List[str]
+            Interim throughputs
+        timestamps : List[str]
+            Time at which each interim throughput was output
+        remote_port : str
+            Port of the netserver
+        """
         # Trim last result, since netperf typically gives unrealisticly high throughput
         # towards the end
-        for i in range(len(throughputs) - 1):
-            stats_list.append(
-                {
-                    "timestamp": timestamps[i],
-                    # Netperf provides throughput as sending rate from sender's side
-                    "sending_rate": throughputs[i],
-                }
-            )
+        count = max(len(throughputs) - 1, 0)
+
+        # "meta" item with user given information is stored with the stats
+        stats_list = FlowSeries(
+            self.get_meta_item(),
+            timestamps[:count],
+            # Netperf provides throughput as sending rate from sender's side
+            {"sending_rate": np.array(throughputs[:count], dtype=np.float64)},
+        )
         destination_ip = self.destination_address.get_addr(with_subnet=False)
         stats_dict = {f"{destination_ip}:{remote_port}": stats_list}
 
@@ -4,13 +4,40 @@
 """Runs and provides RTT output from ping command"""
 
 import re
-from time import sleep
 from functools import partial
+import numpy as np
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from .runnerbase import Runner
 from ..results import PingResults
+from ..series import FlowSeries
 from ...engine.ping import run_exp_ping
 
+_RTT = re.compile(r"\[(?P<timestamp>\d+\.\d+)\].*time=(?P<rtt>\d+(\.\d+)?)")
+
+
+def _parse_rtts(raw_stats, meta_item=None):
+    """
+    Extract the RTTs from ping output
+
+    Parameters
+    ----------
+    raw_stats : str
+        ping output
+    meta_item : dict
+        "meta" item of the flow
+
+    Returns
+    -------
+    FlowSeries
+        Timestamp and RTT of every reply
+    """
+    timestamps = []
+    rtts = []
+    for match in _RTT.finditer(raw_stats):
+        timestamps.append(match.group("timestamp"))
+        rtts.append(match.group("rtt"))
+    return FlowSeries(meta_item, timestamps, {"rtt": np.array(rtts, dtype=np.float64)})
+
 
 class PingRunner(Runner):
     """
@@ -26,8 +53,14 @@ class PingRunner(Runner):
         time at which netperf is to run
     run_time : num
         total time to run netperf for
+    meta_streamed : bool
+        True once the "meta" item is stored, when parsing ping output
+        while it runs
     """
 
+    # Replies are output line by line
+    STREAM_SEPARATOR = b"\n"
+
     # pylint: disable=too-many-arguments
     def __init__(self, ns_id, destination_ip, start_time, run_time, dst_ns):
         """
@@ -47,14 +80,15 @@ class PingRunner(Runner):
             destination network namespace of ping
         """
         super().__init__(ns_id, start_time, run_time, destination_ip, dst_ns)
+        self.meta_streamed = False
 
     # pylint: disable=arguments-differ
     def run(self):
         """
         Runs ping at t=`self.start_time`
         """
-        if self.start_time > 0:
-            sleep(self.start_time)
+        if not self.wait_for_start():
+            return
 
         super().run(
             partial(
@@ -75,19 +109,29 @@ class PingRunner(Runner):
         self.out.seek(0)  # rewind to start of the temp file
         raw_stats = self.out.read().decode()
 
-        pattern = r"\[(?P<timestamp>\d+\.\d+)\].*time=(?P<rtt>\d+(\.\d+)?)"
-        timestamps_and_rtts = [
-            (match.group("timestamp"), match.group("rtt"))
-            for match in re.finditer(pattern, raw_stats)
-        ]
+        # "meta" item with user given information is stored with the stats
+        stats_list = _parse_rtts(raw_stats, self.get_meta_item())
 
-        # List storing collected stats
-        # First item as "meta" item with user given information
-        stats_list = [self.get_meta_item()]
+        stats_dict = {self.destination_address.get_addr(with_subnet=False): stats_list}
 
-        for timestamp, rtt in timestamps_and_rtts:
-            stats_list.append({"timestamp": timestamp, "rtt": rtt})
+        PingResults.add_result(self.ns_id, stats_dict)
+
+    def parse_records(self, records):
+        """
+        Parse the RTTs output by ping while it runs
+
+        Parameters
+        ----------
+        records : List[bytes]
+            Lines read from ping at once
+        """
+        stats_list = _parse_rtts(b"\n".join(records).decode())
+        if not self.meta_streamed:
+            stats_list.meta = self.get_meta_item()
+            self.meta_streamed = True
+        elif not stats_list:
+            return
 
         stats_dict = {self.destination_address.get_addr(with_subnet=False): stats_list}
 
-        PingResults.add_result(self.ns_id, stats_dict)
+        PingResults.add_result(self.ns_id, stats_dict, self.stream_id)
@@ -0,0 +1,405 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Collects qdisc stats by sending RTM_GETQDISC requests over rtnetlink,
+instead of running `tc` periodically
+"""
+
+import socket
+import struct
+import time
+from functools import partial
+from nest import config
+from nest.engine.netlink import NetlinkSocket, NETLINK_ROUTE, parse_attrs
+from nest.engine.netlink import parse_string
+from nest.engine.setns import ns_context
+from nest.experiment.interrupts import handle_keyboard_interrupt
+from ..live import LiveFeed, sample_key
+from ..results import TcResults
+from ...topology_map import TopologyMap
+from .sampler import SamplerRunner
+
+RTM_GETQDISC = 38
+
+# struct tcmsg is followed by the attributes
+_TCMSG = struct.Struct("=BxxxiIII")
+
+# Qdisc attributes
+TCA_KIND = 1
+TCA_STATS2 = 7
+
+# Attributes nested in TCA_STATS2
+TCA_STATS_BASIC = 1
+TCA_STATS_QUEUE = 3
+TCA_STATS_APP = 4
+
+# struct gnet_stats_basic: bytes, packets
+_BASIC = struct.Struct("=QI")
+
+# struct gnet_stats_queue
+_QUEUE = struct.Struct("=5I")
+_QUEUE_FIELDS = ("qlen", "backlog", "drops", "requeues", "overlimits")
+
+# Qdisc specific stats (xstats), named as in the JSON output of `tc -s -j`
+_XSTATS = {
+    "codel": (
+        struct.Struct("=4Ii3I"),
+        (
+            "maxpacket",
+            "count",
+            "lastcount",
+            "ldelay",
+            "drop_next",
+            "drop_overlimit",
+            "ecn_mark",
+            "dropping",
+        ),
+    ),
+    "fq_codel": (
+        # Type of the stats (0 for qdisc stats) followed by the stats
+        struct.Struct("=I6I"),
+        (
+            None,
+            "maxpacket",
+            "drop_overlimit",
+            "ecn_mark",
+            "new_flow_count",
+            "new_flows_len",
+            "old_flows_len",
+        ),
+    ),
+    "red": (
+        struct.Struct("=4I"),
+        ("early", "pdrop", "other", "marked"),
+    ),
+    "choke": (
+        struct.Struct("=5I"),
+        ("early", "pdrop", "other", "marked", "matched"),
+    ),
+    "fq_pie": (
+        struct.Struct("=9I"),
+        (
+            "pkts_in",
+            "dropped",
+            "overlimit",
+            "overmemory",
+            "ecn_mark",
+            "new_flow_count",
+            "new_flows_len",
+            "old_flows_len",
+            "memory_used",
+        ),
+    ),
+}
+
+# PIE reports `dq_rate_estimating` since Linux 5.2, and a
+# 64 bit drop probability since Linux 5.6
+_PIE_XSTATS = struct.Struct("=QIII5I")
+_PIE_XSTATS_U32_PROB = struct.Struct("=9I")
+_PIE_XSTATS_OLD = struct.Struct("=8I")
+_PIE_FIELDS = ("delay", "avg_dq_rate")
+_PIE_COUNTERS = ("pkts_in", "dropped", "overlimit", "maxq", "ecn_mark")
+
+# Qdiscs without specific stats, whose stats are the same as
+# reported by `tc`
+_NO_XSTATS = ("pfifo", "bfifo", "pfifo_fast", "pfifo_head_drop", "netem", "tbf")
+
+# CAKE reports nested attributes (TCA_CAKE_STATS_*)
+_CAKE_STATS = {
+    2: ("capacity_estimate", "=Q"),
+    3: ("memory_limit", "=I"),
+    4: ("memory_used", "=I"),
+    5: ("avg_hdr_offset", "=I"),
+    6: ("min_network_size", "=I"),
+    7: ("max_network_size", "=I"),
+    8: ("min_adj_size", "=I"),
+    9: ("max_adj_size", "=I"),
+}
+
+
+def is_decoded(kind):
+    """
+    Check if all the stats of a qdisc are decoded, hence collected as
+    completely as with `tc`
+
+    Parameters
+    ----------
+    kind : str
+        Qdisc name [eg. 'codel', 'pie']
+
+    Returns
+    -------
+    bool
+    """
+    return kind in _XSTATS or kind in ("pie", "cake") or kind in _NO_XSTATS
+
+
+def _decode_pie(xstats):
+    """
+    Decode `struct tc_pie_xstats`
+
+    Parameters
+    ----------
+    xstats : bytes/memoryview
+        Value of TCA_STATS_APP
+
+    Returns
+    -------
+    dict
+    """
+    # Skip `dq_rate_estimating`
+    if len(xstats) >= _PIE_XSTATS.size:
+        values = _PIE_XSTATS.unpack_from(xstats)
+        record = {"prob": values[0] / 2**64}
+        counters = values[4:]
+    elif len(xstats) >= _PIE_XSTATS_U32_PROB.size:
+        values = _PIE_XSTATS_U32_PROB.unpack_from(xstats)
+        record = {"prob": values[0] / 2**32}
+        counters = values[4:]
+    else:
+        values = _PIE_XSTATS_OLD.unpack_from(xstats)
+        record = {"prob": values[0] / 2**32}
+        counters = values[3:]
+    record.update(zip(_PIE_FIELDS, values[1:3]))
+    record.update(zip(_PIE_COUNTERS, counters))
+    return record
+
+
+def _decode_cake(xstats):
+    """
+    Decode the (nested) CAKE stats, excluding per tin stats
+
+    Parameters
+    ----------
+    xstats : bytes/memoryview
+        Value of TCA_STATS_APP
+
+    Returns
+    -------
+    dict
+    """
+    record = {}
+    for attr_type, value in parse_attrs(xstats).items():
+        if attr_type in _CAKE_STATS:
+            name, fmt = _CAKE_STATS[attr_type]
+            (record[name],) = struct.unpack_from(fmt, value)
+    return record
+
+
+def decode_xstats(kind, xstats):
+    """
+    Decode qdisc specific stats
+
+    Parameters
+    ----------
+    kind : str
+        Qdisc name [eg. 'codel', 'pie']
+    xstats : bytes/memoryview
+        Value of TCA_STATS_APP
+
+    Returns
+    -------
+    dict
+        Empty for qdiscs without specific stats
+    """
+    if kind == "pie":
+        return _decode_pie(xstats)
+    if kind == "cake":
+        return _decode_cake(xstats)
+    if kind not in _XSTATS:
+        return {}
+
+    fmt, fields = _XSTATS[kind]
+    if len(xstats) < fmt.size:
+        # Older kernels report fewer fields
+        xstats = bytes(xstats) + bytes(fmt.size - len(xstats))
+    return {
+        field: value
+        for field, value in zip(fields, fmt.unpack_from(xstats))
+        if field is not None
+    }
+
+
+def decode_stats2(kind, stats2):
+    """
+    Decode the TCA_STATS2 attribute of a qdisc into a record with
+    the same keys as the JSON output of `tc -s -j qdisc show`
+
+    Parameters
+    ----------
+    kind : str
+        Qdisc name
+    stats2 : bytes/memoryview
+        Value of TCA_STATS2
+
+    Returns
+    -------
+    dict
+    """
+    attrs = parse_attrs(stats2)
+    record = {}
+    if TCA_STATS_BASIC in attrs:
+        record["bytes"], record["packets"] = _BASIC.unpack_from(attrs[TCA_STATS_BASIC])
+    if TCA_STATS_QUEUE in attrs:
+        record.update(zip(_QUEUE_FIELDS, _QUEUE.unpack_from(attrs[TCA_STATS_QUEUE])))
+    if TCA_STATS_APP in attrs:
+        record.update(decode_xstats(kind, attrs[TCA_STATS_APP]))
+    return record
+
+
+def _decode_qdisc(msg, interfaces):
+    """
+    Decode the stats of a qdisc in an RTM_NEWQDISC message
+
+    Parameters
+    ----------
+    msg : memoryview
+        Message, without its netlink header
+    interfaces : dict
+        ifindex mapped to (interface id, qdisc, stats required)
+
+    Returns
+    -------
+    (str, int, str, set, dict) or None
+        Interface id, handle, kind, stats required and stats of the
+        qdisc. None if the qdisc isn't the one required on a sampled
+        interface.
+    """
+    _, ifindex, handle, _, _ = _TCMSG.unpack_from(msg)
+    if ifindex not in interfaces:
+        return None
+
+    int_id, qdisc, stats = interfaces[ifindex]
+    attrs = parse_attrs(msg, _TCMSG.size)
+    kind = parse_string(attrs[TCA_KIND]) if TCA_KIND in attrs else None
+    # To ignore the HTB qdisc
+    if kind != qdisc or TCA_STATS2 not in attrs:
+        return None
+    return int_id, handle, kind, stats, decode_stats2(kind, attrs[TCA_STATS2])
+
+
+class QdiscNetlinkRunner(SamplerRunner):
+    """
+    Samples qdisc stats of all the requested interfaces of a namespace,
+    from a single thread. The results are stored in the same format as
+    `TcRunner`.
+
+    Attributes
+    ----------
+    interfaces : List[dict]
+        Interfaces, along with the qdisc and stats required
+    samples : dict
+        Interface id mapped to qdisc handle mapped to the list of records
+    """
+
+    def __init__(self, ns_id, interfaces, run_time, interval=None):
+        """
+        Constructor to initialize the qdisc stats runner
+
+        Parameters
+        ----------
+        ns_id : str
+            network namespace to collect qdisc stats from
+        interfaces : List[dict]
+            "int_id", "qdisc" and "stats" of the interfaces, as stored by
+            `Experiment.require_qdisc_stats`
+        run_time : num
+            total time to collect qdisc stats for
+        interval : float
+            Time (in seconds) between two samples
+            (Default value = `qdisc_stats_interval` config)
+        """
+        if interval is None:
+            interval = config.get_value("qdisc_stats_interval")
+
+        # Start parsing from 0s
+        super().__init__(ns_id, 0, run_time, interval)
+        self.interfaces = interfaces
+        self.samples = {}
+
+    def run(self):
+        """
+        Samples qdisc stats from t=0 till `self.run_time`
+        """
+        if not self.wait_for_start():
+            return
+
+        try:
+            with ns_context(self.ns_id):
+                sock = NetlinkSocket(NETLINK_ROUTE)
+                # ifindex mapped to (interface id, qdisc, stats required)
+                interfaces = {
+                    socket.if_nametoindex(interface["int_id"]): (
+                        interface["int_id"],
+                        interface["qdisc"],
+                        set(interface["stats"] or []),
+                    )
+                    for interface in self.interfaces
+                }
+        except (OSError, ValueError) as error:
+            self.log_error("Collecting qdisc stats", error)
+            return
+
+        # Dump the qdiscs of all interfaces of the namespace at once
+        request = _TCMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)
+        with sock:
+            self.sample_periodically(
+                partial(self._sample, sock, request, interfaces),
+                error_string_prefix="Collecting qdisc stats",
+            )
+
+    def _sample(self, sock, request, interfaces):
+        """
+        Take one sample of the qdiscs of all the interfaces
+
+        Parameters
+        ----------
+        sock : NetlinkSocket
+            rtnetlink socket in the namespace
+        request : bytes
+            RTM_GETQDISC dump request
+        interfaces : dict
+            ifindex mapped to (interface id, qdisc, stats required)
+
+        Returns
+        -------
+        dict
+            backlog and qlen of every qdisc, to detect transients
+        """
+        timestamp = time.time()
+        watched = {}
+        for _, msg in sock.dump(RTM_GETQDISC, request):
+            decoded = _decode_qdisc(msg, interfaces)
+            if decoded is None:
+                continue
+
+            int_id, handle, kind, stats, values = decoded
+            watched[(int_id, handle, "backlog")] = values.get("backlog", 0)
+            watched[(int_id, handle, "qlen")] = values.get("qlen", 0)
+            if stats:
+                values = {key: value for key, value in values.items() if key in stats}
+            self._add_record(
+                int_id, handle, {"timestamp": timestamp, "kind": kind, **values}
+            )
+        return watched
+
+    def _add_record(self, int_id, handle, record):
+        """
+        Add a sample of the qdisc `handle` of the interface `int_id`
+        """
+        handle = f"{handle >> 16:x}:"
+        self.samples.setdefault(int_id, {}).setdefault(handle, []).append(record)
+        if LiveFeed.enabled:
+            dev_name = TopologyMap.get_device(self.ns_id, int_id).name
+            LiveFeed.add_sample(sample_key("tc", self.ns_id, dev_name, handle), record)
+
+    @handle_keyboard_interrupt
+    def parse(self):
+        """
+        Stores the sampled records, one result per interface
+        """
+        for interface in self.interfaces:
+            int_id = interface["int_id"]
+            dev_name = TopologyMap.get_device(self.ns_id, int_id).name
+            TcResults.add_result(self.ns_id, {dev_name: self.samples.get(int_id, {})})
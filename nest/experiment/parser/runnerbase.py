@@ -5,10 +5,15 @@
 Base class for other runners
 """
 
+import os
 import tempfile
 import logging
+import threading
+import uuid
+from nest import config
 from nest.topology import Address
 from nest.topology_map import TopologyMap
+from ..clock import ExperimentClock
 
 
 # pylint: disable=too-many-instance-attributes
@@ -28,8 +33,24 @@ class Runner:
         total time for a utility to run
     destination_address : Address
         Address of the destination node for the runner
+    start_skew : float/None
+        Difference (in seconds) between the time the utility was actually
+        started and `start_time` on the experiment clock
+    streamed : bool
+        True if the output was parsed while the utility ran, in which
+        case `parse` needn't be called
+    stream_id : str
+        Identifies the results parsed while the utility ran
     """
 
+    # Separator between the records output by the utility. Runners which
+    # set it, and implement `parse_records`, can parse the output while
+    # the utility runs (See `stream_parsing` config)
+    STREAM_SEPARATOR = None
+
+    # Largest amount of output (in bytes) read from the utility at once
+    STREAM_READ_SIZE = 65536
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -65,6 +86,20 @@ class Runner:
         self.start_time = start_time
         self.run_time = run_time
         self.destination_address = Address(destination_ip)
+        self.start_skew = None
+        self.streamed = False
+        self.stream_id = uuid.uuid4().hex
+
+    def wait_for_start(self):
+        """
+        Block until t=`self.start_time` on the experiment clock
+
+        Returns
+        -------
+        bool
+            False if the experiment was aborted while waiting
+        """
+        return ExperimentClock.wait_until(self.start_time)
 
     def run(self, engine_func, error_string_prefix="Error"):
         """
@@ -75,8 +110,13 @@ class Runner:
         engine_func: Function
             engine function to be called
         """
+        if self.start_skew is None:
+            self.start_skew = ExperimentClock.skew(self.start_time)
         try:
-            return_code = engine_func(out=self.out, err=self.err)
+            if self.can_stream() and config.get_value("stream_parsing"):
+                return_code = self._run_streamed(engine_func)
+            else:
+                return_code = engine_func(out=self.out, err=self.err)
             if return_code != 0 and return_code is not None:
                 self.print_error(error_string_prefix)
         except KeyboardInterrupt:
@@ -87,6 +127,105 @@ class Runner:
                 ns_name,
             )
 
+    def can_stream(self):
+        """
+        Whether the output of the utility can be parsed while it runs
+
+        Returns
+        -------
+        bool
+            False, unless the runner sets `STREAM_SEPARATOR`
+        """
+        return self.STREAM_SEPARATOR is not None
+
+    def _run_streamed(self, engine_func):
+        """
+        Execute `engine_func` with its output written to a pipe, which
+        is parsed by a separate thread as the output is produced
+
+        Parameters
+        ----------
+        engine_func: Function
+            engine function to be called
+
+        Returns
+        -------
+        int/None
+            Return code of `engine_func`
+        """
+        read_fd, write_fd = os.pipe()
+        reader = threading.Thread(target=self._parse_stream, args=(read_fd,))
+        reader.start()
+        try:
+            with open(write_fd, "wb") as out:
+                return_code = engine_func(out=out, err=self.err)
+        finally:
+            # The utility has exited, so the reader sees the end of the
+            # output once the pipe is closed
+            reader.join()
+        return return_code
+
+    def _parse_stream(self, read_fd):
+        """
+        Read the output of the utility from `read_fd` till it is closed,
+        and parse all the complete records read at once
+
+        Parameters
+        ----------
+        read_fd : int
+            Read end of the pipe the utility writes to
+        """
+        separator = self.STREAM_SEPARATOR
+        pending = b""
+        with open(read_fd, "rb") as stream:
+            while True:
+                data = stream.read1(self.STREAM_READ_SIZE)
+                if not data:
+                    break
+                *records, pending = (pending + data).split(separator)
+                if records:
+                    self._parse_records_safely(records)
+            # Output after the last separator, if any
+            if pending.strip():
+                self._parse_records_safely([pending])
+            # End of output
+            self._parse_records_safely([])
+        self.streamed = True
+
+    def _parse_records_safely(self, records):
+        """
+        Call `parse_records`, logging any error instead of
+        stopping the reader
+
+        Parameters
+        ----------
+        records : List[bytes]
+            Complete records read from the utility
+        """
+        try:
+            self.parse_records(records)
+        except Exception as error:  # pylint: disable=broad-except
+            ns_name = TopologyMap.get_node(self.ns_id).name
+            self.logger.error(
+                "Parsing the output of %s at %s. %s",
+                type(self).__name__,
+                ns_name,
+                error,
+            )
+
+    def parse_records(self, records):
+        """
+        Parse records output by the utility while it runs. Called with
+        an empty list once the output ends. Runners whose output can be
+        parsed while they run (See `can_stream`) override this; it
+        does nothing by default.
+
+        Parameters
+        ----------
+        records : List[bytes]
+            Complete records (without `STREAM_SEPARATOR`) read at once
+        """
+
     def print_error(self, error_string_prefix):
         """
         Method to print error from `self.err`
@@ -96,6 +235,17 @@ class Runner:
         ns_name = TopologyMap.get_node(self.ns_id).name
         self.logger.error("%s at %s. %s", error_string_prefix, ns_name, error)
 
+    def get_output_size(self):
+        """
+        Size (in bytes) of the output to be parsed. Used to parse
+        the largest outputs first.
+
+        Returns
+        -------
+        int
+        """
+        return os.fstat(self.out.fileno()).st_size
+
     def get_meta_item(self):
         """
         Return the meta item for the given flow.
@@ -110,6 +260,9 @@ class Runner:
         if self.dst_ns is not None:
             meta_item["destination_node"] = TopologyMap.get_node(self.dst_ns).name
 
+        if self.start_skew is not None:
+            meta_item["start_skew"] = str(self.start_skew)
+
         return meta_item
 
     def __del__(self):
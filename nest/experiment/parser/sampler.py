@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Base class for runners which sample stats from the kernel directly,
+from a thread of the experiment process
+"""
+
+import time
+from nest.topology_map import TopologyMap
+from ..clock import ExperimentClock
+from .runnerbase import Runner
+
+
+class SamplerRunner(Runner):
+    """
+    Base class for in-process samplers
+
+    In adaptive mode, the interval is doubled (up to `max_interval`)
+    after every sample in which the stats didn't change much, and reset
+    to `interval` whenever they do, or when the experiment is close to
+    one of the `events` (For eg., flows starting or stopping).
+
+    Attributes
+    ----------
+    interval : float
+        Time (in seconds) between two samples
+    max_interval : float/None
+        Longest time (in seconds) between two samples in adaptive mode.
+        None if sampling isn't adaptive.
+    events : List[num]
+        Times (since the start of the experiment) around which stats are
+        sampled every `interval` seconds, in adaptive mode
+    """
+
+    # Relative change in any of the stats which is treated as a transient
+    CHANGE_THRESHOLD = 0.1
+
+    # Time (in seconds) on either side of an event, treated as a transient
+    EVENT_WINDOW = 1
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, ns_id, start_time, run_time, interval, destination_ip="::1", dst_ns=None
+    ):
+        """
+        Parameters
+        ----------
+        ns_id : str
+            Namespace to sample stats from
+        start_time : num
+            Time at which sampling starts
+        run_time : num
+            Total time to sample for
+        interval : float
+            Time (in seconds) between two samples
+        destination_ip : str
+            ip address of the destination namespace
+        dst_ns : str
+            Destination namespace
+        """
+        super().__init__(ns_id, start_time, run_time, destination_ip, dst_ns)
+        self.interval = interval
+        self.max_interval = None
+        self.events = []
+
+    def set_adaptive(self, max_interval, events=()):
+        """
+        Sample adaptively, instead of every `self.interval` seconds
+
+        Parameters
+        ----------
+        max_interval : float
+            Longest time (in seconds) between two samples
+        events : List[num]
+            Times (since the start of the experiment) of transients
+        """
+        self.max_interval = max(max_interval, self.interval)
+        self.events = sorted(events)
+
+    def sample_periodically(self, sample, error_string_prefix="Error"):
+        """
+        Call `sample` every `self.interval` seconds (or adaptively), for
+        `self.run_time` seconds from now. Samples that can't be taken on
+        time are skipped, instead of being taken in a burst.
+
+        Parameters
+        ----------
+        sample : Callable
+            Function (taking no arguments) taking one sample, and returning
+            a dict of the stats to be watched for changes (in adaptive mode)
+        error_string_prefix : str
+            Logged along with the error, if `sample` fails
+        """
+        interval = self.interval
+        previous = None
+        next_sample = time.monotonic()
+        stop = next_sample + self.run_time
+        while next_sample <= stop:
+            try:
+                current = sample()
+            except OSError as error:
+                self.log_error(error_string_prefix, error)
+                return
+
+            if self.max_interval is not None:
+                interval = self._next_interval(interval, previous, current)
+                previous = current
+
+            next_sample += interval
+            now = time.monotonic()
+            if now > next_sample:
+                next_sample += (now - next_sample) // interval * interval
+                next_sample += interval
+            if not ExperimentClock.sleep(next_sample - now):
+                return
+
+    def _next_interval(self, interval, previous, current):
+        """
+        Interval till the next sample, in adaptive mode
+
+        Parameters
+        ----------
+        interval : float
+            Interval till the current sample
+        previous : dict/None
+            Stats watched in the previous sample
+        current : dict/None
+            Stats watched in the current sample
+
+        Returns
+        -------
+        float
+        """
+        elapsed = ExperimentClock.elapsed()
+        if elapsed is not None:
+            # Sample fast till the next sample is past the events nearby
+            window = SamplerRunner.EVENT_WINDOW + interval
+            for event in self.events:
+                if abs(event - elapsed) <= window:
+                    return self.interval
+
+        if previous is None or current is None or previous.keys() != current.keys():
+            return self.interval
+        for key, value in current.items():
+            old_value = previous[key]
+            scale = max(abs(value), abs(old_value))
+            if (
+                scale
+                and abs(value - old_value) > SamplerRunner.CHANGE_THRESHOLD * scale
+            ):
+                return self.interval
+
+        return min(interval * 2, self.max_interval)
+
+    def get_output_size(self):
+        """
+        Sampled stats are already decoded, hence cheap to parse
+
+        Returns
+        -------
+        int
+        """
+        return 0
+
+    def log_error(self, error_string_prefix, error):
+        """
+        Log an error raised while sampling
+
+        Parameters
+        ----------
+        error_string_prefix : str
+            Description of the sampler
+        error : Exception
+            Error raised
+        """
+        ns_name = TopologyMap.get_node(self.ns_id).name
+        self.logger.error("%s at %s. %s", error_string_prefix, ns_name, error)
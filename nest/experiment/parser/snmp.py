@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Samples the kernel SNMP and netstat counters of a namespace
+(`/proc/net/snmp`, `/proc/net/netstat` and `/proc/net/snmp6`)
+"""
+
+import time
+from functools import partial
+import numpy as np
+from nest import config
+from nest.engine.setns import ns_context
+from nest.experiment.interrupts import handle_keyboard_interrupt
+from ..results import SnmpResults
+from .sampler import SamplerRunner
+
+# Counter files, and whether the counters are listed as a header line
+# followed by a value line (True), or as one counter per line (False)
+COUNTER_FILES = {
+    "snmp": True,
+    "netstat": True,
+    "snmp6": False,
+}
+
+
+def parse_counters(content, paired_lines):
+    """
+    Parse the content of a counter file
+
+    Parameters
+    ----------
+    content : str
+        Content of the file
+    paired_lines : bool
+        Whether the counters are listed as header and value lines, like
+        `/proc/net/snmp` (else one counter per line, like `/proc/net/snmp6`)
+
+    Returns
+    -------
+    dict
+        Counter name (prefixed with the protocol, For eg., "TcpRetransSegs")
+        mapped to its value
+    """
+    counters = {}
+    lines = content.splitlines()
+    if not paired_lines:
+        for line in lines:
+            fields = line.split()
+            if len(fields) == 2:
+                counters[fields[0]] = int(fields[1])
+        return counters
+
+    for header, values in zip(lines[::2], lines[1::2]):
+        names = header.split()
+        numbers = values.split()
+        prefix = names[0].rstrip(":")
+        for name, value in zip(names[1:], numbers[1:]):
+            counters[prefix + name] = int(value)
+    return counters
+
+
+class SnmpRunner(SamplerRunner):
+    """
+    Samples the SNMP and netstat counters of a namespace from the
+    experiment process. The counter files are opened once, inside the
+    namespace, and re-read at every sample.
+
+    Attributes
+    ----------
+    stats : List[str]
+        Counters to be stored. If empty, all the counters which changed
+        during the experiment are stored.
+    timestamps : List[float]
+        Time at which each sample was taken
+    samples : List[dict]
+        Counters at each sample
+    """
+
+    # Counters plotted, unless specific counters are requested
+    PLOTTED_COUNTERS = [
+        "TcpRetransSegs",
+        "TcpExtTCPOFOQueue",
+        "TcpExtTCPSACKReorder",
+        "TcpExtTCPSackRecovery",
+        "TcpExtListenOverflows",
+        "TcpExtListenDrops",
+        "UdpInErrors",
+        "UdpRcvbufErrors",
+        "UdpSndbufErrors",
+        "Udp6InErrors",
+        "Udp6RcvbufErrors",
+    ]
+
+    def __init__(self, ns_id, run_time, stats=None, interval=None):
+        """
+        Constructor to initialize the SNMP counter runner
+
+        Parameters
+        ----------
+        ns_id : str
+            network namespace to sample counters from
+        run_time : num
+            total time to sample counters for
+        stats : List[str]
+            counters to be stored (all changed counters if empty)
+        interval : float
+            time (in seconds) between two samples
+            (Default value = `snmp_stats_interval` config)
+        """
+        if interval is None:
+            interval = config.get_value("snmp_stats_interval")
+
+        # Start sampling from 0s
+        super().__init__(ns_id, 0, run_time, interval)
+        self.stats = list(dict.fromkeys(stats or []))
+        self.timestamps = []
+        self.samples = []
+
+    def run(self):
+        """
+        Samples the counters from t=0 till `self.run_time`
+        """
+        if not self.wait_for_start():
+            return
+
+        files = {}
+        try:
+            with ns_context(self.ns_id):
+                for name, paired_lines in COUNTER_FILES.items():
+                    try:
+                        # pylint: disable=consider-using-with
+                        files[name] = (
+                            open(f"/proc/thread-self/net/{name}", "rb"),
+                            paired_lines,
+                        )
+                    except FileNotFoundError:
+                        # For eg., IPv6 is disabled
+                        pass
+        except (OSError, ValueError) as error:
+            self.log_error("Collecting SNMP counters", error)
+            for file, _ in files.values():
+                file.close()
+            return
+
+        try:
+            self.sample_periodically(
+                partial(self._sample, files.values()),
+                error_string_prefix="Collecting SNMP counters",
+            )
+        finally:
+            for file, _ in files.values():
+                file.close()
+
+    def _sample(self, files):
+        """
+        Take one sample of all the counters
+
+        Parameters
+        ----------
+        files : List[Tuple(File, bool)]
+            Open counter files, and their format
+
+        Returns
+        -------
+        dict
+            Change in the plotted counters since the previous sample,
+            to detect transients
+        """
+        timestamp = time.time()
+        counters = {}
+        for file, paired_lines in files:
+            file.seek(0)
+            counters.update(parse_counters(file.read().decode(), paired_lines))
+
+        previous = self.samples[-1] if self.samples else counters
+        self.timestamps.append(timestamp)
+        self.samples.append(counters)
+        return {
+            name: counters[name] - previous.get(name, 0)
+            for name in SnmpRunner.PLOTTED_COUNTERS
+            if name in counters
+        }
+
+    @handle_keyboard_interrupt
+    def parse(self):
+        """
+        Stores the change in counters over every interval
+        """
+        if len(self.samples) < 2:
+            return
+
+        names = self.stats or sorted(self.samples[0])
+        values = np.array(
+            [[sample.get(name, 0) for name in names] for sample in self.samples],
+            dtype=np.int64,
+        )
+        deltas = np.diff(values, axis=0)
+
+        if not self.stats:
+            # Only the counters which changed during the experiment
+            changed = deltas.any(axis=0)
+            names = [name for name, keep in zip(names, changed) if keep]
+            deltas = deltas[:, changed]
+
+        SnmpResults.add_result(
+            self.ns_id,
+            {
+                "meta": {
+                    "start_timestamp": self.timestamps[0],
+                    "stats": self.stats,
+                },
+                "timestamp": self.timestamps[1:],
+                "counters": {
+                    name: deltas[:, index].tolist() for index, name in enumerate(names)
+                },
+            },
+        )
@@ -0,0 +1,511 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Collects TCP socket stats by querying the kernel over
+NETLINK_SOCK_DIAG, instead of running `ss` periodically
+"""
+
+import re
+import socket
+import struct
+import time
+from functools import partial
+from nest import config
+from nest.engine.netlink import NetlinkSocket, NETLINK_SOCK_DIAG, parse_attrs
+from nest.engine.netlink import pack_attr, parse_string
+from nest.engine.setns import ns_context
+from nest.experiment.interrupts import handle_keyboard_interrupt
+from nest.topology_map import TopologyMap
+from ..clock import ExperimentClock
+from ..live import LiveFeed, sample_key
+from ..results import SsResults
+from ..series import SeriesBuilder
+from .sampler import SamplerRunner
+
+SOCK_DIAG_BY_FAMILY = 20
+
+# Request attribute
+INET_DIAG_REQ_BYTECODE = 1
+
+# Reply attributes
+INET_DIAG_INFO = 2
+INET_DIAG_VEGASINFO = 3
+INET_DIAG_CONG = 4
+INET_DIAG_BBRINFO = 16
+
+# Filter (bytecode) operations
+INET_DIAG_BC_JMP = 1
+INET_DIAG_BC_S_COND = 7
+INET_DIAG_BC_D_COND = 8
+
+# TCP states, as numbered by the kernel
+TCP_STATES = {
+    "established": 1,
+    "syn-sent": 2,
+    "syn-recv": 3,
+    "fin-wait-1": 4,
+    "fin-wait-2": 5,
+    "time-wait": 6,
+    "close": 7,
+    "close-wait": 8,
+    "last-ack": 9,
+    "listen": 10,
+    "closing": 11,
+}
+
+# States reported by `ss` when no state filter is given
+DEFAULT_STATES = ((1 << 12) - 1) & ~sum(
+    1 << TCP_STATES[state] for state in ("listen", "close", "time-wait", "syn-recv")
+)
+
+# struct inet_diag_req_v2 (excluding struct inet_diag_sockid)
+_REQUEST = struct.Struct("=BBBxI")
+
+# struct inet_diag_bc_op: code, jump if true, jump if false
+_BC_OP = struct.Struct("=BBH")
+
+# struct inet_diag_hostcond: family, prefix length, port
+_HOSTCOND = struct.Struct("=BBxxi")
+
+# struct inet_diag_msg is followed by the attributes
+_DIAG_MSG_SIZE = 72
+
+# struct tcp_info, till `tcpi_delivered_ce`
+_TCP_INFO = struct.Struct("=8B24I4Q6IQ3Q2I")
+
+# struct tcp_bbr_info
+_BBR_INFO = struct.Struct("=5I")
+
+# Indices of the required fields in `_TCP_INFO`
+_RTO = 8
+_UNACKED = 12
+_LOST = 14
+_RTT = 23
+_RTTVAR = 24
+_SND_SSTHRESH = 25
+_SND_CWND = 26
+_TOTAL_RETRANS = 31
+_PACING_RATE = 32
+_BYTES_ACKED = 34
+_MIN_RTT = 39
+_DELIVERY_RATE = 42
+_DELIVERED = 46
+
+
+def _hostcond(code, family, prefix_len, port, addr=b""):
+    """
+    Filter matching the source/destination address and port of a socket
+
+    Parameters
+    ----------
+    code : int
+        `INET_DIAG_BC_S_COND` or `INET_DIAG_BC_D_COND`
+    family : int
+        Address family. `AF_UNSPEC` matches only the port.
+    prefix_len : int
+        Number of bits of `addr` to be matched
+    port : int
+        Port to be matched (-1 matches any port)
+    addr : bytes
+        Address in network byte order
+
+    Returns
+    -------
+    bytes
+    """
+    length = _BC_OP.size + _HOSTCOND.size + len(addr)
+    # Jump to the next operation on a match, else reject
+    return (
+        _BC_OP.pack(code, length, length + 4)
+        + _HOSTCOND.pack(family, prefix_len, port)
+        + addr
+    )
+
+
+def _bc_or(first, second):
+    """Filter matching either `first` or `second`"""
+    # `first` rejects by jumping to the start of `second`
+    return first + _BC_OP.pack(INET_DIAG_BC_JMP, 4, len(second) + 4) + second
+
+
+def _bc_not(code):
+    """Filter matching sockets not matched by `code`"""
+    # A socket reaching the end of `code` jumps past the end (rejected),
+    # while a socket rejected by `code` lands right after the jump
+    return code + _BC_OP.pack(INET_DIAG_BC_JMP, 4, 8)
+
+
+def _bc_and(first, second):
+    """Filter matching both `first` and `second`"""
+    # Rejections in `first` are moved past the end of `second`
+    first = bytearray(first)
+    offset = 0
+    while offset < len(first):
+        code, yes, no = _BC_OP.unpack_from(first, offset)
+        if no == len(first) - offset + 4:
+            _BC_OP.pack_into(first, offset, code, yes, no + len(second))
+        offset += yes
+    return bytes(first) + second
+
+
+def _bc_any(conditions, combine):
+    """Combine `conditions` from right to left with `combine`"""
+    code = conditions[-1]
+    for condition in reversed(conditions[:-1]):
+        code = combine(condition, code)
+    return code
+
+
+def build_filter(family, destinations, excluded_ports):
+    """
+    Build the kernel side filter (inet_diag bytecode) selecting sockets
+    connected to any of `destinations`, and not using any of the
+    `excluded_ports`
+
+    Parameters
+    ----------
+    family : int
+        `AF_INET` or `AF_INET6`
+    destinations : List[str]
+        Destination addresses
+    excluded_ports : List[Tuple(str, int)]
+        "sport"/"dport" and the port to be excluded
+
+    Returns
+    -------
+    bytes
+    """
+    addr_len = 4 if family == socket.AF_INET else 16
+    code = _bc_any(
+        [
+            _hostcond(
+                INET_DIAG_BC_D_COND,
+                family,
+                addr_len * 8,
+                -1,
+                socket.inet_pton(family, destination),
+            )
+            for destination in destinations
+        ],
+        _bc_or,
+    )
+    for side, port in excluded_ports:
+        cond = INET_DIAG_BC_S_COND if side == "sport" else INET_DIAG_BC_D_COND
+        code = _bc_and(code, _bc_not(_hostcond(cond, socket.AF_UNSPEC, 0, port)))
+    return code
+
+
+def parse_ss_filter(ss_filter):
+    """
+    Convert the `ss` filter used by NeST into excluded ports and states
+
+    Only the expressions NeST generates are understood, i.e.,
+    "sport != <port>", "dport != <port>" and "exclude <state>",
+    joined with "and".
+
+    Parameters
+    ----------
+    ss_filter : str
+        Filter passed to `ss`
+
+    Returns
+    -------
+    (List[Tuple(str, int)], int)
+        Excluded ports and bitmask of the TCP states to be reported
+    """
+    excluded_ports = [
+        (side, int(port))
+        for side, port in re.findall(r"\b([sd]port)\s*!=\s*:?(\d+)", ss_filter)
+    ]
+    states = DEFAULT_STATES
+    for state in re.findall(r"\bexclude\s+([\w-]+)", ss_filter):
+        states &= ~(1 << TCP_STATES[state])
+    return excluded_ports, states
+
+
+def decode_tcp_info(info, cong=None, bbr_info=None):
+    """
+    Convert `struct tcp_info` into a record with the same parameters
+    (and units) as parsed from `ss`
+
+    Parameters
+    ----------
+    info : bytes/memoryview
+        Value of the INET_DIAG_INFO attribute
+    cong : bytes/memoryview
+        Value of the INET_DIAG_CONG attribute
+    bbr_info : bytes/memoryview
+        Value of the INET_DIAG_BBRINFO attribute
+
+    Returns
+    -------
+    dict
+    """
+    info = bytes(info)
+    if len(info) < _TCP_INFO.size:
+        # Fields not supported by older kernels are read as 0
+        info += bytes(_TCP_INFO.size - len(info))
+    fields = _TCP_INFO.unpack_from(info)
+
+    record = {
+        "cwnd": fields[_SND_CWND],
+        "rtt": fields[_RTT] / 1000,
+        "dev_rtt": fields[_RTTVAR] / 1000,
+        "min_rtt": fields[_MIN_RTT] / 1000,
+        "unacked": fields[_UNACKED],
+        "lost": fields[_LOST],
+        "retrans": fields[_TOTAL_RETRANS],
+        "bytes_acked": fields[_BYTES_ACKED],
+    }
+    # Same conditions as `ss`, for the parameters it omits
+    if fields[_SND_SSTHRESH] < 0xFFFF:
+        record["ssthresh"] = fields[_SND_SSTHRESH]
+    if fields[_RTO] and fields[_RTO] != 3000000:
+        record["rto"] = fields[_RTO] / 1000
+    if fields[_DELIVERY_RATE]:
+        record["delivery_rate"] = fields[_DELIVERY_RATE] * 8 / 1e6
+    if fields[_PACING_RATE] and fields[_PACING_RATE] != (1 << 64) - 1:
+        record["pacing_rate"] = fields[_PACING_RATE] * 8 / 1e6
+    if fields[_DELIVERED]:
+        record["delivered"] = fields[_DELIVERED]
+
+    if cong is not None:
+        record["cong"] = parse_string(cong)
+    if bbr_info is not None and len(bbr_info) >= _BBR_INFO.size:
+        bw_lo, bw_hi, min_rtt, pacing_gain, cwnd_gain = _BBR_INFO.unpack_from(bbr_info)
+        record["bbr_bw"] = ((bw_hi << 32) | bw_lo) * 8 / 1e6
+        record["bbr_min_rtt"] = min_rtt / 1000
+        record["bbr_pacing_gain"] = pacing_gain / 256
+        record["bbr_cwnd_gain"] = cwnd_gain / 256
+
+    return record
+
+
+class SockDiagRunner(SamplerRunner):
+    """
+    Samples TCP socket stats of all the flows from a namespace, to any
+    number of destinations, from a single thread. The results are stored
+    in the same format as `SsRunner`.
+
+    Attributes
+    ----------
+    destinations : dict
+        Destination address mapped to (destination namespace,
+        start time, stop time)
+    excluded_ports : List[Tuple(str, int)]
+        Ports of the sockets which are not sampled
+    states : int
+        Bitmask of TCP states of the sockets which are sampled
+    samples : dict
+        Destination address mapped to destination port mapped
+        to the `SeriesBuilder` collecting its samples
+    """
+
+    def __init__(self, ns_id, destinations, ss_filter="", interval=None):
+        """
+        Constructor to initialize the sock_diag runner
+
+        Parameters
+        ----------
+        ns_id : str
+            network namespace to collect socket stats from
+        destinations : List[Tuple(str, str, num, num)]
+            Destination namespace, destination address, start time and
+            stop time for every destination
+        ss_filter : str
+            `ss` filter to exclude connections
+        interval : float
+            Time (in seconds) between two samples
+            (Default value = `socket_stats_interval` config)
+        """
+        self.destinations = {}
+        for dst_ns, dst_addr, start_t, stop_t in destinations:
+            # Same format as the addresses in the replies
+            family = socket.AF_INET6 if ":" in dst_addr else socket.AF_INET
+            dst_addr = socket.inet_ntop(family, socket.inet_pton(family, dst_addr))
+            self.destinations[dst_addr] = (dst_ns, start_t, stop_t)
+
+        start_time = min(timing[1] for timing in self.destinations.values())
+        stop_time = max(timing[2] for timing in self.destinations.values())
+        if interval is None:
+            interval = config.get_value("socket_stats_interval")
+        super().__init__(
+            ns_id, start_time, stop_time - start_time, interval, destinations[0][1]
+        )
+
+        self.excluded_ports, self.states = parse_ss_filter(ss_filter)
+        self.samples = {}
+
+    def _get_requests(self):
+        """
+        Dump requests, one for each address family of the destinations
+
+        Returns
+        -------
+        List[bytes]
+        """
+        requests = []
+        for family in (socket.AF_INET, socket.AF_INET6):
+            destinations = [
+                addr
+                for addr in self.destinations
+                if (":" in addr) == (family == socket.AF_INET6)
+            ]
+            if not destinations:
+                continue
+            ext = (
+                1 << (INET_DIAG_INFO - 1)
+                | 1 << (INET_DIAG_VEGASINFO - 1)
+                | 1 << (INET_DIAG_CONG - 1)
+            )
+            requests.append(
+                _REQUEST.pack(family, socket.IPPROTO_TCP, ext, self.states)
+                # Wildcard struct inet_diag_sockid
+                + bytes(40)
+                + struct.pack("=II", 0xFFFFFFFF, 0xFFFFFFFF)
+                + pack_attr(
+                    INET_DIAG_REQ_BYTECODE,
+                    build_filter(family, destinations, self.excluded_ports),
+                )
+            )
+        return requests
+
+    def run(self):
+        """
+        Samples socket stats from t=`self.start_time` till the last
+        destination's stop time
+        """
+        if not self.wait_for_start():
+            return
+        self.start_skew = ExperimentClock.skew(self.start_time)
+
+        try:
+            with ns_context(self.ns_id):
+                sock = NetlinkSocket(NETLINK_SOCK_DIAG)
+        except (OSError, ValueError) as error:
+            self.log_error("Collecting socket stats", error)
+            return
+
+        requests = self._get_requests()
+        with sock:
+            self.sample_periodically(
+                partial(self._sample, sock, requests),
+                error_string_prefix="Collecting socket stats",
+            )
+
+    def _decode_socket(self, msg, elapsed):
+        """
+        Decode the stats of a socket, if it is to be sampled
+
+        Parameters
+        ----------
+        msg : memoryview
+            struct inet_diag_msg of the socket, followed by its attributes
+        elapsed : float or None
+            Time since the start of the experiment
+
+        Returns
+        -------
+        (str, int, int, dict) or None
+            Destination address, source and destination ports, and the
+            record of the socket. None if the socket isn't sampled now.
+        """
+        family = msg[0]
+        src_port, dst_port = struct.unpack_from("!HH", msg, 4)
+        addr_len = 4 if family == socket.AF_INET else 16
+        dst_addr = socket.inet_ntop(family, bytes(msg[24 : 24 + addr_len]))
+
+        # Same time window as `ss` would be run for
+        _, start_t, stop_t = self.destinations.get(dst_addr, (None, None, None))
+        if start_t is None or (
+            elapsed is not None and not start_t <= elapsed <= stop_t
+        ):
+            return None
+
+        attrs = parse_attrs(msg, _DIAG_MSG_SIZE)
+        if INET_DIAG_INFO not in attrs:
+            return None
+        record = decode_tcp_info(
+            attrs[INET_DIAG_INFO],
+            attrs.get(INET_DIAG_CONG),
+            attrs.get(INET_DIAG_BBRINFO),
+        )
+        return dst_addr, src_port, dst_port, record
+
+    def _sample(self, sock, requests):
+        """
+        Take one sample of all the matching sockets
+
+        Parameters
+        ----------
+        sock : NetlinkSocket
+            NETLINK_SOCK_DIAG socket in the namespace
+        requests : List[bytes]
+            Dump requests
+
+        Returns
+        -------
+        dict
+            cwnd and rtt of every socket, to detect transients
+        """
+        timestamp = time.time()
+        elapsed = ExperimentClock.elapsed()
+        watched = {}
+        for request in requests:
+            for _, msg in sock.dump(SOCK_DIAG_BY_FAMILY, request):
+                decoded = self._decode_socket(msg, elapsed)
+                if decoded is None:
+                    continue
+                dst_addr, src_port, dst_port, record = decoded
+
+                flows = self.samples.setdefault(dst_addr, {})
+                if str(dst_port) not in flows:
+                    flows[str(dst_port)] = SeriesBuilder()
+                flows[str(dst_port)].append(timestamp, record)
+                if LiveFeed.enabled:
+                    LiveFeed.add_sample(
+                        sample_key("ss", self.ns_id, dst_addr, str(dst_port)),
+                        {"timestamp": timestamp, **record},
+                    )
+
+                flow = (dst_addr, src_port, dst_port)
+                watched[flow + ("cwnd",)] = record["cwnd"]
+                watched[flow + ("rtt",)] = record["rtt"]
+        return watched
+
+    def _get_meta_item(self, dst_addr):
+        """
+        Return the meta item for flows to `dst_addr`
+
+        Parameters
+        ----------
+        dst_addr : str
+            Destination address
+
+        Returns
+        -------
+        dict
+        """
+        dst_ns, start_t, stop_t = self.destinations[dst_addr]
+        meta_item = {
+            "meta": True,
+            "start_time": str(start_t),
+            "stop_time": str(stop_t),
+            "destination_node": TopologyMap.get_node(dst_ns).name,
+        }
+        if self.start_skew is not None:
+            meta_item["start_skew"] = str(self.start_skew)
+        return meta_item
+
+    @handle_keyboard_interrupt
+    def parse(self):
+        """
+        Stores the sampled records, one result per destination
+        """
+        for dst_addr, flows in self.samples.items():
+            stats_dict_list = {}
+            for dst_port, builder in flows.items():
+                builder.meta = self._get_meta_item(dst_addr)
+                stats_dict_list[dst_port] = builder.build()
+            SsResults.add_result(self.ns_id, {dst_addr: stats_dict_list})
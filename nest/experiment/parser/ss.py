@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: GPL-2.0-only
-# Copyright (c) 2019-2024 NITK Surathkal
+# Copyright (c) 2019-2026 NITK Surathkal
 
 """
 Runs ss command and parses socket stats from
@@ -9,11 +9,159 @@ its output
 import os
 import re
 from functools import partial
+from nest import config
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from ..results import SsResults
+from ..series import SeriesBuilder
 from .runnerbase import Runner
 from ...engine.iterators import run_ss
 
+# Rates are printed as <value><unit>, For eg., 10.5Mbps
+_RATE = re.compile(r"([0-9.]+)([KMGT]?)bps")
+_RATE_SCALE = {"": 1e-6, "K": 1e-3, "M": 1, "G": 1e3, "T": 1e6}
+
+
+def _rate(value):
+    """Convert a rate printed by ss to Mbps"""
+    match = _RATE.fullmatch(value)
+    return float(match.group(1)) * _RATE_SCALE[match.group(2)]
+
+
+def _total_retrans(value):
+    """Total retransmissions, from <retransmitting>/<total>"""
+    return int(value.rpartition("/")[2])
+
+
+# "<field>:<value>" of ss mapped to the name and type of the parameter.
+# Names are the same as those used by the sock_diag collector.
+_SS_FIELDS = {
+    "cwnd": ("cwnd", int),
+    "snd_wnd": ("rwnd", int),
+    "ssthresh": ("ssthresh", int),
+    "rto": ("rto", float),
+    "minrtt": ("min_rtt", float),
+    "unacked": ("unacked", int),
+    "lost": ("lost", int),
+    "retrans": ("retrans", _total_retrans),
+    "bytes_acked": ("bytes_acked", int),
+    "delivered": ("delivered", int),
+    "delivery_rate": ("delivery_rate", _rate),
+    "pacing_rate": ("pacing_rate", _rate),
+}
+
+# Fields of "bbr:(...)"
+_BBR_FIELDS = {
+    "bw": ("bbr_bw", _rate),
+    "mrtt": ("bbr_min_rtt", float),
+    "pacing_gain": ("bbr_pacing_gain", float),
+    "cwnd_gain": ("bbr_cwnd_gain", float),
+}
+
+# All the fields parsed, in a single scan of the line. Rates are printed
+# as "<field> <value>", the rest as "<field>:<value>"
+_SS_FIELD = re.compile(
+    r"\s(?:("
+    + "|".join(field for field in _SS_FIELDS if not field.endswith("_rate"))
+    + r"|rtt|bbr):|(delivery_rate|pacing_rate) )(\S+)|\s(app_limited)(?!\S)"
+)
+
+# Congestion control algorithm, printed after the options (if any)
+_SS_CONG = re.compile(r"\s*(?:(?:ts|sack|ecn|ecnseen|fastopen|tfo)\s+)*(\w+)(?!\S)")
+
+
+def parse_ss_stats(line):
+    """
+    Parse the stats of a socket, printed by `ss -i` (in a single scan)
+
+    Parameters
+    ----------
+    line : str
+        Line with the internal TCP information of the socket
+
+    Returns
+    -------
+    dict
+        Parsed parameters. Parameters not printed by ss are left out.
+    """
+    record = {}
+    match = _SS_CONG.match(line)
+    if match:
+        record["cong"] = match.group(1)
+
+    for field, rate_field, value, flag in _SS_FIELD.findall(line):
+        try:
+            if flag:
+                record[flag] = True
+            elif field == "bbr":
+                for bbr_field in value.strip("()").split(","):
+                    name, _, bbr_value = bbr_field.partition(":")
+                    if name in _BBR_FIELDS:
+                        key, convert = _BBR_FIELDS[name]
+                        record[key] = convert(bbr_value)
+            elif field == "rtt":
+                # RTT has both average and RTT deviation separated by a /
+                avg_rtt, _, dev_rtt = value.partition("/")
+                record["rtt"] = float(avg_rtt)
+                record["dev_rtt"] = float(dev_rtt)
+            else:
+                key, convert = _SS_FIELDS[field or rate_field]
+                record[key] = convert(value)
+        except (ValueError, AttributeError):
+            # Not in the expected format
+            pass
+    return record
+
+
+def parse_ss_output(out, destination_ip, meta_item):
+    """
+    Parse the output of the ss iterator, line by line
+
+    Parameters
+    ----------
+    out : File
+        Output of the ss iterator (See `iterators/ss.sh` for the format)
+    destination_ip : str
+        Only connections to this address are parsed
+    meta_item : dict
+        "meta" item of every connection
+
+    Returns
+    -------
+    dict
+        Destination port mapped to the stats of the connection
+        (`FlowSeries`), with the given "meta" item
+    """
+    builders = {}
+    timestamp = None
+
+    # iperf3 creates 1 additional connection (apart from the N connections
+    # for the N flows specified) every time you run the iperf3 command.
+    # All the entries are needed in order to obtain ss plots for
+    # MpegDashApplication, hence the additional connection isn't ignored.
+    dst_port = None
+    for raw_line in out:
+        line = raw_line.decode()
+        if not line.strip():
+            continue
+        if line[0] in " \t":
+            # Stats of the socket in the previous line
+            if dst_port is not None:
+                builders[dst_port].append(timestamp, parse_ss_stats(line))
+                dst_port = None
+        elif line.startswith("timestamp:"):
+            timestamp = line.rstrip().rpartition(":")[2]
+        elif line.startswith(("---", "State")):
+            dst_port = None
+        else:
+            # "<state> <recv-q> <send-q> <local address> <peer address>"
+            peer_ip, _, dst_port = line.split()[-1].rpartition(":")
+            # means that this entry was not meant for this stat collection
+            if peer_ip.strip("[]") != destination_ip:
+                dst_port = None
+            elif dst_port not in builders:
+                builders[dst_port] = SeriesBuilder(meta_item.copy())
+    return {dst_port: builder.build() for dst_port, builder in builders.items()}
+
 
 class SsRunner(Runner):
     """
@@ -24,7 +172,8 @@ class SsRunner(Runner):
     iterator : str
         absolute path of the ss iterator script
     param_list: list(str)
-        list of parameters to be parsed
+        list of parameters parsed (apart from "dev_rtt", "cong",
+        "app_limited" and the "bbr_" parameters)
     ns_id : str
         network namespace to run ss from
     destination_ip : str
@@ -33,22 +182,29 @@ class SsRunner(Runner):
         time at which ss is to be run
     run_time : num
         total time to run ss for
+    interval : float
+        time (in seconds) between two runs of ss
+    streamed_ports : set
+        Destination ports whose "meta" item is stored, when parsing
+        ss output while it runs
     """
 
+    # See `iterators/ss.sh` for output format
+    STREAM_SEPARATOR = b"---\n"
+
     iterator = os.path.realpath(os.path.dirname(__file__)) + "/iterators/ss.sh"
-    param_list = [
-        "cwnd",
-        "rwnd",
-        "rtt",
-        "ssthresh",
-        "rto",
-        "delivery_rate",
-        "pacing_rate",
-    ]
+    param_list = list(dict.fromkeys(name for name, _ in _SS_FIELDS.values()))
 
     # pylint: disable=too-many-arguments
     def __init__(
-        self, ns_id, destination_ip, start_time, run_time, dst_ns, ss_filter=""
+        self,
+        ns_id,
+        destination_ip,
+        start_time,
+        run_time,
+        dst_ns,
+        ss_filter="",
+        interval=None,
     ):
         """
         Constructor to initialize ss runner
@@ -67,14 +223,24 @@ class SsRunner(Runner):
             destination network namespace of ss
         ss_filter : str
             to filter output from specific connections.
+        interval : float
+            time (in seconds) between two runs of ss
+            (Default value = `socket_stats_interval` config)
         """
         self.filter = ss_filter
+        if interval is None:
+            interval = config.get_value("socket_stats_interval")
+        self.interval = interval
+        self.streamed_ports = set()
         super().__init__(ns_id, start_time, run_time, destination_ip, dst_ns)
 
     def run(self):
         """
-        Runs the ss iterator
+        Runs the ss iterator at t=`self.start_time`
         """
+        if not self.wait_for_start():
+            return
+
         super().run(
             partial(
                 run_ss,
@@ -83,110 +249,47 @@ class SsRunner(Runner):
                 self.destination_address.get_addr(with_subnet=False),
                 self.run_time,
                 f'"{self.filter}"',
-                self.start_time,
+                0,
                 self.destination_address.is_ipv6(),
+                self.interval,
             ),
             error_string_prefix="Collecting socket stats",
         )
 
-    # pylint: disable=too-many-locals
-    # pylint: disable=too-many-branches
     @handle_keyboard_interrupt
     def parse(self):
         """
         parses the required data from `self.out`
         """
-        stats_dict_list = {}
-
         self.out.seek(0)  # rewind to start of the temp file
 
-        # See `iterators/ss.h` for output format
-        raw_stats = self.out.read().decode().split("---")
-        destination_ip = self.destination_address.get_addr(with_subnet=False)
-
-        # iperf3 creates 1 additional connection (apart from the N connections
-        # for the N flows specified) every time you run the iperf3 command.
-        # This additional connection is used by iperf3 API iperf for collecting,
-        # sending, and printing intermediate results at specific intervals
-        # (https://github.com/esnet/iperf/blob/master/src/iperf_api.c#L3269).
-        # The ss parser will split each of the raw_stat data in new lines,
-        # and get rid of (ignore) the data from that 1 additional connection
-        # altogether based on the 'ato' parameter (which is present only in the
-        # additional connection that we do not want to collect stats from).
-        for raw_stat in raw_stats[:-1]:
-            stats = raw_stat.strip().split("\n")
-            timestamp = stats[0].split(":")[-1]
-            ports_info = []
-            statistics_data = []
-
-            for i, row in enumerate(stats[2:]):
-                if i % 2 == 0:
-                    ports_info.append(row.strip())
-                else:
-                    statistics_data.append(row.strip())
-            assert len(ports_info) == len(statistics_data)
-
-            for i in range(len(ports_info)):
-                # means that this is additional info entries and this data isn't required
-                # if "ato" in statistics_data[i]:
-                #     continue
-                # UPDATE: All the entries are needed in order to obtain
-                # ss plots for MpegDashApplication
-                each_ports_info = ports_info[i].split()
-
-                # means that this entry was not meant for this stat collection
-                if each_ports_info[-1].split(":")[0] != destination_ip:
-                    continue
-
-                dst_port = each_ports_info[-1].split(":")[-1]
-
-                if dst_port not in stats_dict_list:
-                    stats_dict_list[dst_port] = [self.get_meta_item()]
-                stats_dict_list[dst_port].append({"timestamp": timestamp})
-
-                for param in SsRunner.param_list:
-                    pattern = (
-                        r"\s"
-                        + re.escape(param)
-                        + r"[\s:](?P<value>\w+\.?\w*(?:[\/\,]\w+\.?\w*)*)\s"
-                    )
-                    # result list stores all the string that is matched by the `pattern`
-                    try:
-                        param_value = (
-                            re.search(pattern, statistics_data[i]).group(1).strip()
-                        )
-                    except AttributeError:
-                        continue
-
-                    if param_value.endswith("bps"):
-                        param_value = self.convert_to(param_value)
-                    try:
-                        # RTT has both average and RTT deviation separated by a /
-                        if param == "rtt":
-                            avg_rtt = param_value.split("/")[0]
-                            dev_rtt = param_value.split("/")[1]
-                            stats_dict_list[dst_port][-1]["rtt"] = avg_rtt
-                            stats_dict_list[dst_port][-1]["dev_rtt"] = dev_rtt
-                        else:
-                            stats_dict_list[dst_port][-1][param] = param_value
-                    except TypeError:
-                        pass
-
         destination_ip = self.destination_address.get_addr(with_subnet=False)
+        stats_dict_list = parse_ss_output(
+            self.out, destination_ip, self.get_meta_item()
+        )
         SsResults.add_result(self.ns_id, {destination_ip: stats_dict_list})
 
-    @staticmethod
-    def convert_to(param_value, unit_out="Mbps"):
+    def parse_records(self, records):
         """
-        Converts parameter value to specified unit [For bit per second]
+        Parse the samples output by the ss iterator while it runs
+
+        Parameters
+        ----------
+        records : List[bytes]
+            Samples read from the ss iterator at once
         """
-        converter = {"bps": 1, "Kbps": 1e3, "Mbps": 1e6, "Gbps": 1e9}
+        destination_ip = self.destination_address.get_addr(with_subnet=False)
+        lines = (line for record in records for line in record.splitlines())
+        stats_dict_list = parse_ss_output(lines, destination_ip, self.get_meta_item())
+        if records and not stats_dict_list:
+            return
 
-        # Extract value and unit
-        unit_in = re.sub(r"^\d*\.?\d*", "", param_value)
-        extracted_param_value = float(re.sub(r"[A-Za-z]*", "", param_value))
+        # The "meta" item is stored only with the first sample of a connection
+        for dst_port, stats_list in stats_dict_list.items():
+            if dst_port in self.streamed_ports:
+                stats_list.meta = None
+        self.streamed_ports.update(stats_dict_list)
 
-        converted_param_value = str(
-            extracted_param_value * converter[unit_in] / converter[unit_out]
+        SsResults.add_result(
+            self.ns_id, {destination_ip: stats_dict_list}, self.stream_id
         )
-        return converted_param_value
@@ -11,6 +11,7 @@ import json
 import os
 from functools import partial
 from time import strptime, strftime
+from nest import config
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from .runnerbase import Runner
 from ..results import TcResults
@@ -41,6 +42,10 @@ class TcRunner(Runner):
         dev id to collect tc stats from
     run_time : num
         total time to run tc for
+    stats : List[str]
+        stats to be stored (all stats if empty)
+    interval : float
+        time (in seconds) between two runs of tc
     """
 
     iterator = os.path.realpath(os.path.dirname(__file__)) + "/iterators/tc.sh"
@@ -60,7 +65,11 @@ class TcRunner(Runner):
     # Qdiscs supported prior to good JSON support in tc
     PRIOR_JSON_QDISCS_SUPPORTED = ["codel", "fq_codel", "pie"]
 
-    def __init__(self, ns_id, dev, qdisc, run_time):
+    # See `iterators/tc.sh` for output format
+    STREAM_SEPARATOR = b"---\n"
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, ns_id, dev, qdisc, run_time, stats=None, interval=None):
         """
         Constructor to initialize tc runner
 
@@ -74,9 +83,18 @@ class TcRunner(Runner):
             qdisc name [eg. 'codel', 'pie']
         run_time : num
             total time to run tc for
+        stats : List[str]
+            stats to be stored (all stats if empty)
+        interval : float
+            time (in seconds) between two runs of tc
+            (Default value = `qdisc_stats_interval` config)
         """
         self.dev = dev
         self.qdisc = qdisc
+        self.stats = set(stats or [])
+        if interval is None:
+            interval = config.get_value("qdisc_stats_interval")
+        self.interval = interval
 
         # Start parsing from 0s
         super().__init__(ns_id, 0, run_time)
@@ -121,10 +139,29 @@ class TcRunner(Runner):
         Runs the tc iterator
         """
         super().run(
-            partial(run_tc, self.ns_id, TcRunner.iterator, self.dev, self.run_time),
+            partial(
+                run_tc,
+                self.ns_id,
+                TcRunner.iterator,
+                self.dev,
+                self.run_time,
+                self.interval,
+            ),
             error_string_prefix="Collecting qdisc stats",
         )
 
+    def can_stream(self):
+        """
+        Output is parsed while tc runs only if tc has good JSON support
+
+        Returns
+        -------
+        bool
+        """
+        if self.check_tc_version_format() == "old_version_format":
+            return self.parsed_tc_version() >= TcRunner.JSON_SUPPORTED_VERSION
+        return True
+
     def get_qdisc_specific_params(self):
         """
         Parameters to be obtained for a specific qdisc
@@ -256,13 +293,32 @@ class TcRunner(Runner):
                         aggregate_stats[handle] = []
                     qdisc_stat = qdisc_stat["qlen"]
                     search_obj = qdisc_re[qdisc].search(qdisc_stat)
-                    stats_dict["timestamp"] = str(timestamp)
+                    stats_dict["timestamp"] = float(timestamp)
                     stats_dict["kind"] = qdisc
                     for param in qdisc_param[qdisc]:
                         stats_dict[param] = search_obj.group(param)
                     aggregate_stats[handle].append(stats_dict)
         return aggregate_stats
 
+    def _select_stats(self, stats_dict):
+        """
+        Keep only the stats required (See `stats`) in `stats_dict`
+
+        Parameters
+        ----------
+        stats_dict : dict
+            Stats of a qdisc at an instant
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            param: value
+            for param, value in stats_dict.items()
+            if param in ("timestamp", "kind") or param in self.stats
+        }
+
     def parsing_helper(self, raw_stats):
         """
         Parsing tc command on Linux kernel version
@@ -292,11 +348,13 @@ class TcRunner(Runner):
                     if handle not in aggregate_stats:
                         aggregate_stats[handle] = []
 
-                    stats_dict["timestamp"] = str(timestamp)
+                    stats_dict["timestamp"] = float(timestamp)
                     stats_dict.update(qdisc_stat)
                     stats_dict.pop("handle", None)
                     stats_dict.pop("options", None)
                     stats_dict.pop("parent", None)
+                    if self.stats:
+                        stats_dict = self._select_stats(stats_dict)
 
                     aggregate_stats[handle].append(stats_dict)
         return aggregate_stats
@@ -375,3 +433,22 @@ class TcRunner(Runner):
         # Store parsed results
         dev_name = TopologyMap.get_device(self.ns_id, self.dev).name
         TcResults.add_result(self.ns_id, {dev_name: aggregate_stats})
+
+    def parse_records(self, records):
+        """
+        Parse the samples output by the tc iterator while it runs
+
+        Parameters
+        ----------
+        records : List[bytes]
+            Samples read from the tc iterator at once
+        """
+        # `parsing_helper` ignores the output after the last separator
+        aggregate_stats = self.parsing_helper(
+            [record.decode() for record in records] + [""]
+        )
+        if records and not aggregate_stats:
+            return
+
+        dev_name = TopologyMap.get_device(self.ns_id, self.dev).name
+        TcResults.add_result(self.ns_id, {dev_name: aggregate_stats}, self.stream_id)
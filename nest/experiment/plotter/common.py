@@ -7,11 +7,13 @@ import random
 import os
 import numpy as np
 import matplotlib.pyplot as plt
-from nest.engine.gnuplot import build_gnuplot
-from ..pack import Pack
+from nest import config
+from .downsample import common_grid, downsample
+from .render import run_gnuplot
 
 
-def simple_plot(title, x_list, y_list, labels, legend_string=None):
+# pylint: disable=too-many-arguments
+def simple_plot(title, x_list, y_list, labels, legend_string=None, fig=None):
     """
     Plot values
 
@@ -28,15 +30,19 @@ def simple_plot(title, x_list, y_list, labels, legend_string=None):
 
     legend_string : None/str
         If a string, then have a legend in the plot
+    fig : matplotlib.pyplot.fig
+        Figure to draw on (Default: a new figure)
 
     Returns
     -------
     matplotlib.plt.fig
         fig of plot
     """
-    fig = plt.figure()
+    if fig is None:
+        fig = plt.figure()
     axis = fig.add_subplot(1, 1, 1)
-    axis.plot(x_list, y_list)
+    # At most `plot_max_points` points are drawn
+    axis.plot(*downsample(x_list, y_list))
     axis.set_xlabel(labels[0])
     axis.set_ylabel(labels[1])
     axis.set_title(title)
@@ -47,7 +53,7 @@ def simple_plot(title, x_list, y_list, labels, legend_string=None):
     return fig
 
 
-def mix_plot(title, data, labels, with_sum=False):
+def mix_plot(title, data, labels, with_sum=False, fig=None):
     """Plot multiple sets of values and their total sum
 
     Parameters
@@ -60,35 +66,33 @@ def mix_plot(title, data, labels, with_sum=False):
         Labels for the axes, specified as [x_label, y_label]
     with_sum : boolean
         If should plot the sum of all y values (Default value = False)
+    fig : matplotlib.pyplot.fig
+        Figure to draw on (Default: a new figure)
 
     Returns
     -------
     maplotlib.plt.fig
         fig of plot
     """
-    fig, axis = plt.subplots()
+    if fig is None:
+        fig = plt.figure()
+    axis = fig.add_subplot(1, 1, 1)
 
     for chunk in data:
         x_list, y_list = chunk["values"]
         label = chunk["label"]
-        axis.plot(x_list, y_list, label=label)
+        # At most `plot_max_points` points are drawn per set of values
+        axis.plot(*downsample(x_list, y_list), label=label)
 
     if with_sum:
+        # Common x values of all the sets (at most `plot_max_points`)
+        x_values = common_grid([chunk["values"][0] for chunk in data])
 
-        x_values = []
-        for chunk in data:
-            x_list, _ = chunk["values"]
-            x_values.append(x_list)
-
-        # Get sorted list of all x values
-        x_values = np.unique(np.concatenate(x_values))
-
-        total = np.array([0.0] * len(x_values))
+        total = np.zeros(len(x_values))
         for chunk in data:
             x_list, y_list = chunk["values"]
-            # Interpolate y values on the combined x values
-            y_value = np.interp(x_values, x_list, y_list, left=0, right=0)
-            total += y_value
+            # Interpolate y values on the common x values
+            total += np.interp(x_values, x_list, y_list, left=0, right=0)
 
         axis.plot(x_values, total, label="Aggregate", alpha=0.5)
 
@@ -100,7 +104,8 @@ def mix_plot(title, data, labels, with_sum=False):
     return fig
 
 
-def bar_plot(title, x_list, y_list, labels, legend_string=None):
+# pylint: disable=too-many-arguments
+def bar_plot(title, x_list, y_list, labels, legend_string=None, fig=None):
     """
     Plot values
 
@@ -116,13 +121,16 @@ def bar_plot(title, x_list, y_list, labels, legend_string=None):
        Labels for the axes, specified as [x_label, y_label]
     legend_string : None/str
         If a string, then have a legend in the plot
+    fig : matplotlib.pyplot.fig
+        Figure to draw on (Default: a new figure)
 
     Returns
     -------
     matplotlib.plt.fig
         fig of plot
     """
-    fig = plt.figure()
+    if fig is None:
+        fig = plt.figure()
     axis = fig.add_subplot(1, 1, 1)
     axis.bar(x_list, y_list, width=0.3)
     axis.set_xlabel(labels[0])
@@ -135,7 +143,7 @@ def bar_plot(title, x_list, y_list, labels, legend_string=None):
     return fig
 
 
-def html_table(row_labels, col_labels, table_data):
+def html_table(row_labels, col_labels, table_data, caption="Comparison Plot"):
     """
     Table values
 
@@ -147,13 +155,15 @@ def html_table(row_labels, col_labels, table_data):
         Labels for the columns of the table
     table_data : List
         Data to be filled in the table
+    caption : str
+        Caption of the table (Default value = "Comparison Plot")
 
     Returns
     -------
     HTML markup for table using provided
     labels and data.
     """
-    table_html = "<html><table><caption>Comparison Plot</caption><tr><td></td>"
+    table_html = f"<html><table><caption>{caption}</caption><tr><td></td>"
     table_html += "".join(f"<th>{col_label}</th>" for col_label in col_labels)
     table_html += "</tr>"
     for row_index in range(len(row_labels)):
@@ -166,6 +176,31 @@ def html_table(row_labels, col_labels, table_data):
     return table_html
 
 
+def _gnuplot_every(dat_path):
+    """
+    gnuplot `every` option, plotting at most `plot_max_points` rows of
+    a .dat file. The .dat files keep all the samples, hence they are
+    strided by gnuplot instead.
+
+    Parameters
+    ----------
+    dat_path : str
+        Path of the .dat file
+
+    Returns
+    -------
+    str
+        "every <step> " or "" if all the rows are to be plotted
+    """
+    budget = config.get_value("plot_max_points")
+    if not budget:
+        return ""
+    with open(dat_path, "rb") as file:
+        rows = sum(1 for _ in file)
+    step = -(-rows // budget)
+    return f"every {step} " if step > 1 else ""
+
+
 def simple_gnu_plot(paths, labels, legend, title=""):
     """Plot Gnuplot
 
@@ -192,14 +227,13 @@ def simple_gnu_plot(paths, labels, legend, title=""):
         f"set autoscale y\n"
         f"if (Y_min == Y_max) set yrange [Y_min-1:Y_max+1]\n"
         f"plot '{directory}{paths['dat']}' "
+        f"{_gnuplot_every(paths['dat'])}"
         f"title '{legend}' "
         "with lines smooth csplines "
         "lw 1.5 lc rgb 'red'\n"
     )
 
-    build_gnuplot(directory, paths["plt"], pltline)
-    Pack.set_owner(paths["plt"])
-    Pack.set_owner(paths["eps"])
+    run_gnuplot(paths, pltline, [paths["dat"]])
 
 
 def mix_gnu_plot(dat_list, paths, labels, legend_list, title=""):
@@ -241,9 +275,10 @@ def mix_gnu_plot(dat_list, paths, labels, legend_list, title=""):
         "if (STATS_records == 0) set yrange [-1:1]\n"
     )
 
-    # Generate high-contrast colors
+    # Generate high-contrast colors. Seeded with the datasets, so that
+    # the script (and the plot) is the same when they haven't changed.
     color_ratio = 0.61803398875
-    hue = random.random()
+    hue = random.Random(" ".join(dat_list)).random()
     colors = []
     for _ in range(len(dat_list)):
         hue += color_ratio
@@ -261,6 +296,7 @@ def mix_gnu_plot(dat_list, paths, labels, legend_list, title=""):
     for datfile, legend, color in zip(dat_list, legend_list, colors):
         splot += (
             f'"{directory}{datfile}" '
+            f"{_gnuplot_every(datfile)}"
             f'title "{legend}" '
             "with lines smooth csplines "
             f"lw 1.5 lc {color}, "
@@ -268,9 +304,7 @@ def mix_gnu_plot(dat_list, paths, labels, legend_list, title=""):
 
     pltline += splot.rstrip(", ") + "\n"
 
-    build_gnuplot(directory, paths["plt"], pltline)
-    Pack.set_owner(paths["plt"])
-    Pack.set_owner(paths["eps"])
+    run_gnuplot(paths, pltline, dat_list)
 
 
 def bar_gnu_plot(paths, labels, title="", legend_string=None):
@@ -309,6 +343,4 @@ def bar_gnu_plot(paths, labels, title="", legend_string=None):
 
     pltline += plot_cmd + "\n"
 
-    build_gnuplot(directory, paths["plt"], pltline)
-    Pack.set_owner(paths["plt"])
-    Pack.set_owner(paths["eps"])
+    run_gnuplot(paths, pltline, [paths["dat"]])
@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Reduce the number of points of a series to be plotted, while keeping
+its visual shape. A plot can't show more points than it has pixels
+across, hence series of long experiments are downsampled to a point
+budget (`plot_max_points` config) before being drawn.
+"""
+
+import numpy as np
+from nest import config
+
+
+def _minmax_indices(y_values, budget):
+    """
+    Indices of the minimum and maximum of every bucket of `y_values`,
+    along with the first and last point
+
+    Parameters
+    ----------
+    y_values : numpy.ndarray
+    budget : int
+        Maximum number of points returned
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted indices of the points kept
+    """
+    length = len(y_values)
+    size = -(-length // max((budget - 2) // 2, 1))
+    buckets = -(-length // size)
+
+    # Pad the last bucket, so that the buckets form a matrix. Padding
+    # is never chosen, as every bucket has a point before the padding.
+    padding = buckets * size - length
+    lowest = np.pad(y_values, (0, padding), constant_values=np.inf)
+    highest = np.pad(y_values, (0, padding), constant_values=-np.inf)
+
+    offsets = np.arange(buckets) * size
+    minimum = offsets + lowest.reshape(buckets, size).argmin(axis=1)
+    maximum = offsets + highest.reshape(buckets, size).argmax(axis=1)
+    return np.unique(np.concatenate(([0, length - 1], minimum, maximum)))
+
+
+def _lttb_buckets(x_values, y_values, budget):
+    """
+    Buckets of the points between the first and the last, for
+    Largest-Triangle-Three-Buckets
+
+    Parameters
+    ----------
+    x_values : numpy.ndarray
+    y_values : numpy.ndarray
+    budget : int
+        Number of points returned by LTTB
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        Index of the first point of every bucket (and the index of the
+        last point), and the mean x and y values of every bucket
+        followed by the last point
+    """
+    length = len(x_values)
+    # First and last points are always kept, in buckets of their own
+    edges = np.linspace(1, length - 1, budget - 1).astype(np.int64)
+
+    # Mean of every bucket, computed at once
+    sums_x = np.add.reduceat(x_values[1:-1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y_values[1:-1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    means_x = np.append(sums_x / counts, x_values[-1])
+    means_y = np.append(sums_y / counts, y_values[-1])
+    return edges, means_x, means_y
+
+
+def _lttb_indices(x_values, y_values, budget):
+    """
+    Indices of the points chosen by Largest-Triangle-Three-Buckets:
+    from every bucket, the point forming the largest triangle with the
+    point chosen from the previous bucket and the mean of the next one
+
+    Parameters
+    ----------
+    x_values : numpy.ndarray
+    y_values : numpy.ndarray
+    budget : int
+        Number of points returned
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted indices of the points kept
+    """
+    length = len(x_values)
+    edges, means_x, means_y = _lttb_buckets(x_values, y_values, budget)
+
+    indices = np.empty(budget, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = length - 1
+    chosen = 0
+    for bucket in range(budget - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        # Twice the area of the triangles formed by each point of
+        # the bucket
+        areas = np.abs(
+            (x_values[chosen] - means_x[bucket + 1])
+            * (y_values[start:stop] - y_values[chosen])
+            - (x_values[chosen] - x_values[start:stop])
+            * (means_y[bucket + 1] - y_values[chosen])
+        )
+        chosen = start + areas.argmax()
+        indices[bucket + 1] = chosen
+    return indices
+
+
+def downsample(x_values, y_values, budget=None, method=None):
+    """
+    Downsample a series to at most `budget` points. Missing values
+    (NaN) are dropped from series which are downsampled.
+
+    Parameters
+    ----------
+    x_values : List/numpy.ndarray
+        x values (For eg., timestamps), in increasing order
+    y_values : List/numpy.ndarray
+        y values
+    budget : int
+        Maximum number of points (Default: `plot_max_points` config).
+        Series are not downsampled if it is 0.
+    method : str
+        "minmax" (minimum and maximum of every bucket, keeps every
+        peak) or "lttb" (Largest-Triangle-Three-Buckets, keeps the
+        overall shape). Default: `plot_downsampling` config.
+
+    Returns
+    -------
+    (List/numpy.ndarray, List/numpy.ndarray)
+        Downsampled x and y values (the given values if the series has
+        no more points than `budget`)
+    """
+    if budget is None:
+        budget = config.get_value("plot_max_points")
+    if not budget or len(x_values) <= max(budget, 4):
+        return x_values, y_values
+    budget = max(budget, 4)
+
+    x_values = np.asarray(x_values, dtype=np.float64)
+    y_values = np.asarray(y_values, dtype=np.float64)
+    present = ~np.isnan(y_values)
+    if not present.all():
+        x_values, y_values = x_values[present], y_values[present]
+        if len(x_values) <= budget:
+            return x_values, y_values
+
+    if (method or config.get_value("plot_downsampling")) == "lttb":
+        indices = _lttb_indices(x_values, y_values, budget)
+    else:
+        indices = _minmax_indices(y_values, budget)
+    return x_values[indices], y_values[indices]
+
+
+def common_grid(x_lists, budget=None):
+    """
+    x values on which series with different x values are combined
+    (For eg., to plot their sum)
+
+    Parameters
+    ----------
+    x_lists : List[List/numpy.ndarray]
+        x values of every series
+    budget : int
+        Maximum number of points (Default: `plot_max_points` config).
+        If it is 0, the grid has all the x values of every series.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted x values
+    """
+    if budget is None:
+        budget = config.get_value("plot_max_points")
+    x_lists = [np.asarray(x_list, dtype=np.float64) for x_list in x_lists]
+    x_lists = [x_list for x_list in x_lists if len(x_list)]
+    if not x_lists:
+        return np.array([])
+
+    if budget and sum(len(x_list) for x_list in x_lists) > budget:
+        start = min(x_list[0] for x_list in x_lists)
+        stop = max(x_list[-1] for x_list in x_lists)
+        return np.linspace(start, stop, budget)
+    return np.unique(np.concatenate(x_lists))
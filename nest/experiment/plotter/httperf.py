@@ -5,12 +5,12 @@
 
 import logging
 import time
-import matplotlib.pyplot as plt
 import pandas as pd
 from nest import config
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from ..pack import Pack
 from .common import html_table, bar_plot, bar_gnu_plot
+from .render import render_plot
 
 logger = logging.getLogger(__name__)
 
@@ -52,14 +52,15 @@ def _plot_httperf_flow(stat, stat_data):
 
     # Generate plot using matplotlib
     if config.get_value("enable_matplot"):
-        fig = bar_plot(
+        render_plot(
+            "httperf",
+            f"{base_filename}.png",
+            bar_plot,
             "",
             clients,
             metric_data,
             ["Clients", stat],
         )
-        Pack.dump_plot("httperf", f"{base_filename}.png", fig)
-        plt.close(fig)
 
     # Generate plot using gnuplot
     if config.get_value("enable_gnuplot"):
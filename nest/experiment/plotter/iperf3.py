@@ -5,11 +5,11 @@
 
 import logging
 import pandas as pd
-import matplotlib.pyplot as plt
 from nest import config
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from ..pack import Pack
 from .common import simple_plot, simple_gnu_plot
+from .render import render_plot
 
 logger = logging.getLogger(__name__)
 
@@ -97,15 +97,16 @@ def _plot_iperf3_flow(flow, node, dest_ip, local_port):
 
     # Generate plot using matplotlib
     if config.get_value("enable_matplot"):
-        fig = simple_plot(
+        render_plot(
+            "iperf3",
+            f"{base_filename}.png",
+            simple_plot,
             "",
             timestamp,
             sending_rate,
             ["Time (Seconds)", "Sending Rate (Mbps)"],
             legend_string,
         )
-        Pack.dump_plot("iperf3", f"{base_filename}.png", fig)
-        plt.close(fig)
 
     # Generate plot using gnuplot
     if config.get_value("enable_gnuplot"):
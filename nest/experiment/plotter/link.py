@@ -0,0 +1,219 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Plot link throughput and utilization"""
+
+import logging
+import numpy as np
+import pandas as pd
+from nest import config
+from nest.experiment.interrupts import handle_keyboard_interrupt
+from ..pack import Pack
+from .common import simple_plot, simple_gnu_plot, bar_plot, html_table
+from .render import render_plot
+
+logger = logging.getLogger(__name__)
+
+# Number of links shown in the hot link plot
+HOT_LINKS_PLOTTED = 10
+
+
+def _plot_link_param(node, interface, timestamp, values, label):
+    """
+    Plot a time series of an interface
+
+    Parameters
+    ----------
+    node : str
+        Node containing the interface
+    interface : str
+        Name of the interface
+    timestamp : numpy.ndarray
+        Time since the first sample
+    values : List
+        Values to be plotted
+    label : str
+        Label of the values, also used in the file names
+    """
+    base_filename = f"{node}_{interface}_{label.split()[0].lower()}"
+    legend_string = f"Interface {interface} in {node}"
+    labels = ["Time (Seconds)", label]
+
+    # Always generate data files
+    data_frame = pd.DataFrame(list(zip(timestamp, values)))
+    Pack.dump_datfile("link", f"{base_filename}.dat", data_frame)
+
+    # Generate plot using matplotlib
+    if config.get_value("enable_matplot"):
+        render_plot(
+            "link",
+            f"{base_filename}.png",
+            simple_plot,
+            "Link Statistics",
+            timestamp,
+            values,
+            labels,
+            legend_string=legend_string,
+        )
+
+    # Generate plot using gnuplot
+    if config.get_value("enable_gnuplot"):
+        # Store paths in a dict for .dat, .eps and .plt
+        paths = {
+            "dat": Pack.get_path("link", f"{base_filename}.dat"),
+            "eps": Pack.get_path("link", f"{base_filename}.eps"),
+            "plt": Pack.get_path("link", f"{base_filename}.plt"),
+        }
+        simple_gnu_plot(paths, labels, legend_string, "Link Statistics")
+
+
+def summarize_links(parsed_data):
+    """
+    Summarize the load on every link of the topology, hottest first
+
+    Parameters
+    ----------
+    parsed_data : Dict
+        Interface counters sampled in the experiment
+
+    Returns
+    -------
+    List[Tuple(str, dict)]
+        "<interface> in <node>" and its summary, sorted by mean
+        utilization (or mean throughput, if the bandwidth isn't set)
+    """
+    summary = []
+    for node in parsed_data:
+        for result in parsed_data[node]:
+            for interface, record in result.items():
+                throughput = np.array(record["throughput"])
+                stats = {
+                    "mean_throughput": throughput.mean(),
+                    "peak_throughput": throughput.max(),
+                    "mean_utilization": None,
+                    "peak_utilization": None,
+                    "drops": sum(record["rx_dropped"]) + sum(record["tx_dropped"]),
+                    "errors": sum(record["rx_errors"]) + sum(record["tx_errors"]),
+                }
+                if "utilization" in record:
+                    utilization = np.array(record["utilization"])
+                    stats["mean_utilization"] = utilization.mean()
+                    stats["peak_utilization"] = utilization.max()
+                summary.append((f"{interface} in {node}", stats))
+
+    summary.sort(
+        key=lambda link: (
+            link[1]["mean_utilization"] is not None,
+            link[1]["mean_utilization"] or 0,
+            link[1]["mean_throughput"],
+        ),
+        reverse=True,
+    )
+    return summary
+
+
+def _hot_links_plot(links, utilizations, fig=None):
+    """Bar plot of the utilization of the hottest links"""
+    fig = bar_plot(
+        "Hot Links", links, utilizations, ["Link", "Mean Utilization (%)"], fig=fig
+    )
+    fig.autofmt_xdate()
+    return fig
+
+
+def _dump_hot_links(summary):
+    """
+    Dump the link summary as a table, and plot the utilization
+    of the hottest links
+
+    Parameters
+    ----------
+    summary : List[Tuple(str, dict)]
+        Output of `summarize_links`
+    """
+    col_labels = [
+        "Mean utilization (%)",
+        "Peak utilization (%)",
+        "Mean throughput (Mbps)",
+        "Peak throughput (Mbps)",
+        "Drops",
+        "Errors",
+    ]
+    table_data = []
+    for _, stats in summary:
+        table_data.append(
+            [
+                "-" if value is None else f"{value:.2f}"
+                for value in (
+                    stats["mean_utilization"],
+                    stats["peak_utilization"],
+                    stats["mean_throughput"],
+                    stats["peak_throughput"],
+                )
+            ]
+            + [stats["drops"], stats["errors"]]
+        )
+    Pack.dump_file(
+        "link_utilization.html",
+        html_table(
+            [link for link, _ in summary], col_labels, table_data, "Link Utilization"
+        ),
+    )
+
+    hot_links = [
+        (link, stats["mean_utilization"])
+        for link, stats in summary[:HOT_LINKS_PLOTTED]
+        if stats["mean_utilization"] is not None
+    ]
+    if hot_links and config.get_value("enable_matplot"):
+        render_plot(
+            "link",
+            "hot_links.png",
+            _hot_links_plot,
+            [link for link, _ in hot_links],
+            [utilization for _, utilization in hot_links],
+        )
+
+
+@handle_keyboard_interrupt
+def plot_link(parsed_data):
+    """
+    Plot the throughput and utilization of every sampled interface, and
+    summarize the load on all of them
+
+    Parameters
+    ----------
+    parsed_data : Dict
+        Interface counters sampled in the experiment
+    """
+    for node in parsed_data:
+        for result in parsed_data[node]:
+            for interface, record in result.items():
+                start_time = record["meta"]["start_timestamp"]
+                timestamp = np.array(record["timestamp"]) - start_time
+                _plot_link_param(
+                    node,
+                    interface,
+                    timestamp,
+                    record["throughput"],
+                    "Throughput (Mbps)",
+                )
+                if "utilization" in record:
+                    _plot_link_param(
+                        node,
+                        interface,
+                        timestamp,
+                        record["utilization"],
+                        "Utilization (%)",
+                    )
+
+    summary = summarize_links(parsed_data)
+    if summary:
+        link, stats = summary[0]
+        if stats["mean_utilization"] is not None:
+            logger.info(
+                "Hottest link: %s (%.2f%% mean utilization)",
+                link,
+                stats["mean_utilization"],
+            )
+        _dump_hot_links(summary)
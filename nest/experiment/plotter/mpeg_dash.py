@@ -4,12 +4,12 @@
 """Plot MPEG-DASH results"""
 
 import logging
-import matplotlib.pyplot as plt
 import pandas as pd
 from nest import config
 from ..interrupts import handle_keyboard_interrupt
 from ..pack import Pack
 from .common import simple_plot, simple_gnu_plot
+from .render import render_plot
 
 logger = logging.getLogger(__name__)
 
@@ -150,15 +150,16 @@ def _plot_mpeg_dash(flow, node, server_ip, stats_type):
 
         # Generate plot using matplotlib
         if config.get_value("enable_matplot"):
-            fig = simple_plot(
+            render_plot(
+                "mpeg_dash",
+                f"{base_filename}.png",
+                simple_plot,
                 f"MPEG-DASH {stats_type} Statistics",
                 chunk_numbers,
                 flow_params[param],
                 ["Number of chunks", _get_ylabel(param)],
                 legend_string=legend_string,
             )
-            Pack.dump_plot("mpeg_dash", f"{base_filename}.png", fig)
-            plt.close(fig)
 
         # Generate plot using gnuplot
         if config.get_value("enable_gnuplot"):
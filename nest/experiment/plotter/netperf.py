@@ -4,12 +4,14 @@
 """Plot netperf results"""
 
 import logging
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from nest import config
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from ..pack import Pack
+from ..series import FlowSeries
 from .common import simple_plot, mix_plot, simple_gnu_plot, mix_gnu_plot
+from .render import render_plot
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +24,8 @@ def _plot_netperf_flow(flow, node, dest, dat_list_flows=None):
     ----------
     exp_name : str
         Name of experiment for which results were obtained
-    flow : List
-        List with timestamps and stats
+    flow : FlowSeries/List
+        Timestamps and stats
     node : str
         Node from which netperf results were obtained from
     dest :
@@ -48,37 +50,34 @@ def _plot_netperf_flow(flow, node, dest, dat_list_flows=None):
         )
         return None
 
-    # First item is the "meta" item with user given information
-    destination_node = flow[0]["destination_node"]
+    flow = FlowSeries.from_records(flow)
+    destination_node = flow.meta["destination_node"]
 
     # "Bias" actual start_time in experiment with user given start time
-    start_time = float(flow[1]["timestamp"]) - float(flow[0]["start_time"])
+    start_time = flow.timestamp[0] - float(flow.meta["start_time"])
 
-    timestamp = []
-    sending_rate = []
-
-    for data in flow[1:]:
-        sending_rate.append(float(data["sending_rate"]))
-        # add relative time in timestamp
-        timestamp.append(float(data["timestamp"]) - start_time)
+    # relative time of every sample
+    timestamp = flow.timestamp - start_time
+    sending_rate = flow.column("sending_rate")
 
     base_filename = f"sending_rate_{node}_to_{destination_node}({dest})"
     # Always generate data files
-    data_frame = pd.DataFrame(list(zip(timestamp, sending_rate)))
+    data_frame = pd.DataFrame(np.column_stack((timestamp, sending_rate)))
     Pack.dump_datfile("netperf", f"{base_filename}.dat", data_frame)
     legend_string = f"{node} to {destination_node} ({dest})"
     # Generate plot using matplotlib
     if config.get_value("enable_matplot"):
         # TODO: Check if sending_rate is always in Mbps
-        fig = simple_plot(
+        render_plot(
+            "netperf",
+            f"{base_filename}.png",
+            simple_plot,
             "",
             timestamp,
             sending_rate,
             ["Time (Seconds)", "Sending Rate (Mbps)"],
             legend_string=legend_string,
         )
-        Pack.dump_plot("netperf", f"{base_filename}.png", fig)
-        plt.close(fig)
 
     # Generate plot using gnuplot
     if config.get_value("enable_gnuplot"):
@@ -127,17 +126,19 @@ def plot_netperf(parsed_data):
                     all_flow_data.append(plotted_data)
 
         if len(all_flow_data) > 1:
+            base_filename = f"sending_rate_{node}"
+
             # Generate aggregate plot using matplotlib
             if config.get_value("enable_matplot"):
-                fig = mix_plot(
+                render_plot(
+                    "netperf",
+                    f"{base_filename}.png",
+                    mix_plot,
                     "",
                     all_flow_data,
                     ["Time (Seconds)", "Sending Rate (Mbps)"],
                     with_sum=True,
                 )
-                base_filename = f"sending_rate_{node}"
-                Pack.dump_plot("netperf", f"{base_filename}.png", fig)
-                plt.close(fig)
 
             # Generate aggregate plot using gnuplot
             if config.get_value("enable_gnuplot"):
@@ -4,12 +4,14 @@
 """Plot ping results"""
 
 import logging
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from nest import config
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from ..pack import Pack
+from ..series import FlowSeries
 from .common import simple_plot, simple_gnu_plot
+from .render import render_plot
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +24,8 @@ def _plot_ping_flow(flow, node, dest):
     ----------
     exp_name : str
         Name of experiment for which results were obtained
-    flow : List
-        List with timestamps and stats
+    flow : FlowSeries/List
+        Timestamps and stats
     node : str
         Node from which ping results were obtained from
     dest :
@@ -43,38 +45,35 @@ def _plot_ping_flow(flow, node, dest):
         )
         return None
 
-    # First item is the "meta" item with user given information
-    destination_node = flow[0]["destination_node"]
+    flow = FlowSeries.from_records(flow)
+    destination_node = flow.meta["destination_node"]
 
     # "Bias" actual start_time in experiment with user given start time
-    start_time = float(flow[1]["timestamp"]) - float(flow[0]["start_time"])
+    start_time = flow.timestamp[0] - float(flow.meta["start_time"])
 
-    timestamp = []
-    rtt = []
-
-    for data in flow[1:]:
-        rtt.append(float(data["rtt"]))
-        # add relative time in timestamp
-        timestamp.append(float(data["timestamp"]) - start_time)
+    # relative time of every sample
+    timestamp = flow.timestamp - start_time
+    rtt = flow.column("rtt")
 
     base_filename = f"ping_{node}_to_{destination_node}({dest})"
     legend_string = f"{node} to {destination_node} ({dest})"
 
     # Always generate data files
-    data_frame = pd.DataFrame(list(zip(timestamp, rtt)))
+    data_frame = pd.DataFrame(np.column_stack((timestamp, rtt)))
     Pack.dump_datfile("ping", f"{base_filename}.dat", data_frame)
 
     # Generate plot using matplotlib
     if config.get_value("enable_matplot"):
-        fig = simple_plot(
+        render_plot(
+            "ping",
+            f"{base_filename}.png",
+            simple_plot,
             "",
             timestamp,
             rtt,
             ["Time (Seconds)", "Ping Latency (ms)"],
             legend_string=legend_string,
         )
-        Pack.dump_plot("ping", f"{base_filename}.png", fig)
-        plt.close(fig)
 
     # Generate plot using gnuplot
     if config.get_value("enable_gnuplot"):
@@ -0,0 +1,264 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Render plots in parallel, a figure per job.
+
+Plotters draw their figures through `render_plot` (and `run_gnuplot`).
+Within `render_plots`, the figures are only collected while the
+plotters run, and are then rendered in a pool of worker processes.
+Each worker reuses a single figure for all the plots it renders,
+clearing it after every plot, so memory doesn't grow with the number
+of plots.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from functools import partial
+import matplotlib.pyplot as plt
+import numpy as np
+from nest import config
+from nest.engine.gnuplot import build_gnuplot
+from ..pack import Pack
+from ..supervisor import run_in_pool
+
+logger = logging.getLogger(__name__)
+
+# File (in Pack.FOLDER) storing digests of the data of rendered plots
+DIGESTS_FILE = ".plot_digests.json"
+
+# "batch": plots collected by `render_plots` (None when plots are
+# rendered at once), "figure": figure reused by the plots rendered in
+# this process
+_state = {"batch": None, "figure": None}
+
+
+def _get_figure():
+    """Figure to draw the next plot on"""
+    if _state["figure"] is None:
+        _state["figure"] = plt.figure()
+    return _state["figure"]
+
+
+def close_figure():
+    """Close the figure reused by the plots rendered in this process"""
+    if _state["figure"] is not None:
+        plt.close(_state["figure"])
+        _state["figure"] = None
+
+
+def _weight(value):
+    """Number of values in `value`, to render the larger plots first"""
+    if isinstance(value, np.ndarray):
+        return value.size
+    if isinstance(value, dict):
+        return sum(_weight(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_weight(item) for item in value)
+    return 1
+
+
+def _digest(inputs):
+    """Digest of the data a plot is drawn from"""
+    return hashlib.blake2b(pickle.dumps(inputs), digest_size=16).hexdigest()
+
+
+class _PlotBatch:
+    """
+    Plots collected while running the plotters
+
+    Attributes
+    ----------
+    jobs : List[Callable]
+        Jobs rendering the plots
+    weights : List[int]
+        Number of values plotted by each job
+    previous : dict or None
+        Plots (paths relative to Pack.FOLDER) mapped to digests of their
+        data, when they were last rendered. None if plots aren't
+        rendered incrementally.
+    digests : dict
+        Plots mapped to digests of their current data
+    metrics : List[str] or None
+        If given, only plots whose file name has one of these metrics
+        are rendered
+    skipped : int
+        Number of plots not rendered, since their data hasn't changed
+    """
+
+    def __init__(self, incremental, metrics=None):
+        self.jobs = []
+        self.metrics = metrics
+        self.weights = []
+        self.previous = self._load_digests() if incremental else None
+        self.digests = {}
+        self.skipped = 0
+
+    @staticmethod
+    def _load_digests():
+        path = os.path.join(Pack.FOLDER, DIGESTS_FILE)
+        if not os.path.isfile(path):
+            return {}
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def save_digests(self):
+        """Store the digests of the plots rendered, for the next run"""
+        if self.previous is None:
+            return
+        digests = dict(self.previous)
+        digests.update(self.digests)
+        Pack.dump_file(DIGESTS_FILE, json.dumps(digests, indent=4, sort_keys=True))
+
+    def add(self, path, job, get_inputs, weight):
+        """
+        Add a plot, unless it's rendered incrementally and its data
+        hasn't changed since it was last rendered
+
+        Parameters
+        ----------
+        path : str
+            Path of the plot, relative to Pack.FOLDER
+        job : Callable
+            Renders the plot
+        get_inputs : Callable
+            Returns the data the plot is drawn from
+        weight : int
+            Number of values plotted
+        """
+        if self.metrics and not any(
+            metric in os.path.basename(path) for metric in self.metrics
+        ):
+            return
+        if self.previous is not None:
+            digest = _digest(get_inputs())
+            self.digests[path] = digest
+            if self.previous.get(path) == digest and os.path.exists(
+                os.path.join(Pack.FOLDER, path)
+            ):
+                self.skipped += 1
+                return
+        self.jobs.append(job)
+        self.weights.append(weight)
+
+
+def _render(subfolder, filename, plot, args, kwargs):
+    """Draw a plot on the reused figure and store it"""
+    fig = plot(*args, fig=_get_figure(), **kwargs)
+    try:
+        Pack.dump_plot(subfolder, filename, fig)
+    finally:
+        fig.clf()
+
+
+def render_plot(subfolder, filename, plot, *args, **kwargs):
+    """
+    Draw a plot and store it in Pack.FOLDER. Within `render_plots`, the
+    plot is rendered later, in parallel with the other plots.
+
+    Parameters
+    ----------
+    subfolder : str
+        Subfolder to which plot belongs to
+    filename : str
+        Name of plot
+    plot : Callable
+        Draws the plot (For eg., `simple_plot`), given `args`, `kwargs`
+        and the figure to draw on as `fig`
+    """
+    # Created here, since the plots of a subfolder are rendered in
+    # different processes
+    Pack.create_subfolder(subfolder)
+    job = partial(_render, subfolder, filename, plot, args, kwargs)
+
+    if _state["batch"] is None:
+        job()
+        close_figure()
+        return
+
+    _state["batch"].add(
+        os.path.join(subfolder, filename),
+        job,
+        # Plots are drawn downsampled, see `plot_max_points` config
+        lambda: (
+            plot.__name__,
+            args,
+            kwargs,
+            config.get_value("plot_max_points"),
+            config.get_value("plot_downsampling"),
+        ),
+        _weight(args),
+    )
+
+
+def _build_gnuplot(paths, plt_script):
+    """Run gnuplot with `plt_script`"""
+    build_gnuplot(os.getcwd() + "/", paths["plt"], plt_script)
+    Pack.set_owner(paths["plt"])
+    Pack.set_owner(paths["eps"])
+
+
+def run_gnuplot(paths, plt_script, dat_list):
+    """
+    Plot with gnuplot. Within `render_plots`, gnuplot is run later, in
+    parallel with the other plots.
+
+    Parameters
+    ----------
+    paths : Dict[str, str]
+        Dictionary containing file paths with keys 'plt' and 'eps'
+    plt_script : str
+        gnuplot script
+    dat_list : List[str]
+        Paths of the .dat files plotted by `plt_script`
+    """
+    job = partial(_build_gnuplot, paths, plt_script)
+
+    if _state["batch"] is None:
+        job()
+        return
+
+    def get_inputs():
+        dat_files = []
+        for dat in dat_list:
+            with open(dat, "rb") as file:
+                dat_files.append(file.read())
+        return (plt_script, dat_files)
+
+    _state["batch"].add(
+        os.path.relpath(paths["eps"], Pack.FOLDER), job, get_inputs, len(dat_list)
+    )
+
+
+def render_plots(plotters, metrics=None):
+    """
+    Run `plotters`, collecting the plots they draw, and then render the
+    plots in a pool of worker processes, largest first.
+
+    If `plot_incremental` config is enabled, plots whose data hasn't
+    changed since they were last rendered in Pack.FOLDER are skipped.
+
+    Parameters
+    ----------
+    plotters : List[Callable]
+        Plotters (taking no arguments) to be run
+    metrics : List[str]
+        If given, only plots whose file name has one of these metrics
+        (For eg., "cwnd") are rendered
+    """
+    batch = _PlotBatch(config.get_value("plot_incremental"), metrics)
+    _state["batch"] = batch
+    try:
+        for plotter in plotters:
+            plotter()
+    finally:
+        _state["batch"] = None
+
+    if batch.skipped:
+        logger.info("Skipping %d plots, as their data hasn't changed", batch.skipped)
+
+    run_in_pool(batch.jobs, batch.weights, "Plotting")
+    batch.save_digests()
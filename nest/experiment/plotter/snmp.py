@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Plot SNMP counters"""
+
+import logging
+import numpy as np
+import pandas as pd
+from nest import config
+from nest.experiment.interrupts import handle_keyboard_interrupt
+from ..pack import Pack
+from ..parser.snmp import SnmpRunner
+from .common import simple_plot, simple_gnu_plot
+from .render import render_plot
+
+logger = logging.getLogger(__name__)
+
+
+def _extract_rates(result, node):
+    """
+    Convert the change in counters over every interval to rates
+
+    Parameters
+    ----------
+    result : dict
+        SNMP counters sampled in a namespace
+    node : str
+        Node from which the counters were sampled
+
+    Returns
+    -------
+    tuple/None
+        Time since the first sample, and counter names mapped to
+        their rate (per second)
+    """
+    if not result["timestamp"]:
+        logger.warning("%s doesn't have any sampled SNMP counters.", node)
+        return None
+
+    start_time = result["meta"]["start_timestamp"]
+    timestamp = np.array(result["timestamp"]) - start_time
+    durations = np.diff(timestamp, prepend=0)
+
+    # Plot the requested counters, else the commonly inspected ones
+    names = result["meta"]["stats"] or SnmpRunner.PLOTTED_COUNTERS
+    rates = {
+        name: np.array(result["counters"][name]) / durations
+        for name in names
+        if name in result["counters"]
+    }
+    return (timestamp, rates)
+
+
+def _plot_snmp_counter(node, name, timestamp, rate):
+    """
+    Plot the rate of a counter
+
+    Parameters
+    ----------
+    node : str
+        Node from which the counter was sampled
+    name : str
+        Name of the counter
+    timestamp : numpy.ndarray
+        Time since the first sample
+    rate : numpy.ndarray
+        Rate (per second) of the counter
+    """
+    base_filename = f"{node}_{name}"
+    legend_string = f"{name} in {node}"
+    labels = ["Time (Seconds)", f"{name} (per second)"]
+
+    # Always generate data files
+    data_frame = pd.DataFrame(list(zip(timestamp, rate)))
+    Pack.dump_datfile("snmp", f"{base_filename}.dat", data_frame)
+
+    # Generate plot using matplotlib
+    if config.get_value("enable_matplot"):
+        render_plot(
+            "snmp",
+            f"{base_filename}.png",
+            simple_plot,
+            "SNMP Counters",
+            timestamp,
+            rate,
+            labels,
+            legend_string=legend_string,
+        )
+
+    # Generate plot using gnuplot
+    if config.get_value("enable_gnuplot"):
+        # Store paths in a dict for .dat, .eps and .plt
+        paths = {
+            "dat": Pack.get_path("snmp", f"{base_filename}.dat"),
+            "eps": Pack.get_path("snmp", f"{base_filename}.eps"),
+            "plt": Pack.get_path("snmp", f"{base_filename}.plt"),
+        }
+        simple_gnu_plot(paths, labels, legend_string, "SNMP Counters")
+
+
+@handle_keyboard_interrupt
+def plot_snmp(parsed_data):
+    """
+    Plot the SNMP counters sampled in every namespace
+
+    Parameters
+    ----------
+    parsed_data : Dict
+        SNMP counters sampled in the experiment
+    """
+    for node in parsed_data:
+        for result in parsed_data[node]:
+            values = _extract_rates(result, node)
+            if values is None:
+                continue
+            timestamp, rates = values
+            for name, rate in rates.items():
+                _plot_snmp_counter(node, name, timestamp, rate)
@@ -5,12 +5,14 @@
 
 import logging
 from collections import defaultdict
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from nest import config
 from nest.experiment.interrupts import handle_keyboard_interrupt
 from ..pack import Pack
+from ..series import FlowSeries
 from .common import simple_plot, mix_plot, simple_gnu_plot, mix_gnu_plot
+from .render import render_plot
 
 logger = logging.getLogger(__name__)
 
@@ -91,8 +93,8 @@ def _extract_from_ss_flow(flow, node, dest_ip, dest_port):
 
     Parameters
     ----------
-    flow : List
-        List with timestamps and stats
+    flow : FlowSeries/List
+        Timestamps and stats
     node : string
         Node from which ss results were obtained from
     dest_ip : string
@@ -115,38 +117,85 @@ def _extract_from_ss_flow(flow, node, dest_ip, dest_port):
         )
         return None
 
-    # First item is the "meta" item with user given information
-    destination_node = flow[0]["destination_node"]
+    flow = FlowSeries.from_records(flow)
+    destination_node = flow.meta["destination_node"]
 
     # "Bias" actual start_time in experiment with user given start time
-    start_time = float(flow[1]["timestamp"]) - float(flow[0]["start_time"])
+    start_time = flow.timestamp[0] - float(flow.meta["start_time"])
 
-    timestamp = []
-    flow_params = {}
+    # relative time of every sample
+    timestamp = flow.timestamp - start_time
 
-    for param in _get_list_of_ss_params():
-        flow_params[param] = []
-
-    for data in flow[1:]:
-        for stat, stat_data in flow_params.items():
-            if stat in data:
-                stat_data.append(float(data[stat]))
-            else:
-                stat_data.append(None)
-        # add relative time in timestamp
-        timestamp.append(float(data["timestamp"]) - start_time)
+    # Samples without a parameter have NaN as its value
+    flow_params = {param: flow.column(param) for param in _get_list_of_ss_params()}
 
     return {"destination_node": destination_node, "values": (timestamp, flow_params)}
 
 
+def _plot_ss_param(param, samples, base_filename, legend_string, dat_tuple_flows):
+    """
+    Dump and plot a parameter of a flow
+
+    Parameters
+    ----------
+    param : string
+        ss parameter
+    samples : (numpy.ndarray, numpy.ndarray)
+        Timestamps and values of the parameter
+    base_filename : string
+        Name of the files, without extension
+    legend_string : string
+        Legend of the plot
+    dat_tuple_flows : List
+        List for storing (param, dat_path) tuples
+    """
+    param_timestamp, param_values = samples
+
+    # Always generate data files
+    Pack.dump_datfile(
+        "ss",
+        f"{base_filename}.dat",
+        pd.DataFrame(np.column_stack((param_timestamp, param_values))),
+    )
+
+    # Generate plot using matplotlib
+    if config.get_value("enable_matplot"):
+        render_plot(
+            "ss",
+            f"{base_filename}.png",
+            simple_plot,
+            "Socket Statistics",
+            param_timestamp,
+            param_values,
+            ["Time (Seconds)", _get_ylabel(param)],
+            legend_string=legend_string,
+        )
+
+    # Generate plot using gnuplot
+    if config.get_value("enable_gnuplot"):
+        paths = {
+            "dat": Pack.get_path("ss", f"{base_filename}.dat"),
+            "eps": Pack.get_path("ss", f"{base_filename}.eps"),
+            "plt": Pack.get_path("ss", f"{base_filename}.plt"),
+        }
+
+        simple_gnu_plot(
+            paths,
+            ["Time (Seconds)", _get_ylabel(param)],
+            legend_string,
+            "Socket Statistics",
+        )
+        dat_tuple_flows.append((param, paths["dat"]))
+
+
 def _plot_ss_flow(flow, node, dest_ip, dest_port, dat_tuple_flows):
     """
     Plot ss stats of the flow with optimized variable usage.
 
     Parameters
     ----------
-    flow : List
-        List with timestamps and stats
+    flow : FlowSeries/List
+        Timestamps and stats
     node : string
         Source node
     dest_ip : string
@@ -162,51 +211,23 @@ def _plot_ss_flow(flow, node, dest_ip, dest_port, dat_tuple_flows):
         Contains label, destination_node, and values
     """
     data = _extract_from_ss_flow(flow, node, dest_ip, dest_port)
-    if data["values"] is None:
+    if data is None:
         return None
 
     destination_node = data["destination_node"]
     timestamp, flow_params = data["values"]
     legend_string = f"{node} to {destination_node} ({dest_ip}:{dest_port})"
 
-    for param in flow_params:
-        # Filter None values and prepare data
-        filtered_data = [
-            (x, y) for x, y in zip(timestamp, flow_params[param]) if y is not None
-        ]
-
-        base_filename = f"{param}_{node}_to_{destination_node}({dest_ip}:{dest_port})"
-
-        # Always generate data files
-        Pack.dump_datfile("ss", f"{base_filename}.dat", pd.DataFrame(filtered_data))
-
-        # Generate plot using matplotlib
-        if config.get_value("enable_matplot"):
-            fig = simple_plot(
-                "Socket Statistics",
-                [x for x, _ in filtered_data],
-                [y for _, y in filtered_data],
-                ["Time (Seconds)", _get_ylabel(param)],
-                legend_string=legend_string,
-            )
-            Pack.dump_plot("ss", f"{base_filename}.png", fig)
-            plt.close(fig)
-
-        # Generate plot using gnuplot
-        if config.get_value("enable_gnuplot"):
-            paths = {
-                "dat": Pack.get_path("ss", f"{base_filename}.dat"),
-                "eps": Pack.get_path("ss", f"{base_filename}.eps"),
-                "plt": Pack.get_path("ss", f"{base_filename}.plt"),
-            }
-
-            simple_gnu_plot(
-                paths,
-                ["Time (Seconds)", _get_ylabel(param)],
-                legend_string,
-                "Socket Statistics",
-            )
-            dat_tuple_flows.append((param, paths["dat"]))
+    for param, values in flow_params.items():
+        # Filter missing values
+        present = ~np.isnan(values)
+        _plot_ss_param(
+            param,
+            (timestamp[present], values[present]),
+            f"{param}_{node}_to_{destination_node}({dest_ip}:{dest_port})",
+            legend_string,
+            dat_tuple_flows,
+        )
 
     return {
         "label": legend_string,
@@ -298,13 +319,14 @@ def plot_ss(parsed_data):
 
                         # Generate aggregate plot using matplotlib
                         if config.get_value("enable_matplot"):
-                            fig = mix_plot(
+                            render_plot(
+                                "ss",
+                                f"{base_filename}.png",
+                                mix_plot,
                                 "Socket Statistics",
                                 data,
                                 ["Time (Seconds)", _get_ylabel(param)],
                             )
-                            Pack.dump_plot("ss", f"{base_filename}.png", fig)
-                            plt.close(fig)
 
                         # Generate aggregate plot using gnuplot
                         if config.get_value("enable_gnuplot"):
@@ -4,10 +4,10 @@
 """Plot tc results"""
 
 import logging
-import matplotlib.pyplot as plt
 import pandas as pd
 from nest import config
 from .common import simple_plot, simple_gnu_plot
+from .render import render_plot
 from ..pack import Pack
 
 logger = logging.getLogger(__name__)
@@ -82,15 +82,16 @@ def _plot_tc_stats(stats, node, interface):
 
         # Generate plot using matplotlib
         if config.get_value("enable_matplot"):
-            fig = simple_plot(
+            render_plot(
+                "tc",
+                f"{base_filename}.png",
+                simple_plot,
                 "Traffic Control (tc) Statistics",
                 timestamp,
                 stats_params[param],
                 ["Time (Seconds)", param],
                 legend_string=legend_string,
             )
-            Pack.dump_plot("tc", f"{base_filename}.png", fig)
-            plt.close(fig)
 
         # Generate plot using gnuplot
         if config.get_value("enable_gnuplot"):
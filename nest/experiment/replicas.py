@@ -0,0 +1,426 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Run replicas of an experiment concurrently, and summarize their results
+with confidence intervals.
+
+Every replica is a forked process which builds its own copy of the
+topology and runs the experiment on it. An existing topology can't be
+cloned for every replica, so the topology is built by a `build`
+function, called in every replica::
+
+    def build(replica):
+        h1, h2 = Node("h1"), Node("h2")
+        ...
+        exp = Experiment("tcp")
+        exp.add_tcp_flow(Flow(h1, h2, eth2.get_address(), 0, 60, 1))
+        return exp
+
+    run_replicas("tcp", build, 8)
+
+Replicas are isolated from each other:
+
+* Namespaces and devices are named with an id unique to the replica.
+  Each copy of the topology lives in its own namespaces, so replicas
+  can use the same addresses.
+* Every replica (and the tools it runs) is pinned to its own share of
+  the CPUs.
+* Every replica adds its results to its own `ResultStore`, and dumps
+  them in its own folder.
+
+Only the first replica shows progress bars and serves live samples (See
+`live_endpoint` config). TCP module parameters are shared by all the
+replicas, so they are given to `run_replicas` rather than configured in
+`build`: the modules are set up once before the replicas start, and
+restored once they all stop.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+import shutil
+import time
+from functools import partial
+import numpy as np
+import pandas as pd
+from nest.clean_up import delete_namespaces, tcp_modules_clean_up
+from nest import config
+from nest.topology.id_generator import IdGen
+from nest.topology_map import TopologyMap
+from .compare import COUNTERS, summarize_dump
+from .experiment import Experiment
+from .pack import Pack
+from .results import ResultStore, set_store
+from .run_exp import tcp_modules_helper
+from .supervisor import run_in_pool
+
+logger = logging.getLogger(__name__)
+
+# Statistics over all the flows whose confidence intervals are computed
+AGGREGATE_STATS = ["mean", "median", "p99", "total", "fairness"]
+
+
+def _cpu_sets(replicas):
+    """
+    Disjoint shares of the available CPUs, one per replica
+
+    Parameters
+    ----------
+    replicas : int
+
+    Returns
+    -------
+    List[List[int]]
+        CPUs of every replica. If there are more replicas than CPUs,
+        CPUs are shared (round robin)
+    """
+    cpus = sorted(os.sched_getaffinity(0))
+    if replicas > len(cpus):
+        logger.warning(
+            "%d replicas share %d CPUs, their results may interfere",
+            replicas,
+            len(cpus),
+        )
+        return [[cpus[index % len(cpus)]] for index in range(replicas)]
+    return [list(share) for share in np.array_split(cpus, replicas)]
+
+
+def _run_replica(index, build, folder, cpus, dumps):
+    """
+    Build the topology and run the experiment of a replica. Called in
+    the forked process of the replica.
+
+    Parameters
+    ----------
+    index : int
+        Index of the replica
+    build : Callable
+        Builds the topology, and returns the experiment
+    folder : str
+        Folder of the replicas
+    cpus : List[int]
+        CPUs the replica is pinned to
+    dumps : multiprocessing.SimpleQueue
+        Receives the index of the replica and its dump folder
+    """
+    os.sched_setaffinity(0, cpus)
+    IdGen.topology_id = f"{IdGen.topology_id}r{index}"
+    IdGen.counter = 0
+    config.set_value("assign_random_names", True)
+    if index:
+        config.set_value("show_progress_bar", False)
+        config.set_value("live_endpoint", "")
+    store = ResultStore()
+    set_store(store)
+
+    dump = None
+    try:
+        experiment = build(index)
+        if experiment.tcp_module_params:
+            raise ValueError(
+                "TCP module parameters of replicas are set with the "
+                "`tcp_module_params` of `run_replicas`"
+            )
+        experiment.name = f"{experiment.name}_replica{index}"
+        experiment.save_path = folder
+        experiment.run()
+        dump = experiment.save_path
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Replica %d failed", index)
+    finally:
+        dumps.put((index, dump))
+        # TCP modules are restored by the parent, once all the replicas stop
+        delete_namespaces()
+        shutil.rmtree(store.directory, True)
+    # Skip the exit handlers inherited from the parent, which clean up
+    # after the parent
+    os._exit(0)  # pylint: disable=protected-access
+
+
+def _t_interval(theta, dof):
+    """
+    Probability that |T| < sqrt(dof) * tan(theta), for T following
+    Student's t-distribution with `dof` (integer) degrees of freedom
+    (Abramowitz and Stegun, 26.7.3 and 26.7.4)
+    """
+    cos2 = math.cos(theta) ** 2
+    if dof == 1:
+        return 2 * theta / math.pi
+    total = term = 1.0
+    if dof % 2:
+        for k in range(1, (dof - 1) // 2):
+            term *= 2 * k / (2 * k + 1) * cos2
+            total += term
+        return 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * total)
+    for k in range(1, dof // 2):
+        term *= (2 * k - 1) / (2 * k) * cos2
+        total += term
+    return math.sin(theta) * total
+
+
+def t_critical(confidence, dof):
+    """
+    Critical value of Student's t-distribution for a two-sided
+    confidence interval
+
+    Parameters
+    ----------
+    confidence : float
+        Confidence level (For eg., 0.95)
+    dof : int
+        Degrees of freedom
+
+    Returns
+    -------
+    float
+    """
+    low, high = 0.0, math.pi / 2
+    for _ in range(100):
+        theta = (low + high) / 2
+        if _t_interval(theta, dof) < confidence:
+            low = theta
+        else:
+            high = theta
+    return math.sqrt(dof) * math.tan((low + high) / 2)
+
+
+def _intervals(values, keys, confidence):
+    """
+    Mean of `values` over the replicas, grouped by `keys`, with its
+    confidence interval
+
+    Parameters
+    ----------
+    values : pandas.DataFrame
+        Has `keys` and a "value" column, with a row per replica
+    keys : List[str]
+    confidence : float
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    intervals = (
+        values.groupby(keys, sort=False)["value"]
+        .agg(replicas="count", mean="mean", std="std")
+        .reset_index()
+    )
+    critical = intervals["replicas"].map(
+        lambda count: t_critical(confidence, count - 1) if count > 1 else np.nan
+    )
+    half_width = critical * intervals["std"] / np.sqrt(intervals["replicas"])
+    return intervals.assign(
+        ci_low=intervals["mean"] - half_width, ci_high=intervals["mean"] + half_width
+    )
+
+
+def confidence_intervals(flows, aggregate, confidence=0.95):
+    """
+    Confidence intervals of the statistics of the replicas
+
+    Parameters
+    ----------
+    flows : pandas.DataFrame
+        Statistics of every flow, as returned by `summarize_dump`, of
+        all the replicas
+    aggregate : pandas.DataFrame
+        Statistics over all the flows, of all the replicas
+    confidence : float
+        Confidence level (Default value = 0.95)
+
+    Returns
+    -------
+    (pandas.DataFrame, pandas.DataFrame)
+        Mean over the replicas of the mean of every metric of every
+        flow (the increase, for counters), and of the statistics of
+        every metric over all the flows, with their standard deviation
+        and confidence interval (NaN with a single replica)
+    """
+    flows = flows.assign(
+        value=flows["total"].where(flows["metric"].isin(COUNTERS), flows["mean"])
+    )
+    aggregate = aggregate.melt(
+        id_vars=["experiment", "metric"],
+        value_vars=AGGREGATE_STATS,
+        var_name="stat",
+        value_name="value",
+    ).dropna(subset=["value"])
+    return (
+        _intervals(flows, ["metric", "tool", "role"], confidence),
+        _intervals(aggregate, ["metric", "stat"], confidence),
+    )
+
+
+def _wait(processes):
+    """Wait for the replicas, which stop by themselves on Ctrl-C"""
+    for process in processes:
+        while True:
+            try:
+                process.join()
+                break
+            except KeyboardInterrupt:
+                logger.warning("Waiting for the replicas to stop...")
+
+
+def _run_processes(build, replicas, folder, tcp_module_params):
+    """
+    Run the replicas, each in a forked process, and wait for them. The
+    TCP modules are set up before the replicas start, and restored once
+    they all stop.
+
+    Returns
+    -------
+    Dict[int, str]
+        Index of every replica which succeeded, mapped to its dump folder
+    """
+    context = multiprocessing.get_context("fork")
+    dumps = context.SimpleQueue()
+    processes = [
+        context.Process(
+            target=_run_replica,
+            args=(index, build, folder, cpus, dumps),
+            name=f"nest-replica-{index}",
+        )
+        for index, cpus in enumerate(_cpu_sets(replicas))
+    ]
+    if tcp_module_params:
+        modules = Experiment("replicas")
+        for cong_algo, params in tcp_module_params.items():
+            modules.configure_tcp_module_params(cong_algo, **params)
+        tcp_modules_helper(modules)
+    try:
+        for process in processes:
+            process.start()
+        _wait(processes)
+    finally:
+        tcp_modules_clean_up()
+
+    dump_folders = {}
+    while not dumps.empty():
+        index, dump = dumps.get()
+        if dump is not None:
+            dump_folders[index] = dump
+    if len(dump_folders) < replicas:
+        logger.warning(
+            "%d of %d replicas failed", replicas - len(dump_folders), replicas
+        )
+    return dump_folders
+
+
+def _dump_csvs(folder, tables):
+    """
+    Dump tables as csv files into the folder of the replicas
+
+    Parameters
+    ----------
+    folder : str
+        Folder of the replicas
+    tables : Dict[str, pandas.DataFrame]
+        Tables, by file name
+    """
+    # `Pack` dumps into the folder of the experiment run last
+    previous_folder = Pack.FOLDER
+    Pack.FOLDER = folder
+    try:
+        for filename, table in tables.items():
+            Pack.dump_file(filename, table.to_csv(index=False))
+    finally:
+        Pack.FOLDER = previous_folder
+
+
+# pylint: disable=too-many-arguments
+def run_replicas(
+    name,
+    build,
+    replicas,
+    save_path=None,
+    metrics=None,
+    confidence=0.95,
+    tcp_module_params=None,
+):
+    """
+    Run replicas of an experiment concurrently, each on its own copy of
+    the topology. Writes to the folder of the replicas (besides their
+    dumps): flows.csv and aggregate.csv (the summaries of all the
+    replicas, See `summarize_dump`), flow_confidence.csv and
+    confidence.csv (See `confidence_intervals`).
+
+    Parameters
+    ----------
+    name : str
+        Name of the folder of the replicas
+    build : Callable
+        Called as `build(replica)` with the index of the replica, in the
+        process of the replica. Builds the topology, and returns the
+        `Experiment` to be run on it. The experiment shouldn't set TCP
+        module parameters, which are given with `tcp_module_params`
+    replicas : int
+        Number of replicas
+    save_path : str
+        Path to the folder of the replicas
+    metrics : List[str]
+        Metrics summarized (Default: all of `compare.METRICS`)
+    confidence : float
+        Confidence level of the intervals (Default value = 0.95)
+    tcp_module_params : Dict[str, dict]
+        TCP module parameters of all the replicas, by congestion
+        algorithm (See `Experiment.configure_tcp_module_params`)
+
+    Returns
+    -------
+    (pandas.DataFrame, pandas.DataFrame) or None
+        See `confidence_intervals`. None if no replica has results.
+    """
+    if TopologyMap.get_nodes():
+        raise RuntimeError(
+            "Every replica builds its own topology, so no topology should "
+            "be built before running replicas"
+        )
+
+    timestamp = time.strftime("%d-%m-%Y-%H:%M:%S")
+    folder = os.path.join(
+        save_path if save_path else ".", f"{name}({timestamp})_replicas"
+    )
+    try:
+        os.mkdir(folder)
+    except OSError:
+        logger.error(
+            "Failed to create replicas folder. Please check your dump path provided."
+        )
+        return None
+    Pack.set_owner(folder)
+
+    logger.info("Running %d replicas of %s", replicas, name)
+    dump_folders = _run_processes(build, replicas, folder, tcp_module_params)
+
+    summaries = run_in_pool(
+        [
+            partial(summarize_dump, dump_folders[index], f"replica{index}", metrics)
+            for index in sorted(dump_folders)
+        ],
+        description="Loading replicas",
+        collect=True,
+    )
+    summaries = [summary for summary in summaries if summary is not None]
+    if not summaries:
+        return None
+    flows = pd.concat([summary[0] for summary in summaries], ignore_index=True)
+    aggregate = pd.concat([summary[1] for summary in summaries], ignore_index=True)
+    if aggregate.empty:
+        logger.warning("No flows to summarize")
+        return None
+    flow_intervals, intervals = confidence_intervals(flows, aggregate, confidence)
+
+    _dump_csvs(
+        folder,
+        {
+            "flows.csv": flows,
+            "aggregate.csv": aggregate,
+            "flow_confidence.csv": flow_intervals,
+            "confidence.csv": intervals,
+        },
+    )
+    logger.info("Replicas dumped at %s", folder)
+    return flow_intervals, intervals
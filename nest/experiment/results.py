@@ -1,99 +1,398 @@
 # SPDX-License-Identifier: GPL-2.0-only
-# Copyright (c) 2019-2025 NITK Surathkal
+# Copyright (c) 2019-2026 NITK Surathkal
 
 """Handles collection of results (raw data)"""
 
-import json
-from multiprocessing import Manager
+import atexit
+import copy
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import uuid
+from nest import config
 from ..topology_map import TopologyMap
-from .pack import Pack
+from .columnar import RESULTS_FOLDER, dump_columnar, load_results
+from .compression import get_suffix
+from .json_writer import read_json, write_json
+from .live import LiveFeed
+from .pack import RESULT_SUFFIXES, Pack
+from .series import FlowSeries
+
+
+class ResultStore:
+    """
+    Stores the results of all tools as shards.
+
+    Every parser writes its result as a separate shard (file), so adding
+    a result neither depends on nor copies the results added before it.
+    The shards are merged only once, when the results are read.
+
+    Results parsed incrementally (while the experiment runs) are added
+    as fragments of a stream. Fragments of the same stream are merged
+    into a single result, in the order in which they were added.
+
+    A single store serves all the tools (a subdirectory per tool). No
+    directory is created until the first result is added, so importing
+    NeST doesn't create any files or helper processes.
+
+    Attributes
+    ----------
+    directory : str/None
+        Directory holding the shards. Created on first use if not given.
+    """
+
+    SHARD_SUFFIX = ".shard"
+
+    def __init__(self, directory=None):
+        """
+        Parameters
+        ----------
+        directory : str
+            Directory to hold the shards. If None, a temporary directory
+            is created on first use and removed on exit.
+        """
+        self._directory = directory
+
+        # Merged results of each tool, and the shards they were merged from
+        self._merged = {}
+        self._merged_shards = {}
+
+    @property
+    def directory(self):
+        """Directory holding the shards, created on first use"""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="nest-results-")
+            atexit.register(shutil.rmtree, self._directory, True)
+        return self._directory
+
+    def init(self):
+        """
+        Create the directory holding the shards, if not already created.
+
+        Must be called before forking processes that add results, so
+        that they share the directory with the experiment process.
+        """
+        return self.directory
+
+    def _tool_directory(self, toolname, create=False):
+        """
+        Directory holding the shards of `toolname`
+
+        Parameters
+        ----------
+        toolname : str
+            Like ss, tc, netperf
+        create : bool
+            Create the directory if it doesn't exist
+
+        Returns
+        -------
+        str/None
+            None if the directory doesn't exist and `create` is False
+        """
+        if self._directory is None and not create:
+            return None
+        path = os.path.join(self.directory, toolname)
+        if create:
+            os.makedirs(path, exist_ok=True)
+        elif not os.path.isdir(path):
+            return None
+        return path
+
+    def add(self, toolname, ns_name, result, stream=None):
+        """
+        Write `result` of `ns_name` as a new shard of `toolname`
+
+        Parameters
+        ----------
+        toolname : str
+            Like ss, tc, netperf
+        ns_name : str
+            User given name of the namespace
+        result : dict
+            parsed stats
+        stream : str
+            If given, `result` is a fragment of the result identified
+            by `stream`, and is merged with its earlier fragments
+        """
+        directory = self._tool_directory(toolname, create=True)
+        # Shard names sort in the order in which they were added
+        name = f"{time.monotonic_ns():020d}-{os.getpid()}-{uuid.uuid4().hex}"
+        temp_path = os.path.join(directory, f".{name}")
+        with open(temp_path, "wb") as shard:
+            pickle.dump(
+                (ns_name, result, stream), shard, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        # Rename is atomic, so readers never see a partially written shard
+        os.replace(
+            temp_path, os.path.join(directory, f"{name}{ResultStore.SHARD_SUFFIX}")
+        )
+
+    def _list_shards(self, toolname):
+        """Names of all complete shards of `toolname`, in the order they were added"""
+        directory = self._tool_directory(toolname)
+        if directory is None:
+            return []
+        return sorted(
+            name
+            for name in os.listdir(directory)
+            if name.endswith(ResultStore.SHARD_SUFFIX)
+        )
+
+    def get(self, toolname):
+        """
+        Merge all shards of `toolname` into a single dict keyed
+        by namespace name
+
+        Parameters
+        ----------
+        toolname : str
+            Like ss, tc, netperf
+
+        Returns
+        -------
+        dict
+            A copy of the merged results, which callers may modify
+        """
+        shards = self._list_shards(toolname)
+        if shards != self._merged_shards.get(toolname, []):
+            directory = self._tool_directory(toolname)
+            merged = {}
+            # First fragment of every stream, into which the rest are merged
+            streams = {}
+            for name in shards:
+                with open(os.path.join(directory, name), "rb") as shard:
+                    ns_name, result, stream = pickle.load(shard)
+                if stream in streams:
+                    _merge_fragment(streams[stream], result)
+                    continue
+                if stream is not None:
+                    streams[stream] = result
+                merged.setdefault(ns_name, []).append(result)
+            self._merged[toolname] = merged
+            self._merged_shards[toolname] = shards
+        # The merged results are kept to be returned again, so they
+        # mustn't be changed by the callers
+        return copy.deepcopy(self._merged.get(toolname, {}))
+
+    def size(self, toolname):
+        """
+        Total size (in bytes) of the shards of `toolname`, as an
+        estimate of the cost of writing its results
+
+        Parameters
+        ----------
+        toolname : str
+            Like ss, tc, netperf
+
+        Returns
+        -------
+        int
+        """
+        directory = self._tool_directory(toolname)
+        return sum(
+            os.path.getsize(os.path.join(directory, name))
+            for name in self._list_shards(toolname)
+        )
+
+    def clear(self, toolname):
+        """
+        Remove all shards of `toolname`
+
+        Parameters
+        ----------
+        toolname : str
+            Like ss, tc, netperf
+        """
+        directory = self._tool_directory(toolname)
+        if directory is not None:
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+        self._merged.pop(toolname, None)
+        self._merged_shards.pop(toolname, None)
+
+
+def _merge_fragment(result, fragment):
+    """
+    Merge `fragment` of a streamed result into `result`. Lists and
+    series are extended and dicts are merged key by key.
+
+    Parameters
+    ----------
+    result : dict
+        Fragments merged so far
+    fragment : dict
+        Fragment to be merged
+    """
+    for key, value in fragment.items():
+        if key not in result:
+            result[key] = value
+        elif isinstance(value, dict):
+            _merge_fragment(result[key], value)
+        elif isinstance(value, (list, FlowSeries)):
+            result[key].extend(value)
+        else:
+            result[key] = value
+
+
+# Store shared by all the tools of the experiment
+_store = ResultStore()
+
+
+def get_store():
+    """
+    Get the store holding the results of the experiment
+
+    Returns
+    -------
+    ResultStore
+    """
+    return _store
+
+
+def set_store(store):
+    """
+    Use `store` for holding the results of the experiments
+    run from now on (For eg., a separate store per process)
+
+    Parameters
+    ----------
+    store : ResultStore
+    """
+    global _store  # pylint: disable=global-statement
+    _store = store
 
 
 class Results:
     """This class aggregates the stats from the entire experiment environment"""
 
     @staticmethod
-    def add_result(results_q, ns_id, result):
+    def add_result(toolname, ns_id, result, stream=None):
         """
-        Adds the stats parse from a process to the shared `results_q`
+        Adds the stats parsed by a process to the shared store
 
         Parameters
         ----------
-        results_q : multiprocessing.Manager.Queue
-            Shared stats
+        toolname : str
+            Like ss, tc, netperf
         ns_id : string
             namespace id (internal name)
         result : dict
             parsed stats
+        stream : str
+            If given, `result` is a fragment of the result identified by
+            `stream`, parsed while the experiment runs
         """
         # Convert nest's internal name to user given name
         ns_name = TopologyMap.get_node(ns_id).name
-
-        item = results_q.get()
-        if ns_name not in item:
-            item[ns_name] = [result]
-        else:
-            temp = item[ns_name]
-            temp.append(result)
-            item[ns_name] = temp
-        results_q.put(item)
+        get_store().add(toolname, ns_name, result, stream)
+        if stream is not None:
+            LiveFeed.publish(toolname, ns_name, result)
 
     @staticmethod
-    def remove_all_results(results_q):
+    def remove_all_results(toolname):
         """
         Remove all results obtained from the experiment
 
         Parameters
         ----------
-        results_q : multiprocessing.Manager.Queue
-            Shared stats
+        toolname : str
+            Like ss, tc, netperf
         """
-        results_q.get()
-        results_q.put({})
+        get_store().clear(toolname)
 
     @staticmethod
-    def get_results(results_q):
+    def get_results(toolname):
         """
         Get results obtained in the experiment so far
 
         Parameters
         ----------
-        results_q : multiprocessing.Manager.Queue
-            Shared stats
+        toolname : str
+            Like ss, tc, netperf
         """
-        results = results_q.get()
-        results_q.put(results)
-        return results
+        return get_store().get(toolname)
 
     @staticmethod
-    def output_to_file(results_q, toolname):
+    def get_size(toolname):
         """
-        Outputs the aggregated results into a file.
+        Size (in bytes) of the results obtained in the experiment so far
+
+        Parameters
+        ----------
+        toolname : str
+            Like ss, tc, netperf
+        """
+        return get_store().size(toolname)
+
+    @staticmethod
+    def output_to_file(toolname, filename=None):
+        """
+        Outputs the aggregated results into a file (or into tables,
+        see `results_format` config).
         If results are empty, then it is not output to file.
 
         Parameters
         ----------
-        results_q : multiprocessing.Manager.Queue
-            Shared stats
         toolname : str
             Like ss, tc, netperf
+        filename : str
+            Name of the file (without extension). Defaults to `toolname`
         """
-        results = Results.get_results(results_q)
-        if results:
-            json_stats = json.dumps(results, indent=4)
-            Pack.dump_file(f"{toolname}.json", json_stats)
+        results = Results.get_results(toolname)
+        if not results:
+            return
 
+        results_format = config.get_value("results_format")
+        if results_format in ("npy", "parquet"):
+            dump_columnar(filename or toolname, results, results_format)
+        else:
+            # Written a flow at a time, see `json_output_style` config
+            style = config.get_value("json_output_style")
+            extension = "ndjson" if style == "ndjson" else "json"
+            if config.get_value("compress_outputs"):
+                extension += get_suffix()
+            path = Pack.get_path("", f"{filename or toolname}.{extension}")
+            write_json(path, results, style)
+            Pack.set_owner(path)
+
+    @staticmethod
+    def load_dump(dump_folder, tools=None):
+        """
+        Read the results stored in an experiment dump, in any of the
+        formats they are output in
 
-# Shared variables to aggregate results
-ss_results_q = Manager().Queue()
-ss_results_q.put({})
+        Parameters
+        ----------
+        dump_folder : str
+            Experiment dump (For eg., 'tcp(01-01-2026-10:00:00)_dump')
+        tools : List[str]
+            Tools whose results are read (Default: all)
+
+        Returns
+        -------
+        dict
+            Tool names mapped to their results
+        """
+        results = {}
+        for filename in sorted(os.listdir(dump_folder)):
+            toolname = filename.split(".")[0]
+            if filename.endswith(RESULT_SUFFIXES) and (
+                tools is None or toolname in tools
+            ):
+                results[toolname] = read_json(os.path.join(dump_folder, filename))
+        if os.path.isdir(os.path.join(dump_folder, RESULTS_FOLDER)):
+            results.update(load_results(dump_folder, tools))
+        return results
 
 
 class SsResults:
     """This class aggregates the ss stats from the entire experiment environment"""
 
     @staticmethod
-    def add_result(ns_id, result):
+    def add_result(ns_id, result, stream=None):
         """Adds the ss stats parse from a process to the shared `ss_results`
 
         Parameters
@@ -102,35 +401,33 @@ class SsResults:
             namespace id (internal name)
         result : dict
             parsed ss stats
+        stream : str
+            If given, `result` is a fragment of the result identified by
+            `stream`, parsed while the experiment runs
         """
-        Results.add_result(ss_results_q, ns_id, result)
+        Results.add_result("ss", ns_id, result, stream)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(ss_results_q)
+        Results.remove_all_results("ss")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(ss_results_q)
+        return Results.get_results("ss")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated ss stats to file"""
-        Results.output_to_file(ss_results_q, "ss")
-
-
-# Shared variables to aggregate results
-netperf_results_q = Manager().Queue()
-netperf_results_q.put({})
+        Results.output_to_file("ss")
 
 
 class NetperfResults:
     """This class aggregates the netperf stats from the entire experiment environment"""
 
     @staticmethod
-    def add_result(ns_id, result):
+    def add_result(ns_id, result, stream=None):
         """Adds the netperf stats parse from a process to the shared `netperf_results`
 
         Parameters
@@ -139,28 +436,26 @@ class NetperfResults:
             namespace id (internal name)
         result : dict
             parsed netperf stats
+        stream : str
+            If given, `result` is a fragment of the result identified by
+            `stream`, parsed while the experiment runs
         """
-        Results.add_result(netperf_results_q, ns_id, result)
+        Results.add_result("netperf", ns_id, result, stream)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(netperf_results_q)
+        Results.remove_all_results("netperf")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(netperf_results_q)
+        return Results.get_results("netperf")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated netperf stats to file"""
-        Results.output_to_file(netperf_results_q, "netperf")
-
-
-# Shared variables to aggregate results
-iperf3_results_q = Manager().Queue()
-iperf3_results_q.put({})
+        Results.output_to_file("netperf")
 
 
 class Iperf3Results:
@@ -177,34 +472,29 @@ class Iperf3Results:
         result : dict
             parsed netperf stats
         """
-        Results.add_result(iperf3_results_q, ns_id, result)
+        Results.add_result("iperf3", ns_id, result)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(iperf3_results_q)
+        Results.remove_all_results("iperf3")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(iperf3_results_q)
+        return Results.get_results("iperf3")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated netperf stats to file"""
-        Results.output_to_file(iperf3_results_q, "iperf3")
-
-
-# Shared variables to aggregate results
-tc_results_q = Manager().Queue()
-tc_results_q.put({})
+        Results.output_to_file("iperf3")
 
 
 class TcResults:
     """This class aggregates the tc stats from the entire experiment environment"""
 
     @staticmethod
-    def add_result(ns_id, result):
+    def add_result(ns_id, result, stream=None):
         """Adds the tc stats parse from a process to the shared `tc_results`
 
         Parameters
@@ -213,34 +503,97 @@ class TcResults:
             namespace id (internal name)
         result : dict
             parsed tc stats
+        stream : str
+            If given, `result` is a fragment of the result identified by
+            `stream`, parsed while the experiment runs
         """
-        Results.add_result(tc_results_q, ns_id, result)
+        Results.add_result("tc", ns_id, result, stream)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(tc_results_q)
+        Results.remove_all_results("tc")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(tc_results_q)
+        return Results.get_results("tc")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated tc stats to file"""
-        Results.output_to_file(tc_results_q, "tc")
+        Results.output_to_file("tc")
+
 
+class SnmpResults:
+    """This class aggregates the SNMP counters from the entire experiment environment"""
 
-ping_results_q = Manager().Queue()
-ping_results_q.put({})
+    @staticmethod
+    def add_result(ns_id, result):
+        """Adds the SNMP counters sampled in a namespace to the shared `snmp_results`
+
+        Parameters
+        ----------
+        ns_id : string
+            namespace id (internal name)
+        result : dict
+            change in SNMP counters over every interval
+        """
+        Results.add_result("snmp", ns_id, result)
+
+    @staticmethod
+    def remove_all_results():
+        """Remove all results obtained from the experiment"""
+        Results.remove_all_results("snmp")
+
+    @staticmethod
+    def get_results():
+        """Get results obtained in the experiment so far"""
+        return Results.get_results("snmp")
+
+    @staticmethod
+    def output_to_file():
+        """Outputs the aggregated SNMP counters to file"""
+        Results.output_to_file("snmp")
+
+
+class LinkResults:
+    """This class aggregates the interface counters from the entire experiment environment"""
+
+    @staticmethod
+    def add_result(ns_id, result):
+        """Adds the interface counters sampled in a namespace to the shared `link_results`
+
+        Parameters
+        ----------
+        ns_id : string
+            namespace id (internal name)
+        result : dict
+            change in interface counters, throughput and utilization
+        """
+        Results.add_result("link", ns_id, result)
+
+    @staticmethod
+    def remove_all_results():
+        """Remove all results obtained from the experiment"""
+        Results.remove_all_results("link")
+
+    @staticmethod
+    def get_results():
+        """Get results obtained in the experiment so far"""
+        return Results.get_results("link")
+
+    @staticmethod
+    def output_to_file():
+        """Outputs the aggregated interface counters to file"""
+        Results.output_to_file("link")
 
 
 class PingResults:
     """This class aggregates the ping stats from the entire experiment environment"""
 
     @staticmethod
-    def add_result(ns_id, result):
+    def add_result(ns_id, result, stream=None):
         """Adds the ping stats parse from a process to the shared `ping_results`
 
         Parameters
@@ -249,27 +602,26 @@ class PingResults:
             namespace id (internal name)
         result : dict
             parsed ping stats
+        stream : str
+            If given, `result` is a fragment of the result identified by
+            `stream`, parsed while the experiment runs
         """
-        Results.add_result(ping_results_q, ns_id, result)
+        Results.add_result("ping", ns_id, result, stream)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(ping_results_q)
+        Results.remove_all_results("ping")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(ping_results_q)
+        return Results.get_results("ping")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated ping stats to file"""
-        Results.output_to_file(ping_results_q, "ping")
-
-
-coap_results_q = Manager().Queue()
-coap_results_q.put({})
+        Results.output_to_file("ping")
 
 
 class CoAPResults:
@@ -286,27 +638,22 @@ class CoAPResults:
         result : dict
             parsed CoAP stats
         """
-        Results.add_result(coap_results_q, ns_id, result)
+        Results.add_result("coap", ns_id, result)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(coap_results_q)
+        Results.remove_all_results("coap")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        Results.get_results(coap_results_q)
+        return Results.get_results("coap")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated CoAP stats to file"""
-        Results.output_to_file(coap_results_q, "coap")
-
-
-# Shared variables to aggregate results
-iperf3_server_results_q = Manager().Queue()
-iperf3_server_results_q.put({})
+        Results.output_to_file("coap")
 
 
 class Iperf3ServerResults:
@@ -323,26 +670,22 @@ class Iperf3ServerResults:
         result : dict
             parsed iperf3 server stats
         """
-        Results.add_result(iperf3_server_results_q, ns_id, result)
+        Results.add_result("iperf3_server", ns_id, result)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(iperf3_server_results_q)
+        Results.remove_all_results("iperf3_server")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(iperf3_server_results_q)
+        return Results.get_results("iperf3_server")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated iperf3 stats to file"""
-        Results.output_to_file(iperf3_server_results_q, "iperf3Server")
-
-
-mpeg_dash_results_q = Manager().Queue()
-mpeg_dash_results_q.put({})
+        Results.output_to_file("iperf3_server", "iperf3Server")
 
 
 class MpegDashResults:
@@ -359,26 +702,22 @@ class MpegDashResults:
         result : dict
             parsed MPEG-DASH stats
         """
-        Results.add_result(mpeg_dash_results_q, ns_id, result)
+        Results.add_result("mpeg_dash", ns_id, result)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(mpeg_dash_results_q)
+        Results.remove_all_results("mpeg_dash")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(mpeg_dash_results_q)
+        return Results.get_results("mpeg_dash")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated MPEG-DASH stats to file"""
-        Results.output_to_file(mpeg_dash_results_q, "mpeg_dash")
-
-
-sip_results_q = Manager().Queue()
-sip_results_q.put({})
+        Results.output_to_file("mpeg_dash")
 
 
 class SipResults:
@@ -395,26 +734,22 @@ class SipResults:
         result : dict
             parsed SIP stats
         """
-        Results.add_result(sip_results_q, ns_id, result)
+        Results.add_result("sip", ns_id, result)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(sip_results_q)
+        Results.remove_all_results("sip")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(sip_results_q)
+        return Results.get_results("sip")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated SIP stats to file"""
-        Results.output_to_file(sip_results_q, "sip")
-
-
-http_results_q = Manager().Queue()
-http_results_q.put({})
+        Results.output_to_file("sip")
 
 
 class HTTPResults:
@@ -431,19 +766,19 @@ class HTTPResults:
         result : dict
             parsed HTTP stats
         """
-        Results.add_result(http_results_q, ns_id, result)
+        Results.add_result("http", ns_id, result)
 
     @staticmethod
     def remove_all_results():
         """Remove all results obtained from the experiment"""
-        Results.remove_all_results(http_results_q)
+        Results.remove_all_results("http")
 
     @staticmethod
     def get_results():
         """Get results obtained in the experiment so far"""
-        return Results.get_results(http_results_q)
+        return Results.get_results("http")
 
     @staticmethod
     def output_to_file():
         """Outputs the aggregated HTTP stats to file"""
-        Results.output_to_file(http_results_q, "http")
+        Results.output_to_file("http")
@@ -3,13 +3,13 @@
 
 """Script to be run for running experiments on topology"""
 
-from multiprocessing import Process
 from collections import namedtuple, defaultdict
 import logging
 import os
 import sys
 from time import sleep
 import copy
+from functools import partial
 from math import floor
 from tqdm import tqdm
 
@@ -20,14 +20,22 @@ from nest.topology_map import TopologyMap
 from nest.clean_up import kill_processes, tcp_modules_clean_up
 from nest import engine
 from .pack import Pack
+from .supervisor import ExperimentSupervisor, run_in_pool
+from .clock import ExperimentClock
+from .experiment_results import ExperimentResults
+from .live import start_live_server, stop_live_server
 
 # Import results
 from .results import (
+    get_store,
+    Results,
     Iperf3ServerResults,
     SsResults,
     NetperfResults,
     Iperf3Results,
     TcResults,
+    SnmpResults,
+    LinkResults,
     PingResults,
     CoAPResults,
     MpegDashResults,
@@ -37,9 +45,14 @@ from .results import (
 
 # Import parsers
 from .parser.ss import SsRunner
+from .parser.sock_diag import SockDiagRunner
 from .parser.netperf import NetperfRunner
 from .parser.iperf3 import Iperf3Runner, Iperf3ServerRunner
 from .parser.tc import TcRunner
+from .parser.qdisc_netlink import QdiscNetlinkRunner, is_decoded
+from .parser.sampler import SamplerRunner
+from .parser.snmp import SnmpRunner
+from .parser.link_stats import LinkStatsRunner
 from .parser.ping import PingRunner
 from .parser.coap import CoAPRunner
 from .parser.mpeg_dash import MpegDashRunner
@@ -50,11 +63,14 @@ from .plotter.ss import plot_ss
 from .plotter.netperf import plot_netperf
 from .plotter.iperf3 import plot_iperf3
 from .plotter.tc import plot_tc
+from .plotter.snmp import plot_snmp
+from .plotter.link import plot_link
 from .plotter.ping import plot_ping
 from .plotter.mpeg_dash import plot_mpeg_dash
 from ..engine.util import is_dependency_installed, is_package_installed
 from .parser.sip import SipRunner
 from .plotter.httperf import plot_httperf
+from .plotter.render import render_plots
 
 logger = logging.getLogger(__name__)
 if not any(isinstance(filter, DepedencyCheckFilter) for filter in logger.filters):
@@ -78,6 +94,10 @@ def run_experiment(exp):
     """
 
     tcp_modules_helper(exp)
+
+    # Results are stored only once an experiment is run
+    get_store().init()
+
     additional_tools = ["mptcpize"]
     tools = [
         "netperf",
@@ -91,11 +111,15 @@ def run_experiment(exp):
         "sip",
         "http",
     ]
-    Runners = namedtuple("runners", tools)
+    # Collectors which don't depend on any external tool
+    collectors = ["snmp", "link"]
+    Runners = namedtuple("runners", tools + collectors)
     exp_runners = Runners(
         netperf=[],
         ss=[],
         tc=[],
+        snmp=[],
+        link=[],
         iperf3=[],
         ping=[],
         coap=[],
@@ -130,6 +154,16 @@ def run_experiment(exp):
     ss_filters = set()
     server_runner = []
 
+    # Manages all the tools run in the experiment
+    supervisor = ExperimentSupervisor()
+
+    # Flow start and stop times, around which stats are sampled
+    # fast in adaptive sampling
+    sampling_events = set()
+
+    # Namespaces which send or receive flows
+    flow_nodes = set()
+
     # Traffic generation
     for flow in exp.flows:
         iperf3_options = {}
@@ -146,6 +180,8 @@ def run_experiment(exp):
         ] = flow._get_props()  # pylint: disable=protected-access
 
         exp_end_t = max(exp_end_t, stop_t)
+        sampling_events.update((start_t, stop_t))
+        flow_nodes.update((src_ns, dst_ns))
 
         min_start, max_stop = ping_schedules[(src_ns, dst_ns, dst_addr)]
         ping_schedules[(src_ns, dst_ns, dst_addr)] = (
@@ -178,6 +214,7 @@ def run_experiment(exp):
                     ss_schedules,
                     destination_nodes["netperf"],
                     options["protocol"] == "MPTCP",
+                    netperf_interval=exp.get_sampling_interval("netperf"),
                 )
                 exp_runners.netperf.extend(tcp_runners)
                 # Update destination nodes
@@ -233,6 +270,7 @@ def run_experiment(exp):
 
         server_runner.extend(
             run_server(
+                supervisor,
                 iperf3_options,
                 exp_end_t,
                 options["protocol"],
@@ -339,25 +377,68 @@ def run_experiment(exp):
 
     if ss_required:
         ss_filter = " and ".join(ss_filters)
-        ss_runners = setup_ss_runners(dependencies["ss"], ss_schedules, ss_filter)
+        ss_runners = setup_ss_runners(
+            dependencies["ss"],
+            ss_schedules,
+            ss_filter,
+            exp.get_sampling_interval("socket_stats"),
+        )
         exp_runners.ss.extend(ss_runners)
 
-    tc_runners = setup_tc_runners(dependencies["tc"], exp.qdisc_stats, exp_end_t)
+    tc_runners = setup_tc_runners(
+        dependencies["tc"],
+        exp.qdisc_stats,
+        exp_end_t,
+        exp.get_sampling_interval("qdisc_stats"),
+    )
     exp_runners.tc.extend(tc_runners)
 
+    snmp_runners = setup_snmp_runners(
+        exp.node_stats,
+        flow_nodes,
+        exp_end_t,
+        exp.get_sampling_interval("snmp_stats"),
+    )
+    exp_runners.snmp.extend(snmp_runners)
+
+    link_runners = setup_link_runners(
+        exp.link_stats, exp_end_t, exp.get_sampling_interval("link_stats")
+    )
+    exp_runners.link.extend(link_runners)
+
+    # Only the in-process samplers support adaptive sampling
+    max_sampling_interval = exp.get_max_sampling_interval()
+    if max_sampling_interval is not None:
+        samplers = exp_runners.ss + exp_runners.tc + exp_runners.snmp
+        for runner in samplers + exp_runners.link:
+            if isinstance(runner, SamplerRunner):
+                runner.set_adaptive(max_sampling_interval, sampling_events)
+
     ping_runners = setup_ping_runners(dependencies["ping"], ping_schedules)
     exp_runners.ping.extend(ping_runners)
 
+    live_server = None
+    if config.get_value("live_endpoint"):
+        live_server = start_live_server(max(exp_end_t, 0))
+
     try:
-        # Start traffic generation
-        run_workers(setup_flow_workers(exp_runners, exp_end_t))
+        # Start traffic generation. All flows are released against
+        # a single experiment epoch.
+        runners, extra_jobs = setup_flow_workers(exp_runners, exp_end_t)
+        ExperimentClock.start()
+        supervisor.run(runners, extra_jobs)
+
+        # No thread may run while worker processes are forked below
+        stop_live_server(live_server)
+        live_server = None
 
         logger.info("Parsing statistics...")
 
         exp_runners.server.extend(server_runner)
 
-        # Parse the stored statistics
-        run_workers(setup_parser_workers(exp_runners))
+        # Parse the stored statistics, largest outputs first
+        parsers, output_sizes = setup_parser_workers(exp_runners)
+        run_in_pool(parsers, output_sizes, "Parsing")
 
         logger.info("Parsing statistics complete!")
         logger.info("Output results as JSON dump...")
@@ -374,8 +455,8 @@ def run_experiment(exp):
         if config.get_value("plot_results"):
             logger.info("Plotting results...")
 
-            # Plot results and dump them as images
-            run_workers(setup_plotter_workers())
+            # Plot results and dump them as images, a figure per job
+            render_plots(setup_plotter_workers())
 
             logger.info("Plotting complete!")
 
@@ -387,9 +468,15 @@ def run_experiment(exp):
             exp.name,
         )
     finally:
-        results = get_results() if exp.return_results else None
+        stop_live_server(live_server)
+        results = ExperimentResults(get_results()) if exp.return_results else None
         cleanup()
 
+    if config.get_value("compress_dump"):
+        logger.info("Compressing experiment dump...")
+        archive = Pack.compress()
+        logger.info("Experiment dump compressed to %s", archive)
+
     return results
 
 
@@ -429,12 +516,14 @@ def tcp_modules_helper(exp):
                     engine.load_tcp_module(cong_algo, params_string)
 
 
-def run_server(iperf3options, exp_end_t, protocol, is_mptcp):
+def run_server(supervisor, iperf3options, exp_end_t, protocol, is_mptcp):
     """
     Run and wait for all server to start
 
     Parameters
     ----------
+    supervisor: ExperimentSupervisor
+        supervisor managing the tools of the experiment
     iperf3options: dict
         start server with iperf3 server options
     exp_end_t: int
@@ -451,68 +540,97 @@ def run_server(iperf3options, exp_end_t, protocol, is_mptcp):
             server_list.append(runner_obj)
 
     for server in server_list:
-        process = Process(target=server.run)
-        process.start()
+        supervisor.start_background(server)
 
     return server_list
 
 
-def run_workers(workers):
+# Plotters of the tools
+PLOTTERS = {
+    "ss": plot_ss,
+    "tc": plot_tc,
+    "netperf": plot_netperf,
+    "iperf3": plot_iperf3,
+    "snmp": plot_snmp,
+    "link": plot_link,
+    "ping": plot_ping,
+    "mpeg_dash": plot_mpeg_dash,
+    "http": plot_httperf,
+}
+
+
+def setup_plotter_workers(results=None):
     """
-    Run and wait for processes to finish
+    Setup plotting jobs
 
     Parameters
     ----------
-    workers: list[multiprocessing.Process]
-        List of processes to be run
+    results : dict
+        Tool names mapped to their results
+        (Default: results of the experiment being run)
+
+    Returns
+    -------
+    List[Callable]
+        plotters, collecting the plots to be rendered by `render_plots`
     """
-    # Start workers
-    for worker in workers:
-        worker.start()
+    if results is None:
+        results = {toolname: Results.get_results(toolname) for toolname in PLOTTERS}
 
-    # wait for all the workers to finish
-    for worker in workers:
-        worker.join()
+    return [
+        partial(plotter, results[toolname])
+        for toolname, plotter in PLOTTERS.items()
+        if results.get(toolname)
+    ]
 
 
-def setup_plotter_workers():
+def replot(dump_folder, results=None, metrics=None):
     """
-    Setup plotting processes
+    Plot the results stored in an experiment dump again, into the same
+    folder. If `plot_incremental` config is enabled, only the plots
+    whose data has changed are rendered.
 
-    Returns
-    -------
-    List[multiprocessing.Process]
-        plotters
+    Parameters
+    ----------
+    dump_folder : str
+        Experiment dump (For eg., 'tcp(01-01-2026-10:00:00)_dump')
+    results : dict
+        Tool names mapped to the results to be plotted
+        (Default: all the results stored in `dump_folder`)
+    metrics : List[str]
+        If given, only plots of these metrics are rendered
     """
-    plotters = []
-
-    plotters.append(Process(target=plot_ss, args=(SsResults.get_results(),)))
-    plotters.append(Process(target=plot_netperf, args=(NetperfResults.get_results(),)))
-    plotters.append(Process(target=plot_iperf3, args=(Iperf3Results.get_results(),)))
-    plotters.append(Process(target=plot_tc, args=(TcResults.get_results(),)))
-    plotters.append(Process(target=plot_ping, args=(PingResults.get_results(),)))
-    plotters.append(
-        Process(target=plot_mpeg_dash, args=(MpegDashResults.get_results(),))
-    )
-    plotters.append(Process(target=plot_httperf, args=(HTTPResults.get_results(),)))
-
-    return plotters
+    Pack.FOLDER = dump_folder
+    if results is None:
+        results = Results.load_dump(dump_folder, list(PLOTTERS))
+    render_plots(setup_plotter_workers(results), metrics)
 
 
 def dump_json_outputs():
     """
-    Outputs experiment results as json dumps
+    Outputs experiment results as json dumps (or in the format set by
+    `results_format` config). Results of different tools are written
+    concurrently, largest first.
     """
-    SsResults.output_to_file()
-    NetperfResults.output_to_file()
-    Iperf3Results.output_to_file()
-    TcResults.output_to_file()
-    PingResults.output_to_file()
-    CoAPResults.output_to_file()
-    Iperf3ServerResults.output_to_file()
-    MpegDashResults.output_to_file()
-    SipResults.output_to_file()
-    HTTPResults.output_to_file()
+    writers = {
+        "ss": SsResults.output_to_file,
+        "netperf": NetperfResults.output_to_file,
+        "iperf3": Iperf3Results.output_to_file,
+        "tc": TcResults.output_to_file,
+        "snmp": SnmpResults.output_to_file,
+        "link": LinkResults.output_to_file,
+        "ping": PingResults.output_to_file,
+        "coap": CoAPResults.output_to_file,
+        "iperf3_server": Iperf3ServerResults.output_to_file,
+        "mpeg_dash": MpegDashResults.output_to_file,
+        "sip": SipResults.output_to_file,
+        "http": HTTPResults.output_to_file,
+    }
+    run_in_pool(
+        list(writers.values()),
+        [Results.get_size(toolname) for toolname in writers],
+        "Writing results",
+    )
 
 
 def get_results():
@@ -530,6 +648,8 @@ def get_results():
     results["netperf"] = NetperfResults.get_results()
     results["iperf3"] = Iperf3Results.get_results()
     results["tc"] = TcResults.get_results()
+    results["snmp"] = SnmpResults.get_results()
+    results["link"] = LinkResults.get_results()
     results["ping"] = PingResults.get_results()
     results["coap"] = CoAPResults.get_results()
     results["iperf3_server"] = Iperf3ServerResults.get_results()
@@ -544,9 +664,9 @@ def get_results():
 
 def setup_flow_workers(exp_runners, exp_stop_time):
     """
-    Setup flow generation and stats collection processes(netperf, ss, tc, iperf3...).
+    Setup flow generation and stats collection runners(netperf, ss, tc, iperf3...).
 
-    Also add a progress bar process for showing experiment progress.
+    Also add a progress bar job for showing experiment progress.
 
     Parameters
     ----------
@@ -557,25 +677,26 @@ def setup_flow_workers(exp_runners, exp_stop_time):
 
     Returns
     -------
-    List[multiprocessing.Process]
-        flow generation and stats collection processes
-        + progress bar process
+    (List[Runner], List[Callable])
+        flow generation and stats collection runners
+        + progress bar job
     """
     workers = []
+    extra_jobs = []
 
     for runners in exp_runners:
-        workers.extend([Process(target=runner.run) for runner in runners])
+        workers.extend(runners)
 
-    # Add progress bar process
+    # Add progress bar job
     if config.get_value("show_progress_bar"):
-        workers.extend([Process(target=progress_bar, args=(exp_stop_time,))])
+        extra_jobs.append(partial(progress_bar, exp_stop_time))
 
-    return workers
+    return workers, extra_jobs
 
 
 def setup_parser_workers(exp_runners):
     """
-    Setup parsing processes
+    Setup parsing jobs
 
     Parameters
     ----------
@@ -584,42 +705,21 @@ def setup_parser_workers(exp_runners):
 
     Returns
     -------
-    List[multiprocessing.Process]
-        parsers
+    (List[Callable], List[int])
+        parsers, to be run in the worker pool, and the size of
+        the output each of them parses
     """
-    parsers = []
-
-    for ss_runner in exp_runners.ss:
-        parsers.append(Process(target=ss_runner.parse))
-
-    for netperf_runner in exp_runners.netperf:
-        parsers.append(Process(target=netperf_runner.parse))
-
-    for iperf3_runner in exp_runners.iperf3:
-        parsers.append(Process(target=iperf3_runner.parse))
-
-    for tc_runner in exp_runners.tc:
-        parsers.append(Process(target=tc_runner.parse))
-
-    for ping_runner in exp_runners.ping:
-        parsers.append(Process(target=ping_runner.parse))
-
-    for coap_runner in exp_runners.coap:
-        parsers.append(Process(target=coap_runner.parse))
-
-    for mpeg_dash_runner in exp_runners.mpeg_dash:
-        parsers.append(Process(target=mpeg_dash_runner.parse))
-
-    for server_runner in exp_runners.server:
-        parsers.append(Process(target=server_runner.parse))
-
-    for sip_runner in exp_runners.sip:
-        parsers.append(Process(target=sip_runner.parse))
-
-    for http_runner in exp_runners.http:
-        parsers.append(Process(target=http_runner.parse))
+    # Output parsed while the experiment ran needn't be parsed again
+    runners = [
+        runner
+        for tool_runners in exp_runners
+        for runner in tool_runners
+        if not runner.streamed
+    ]
 
-    return parsers
+    parsers = [runner.parse for runner in runners]
+    output_sizes = [runner.get_output_size() for runner in runners]
+    return parsers, output_sizes
 
 
 def get_dependency_status(exp, tools):
@@ -674,8 +774,14 @@ def get_dependency_status(exp, tools):
     return dependencies
 
 
+# pylint: disable=too-many-arguments
 def setup_tcp_flows(
-    dependencies, flow, ss_schedules, destination_nodes, is_mptcp=False
+    dependencies,
+    flow,
+    ss_schedules,
+    destination_nodes,
+    is_mptcp=False,
+    netperf_interval=None,
 ):
     """
     Setup netperf/iperf3 to run tcp flows
@@ -691,6 +797,8 @@ def setup_tcp_flows(
         Destination nodes so far already running netperf/iperf3 server
     is_mptcp:
         boolean to determine if connection is MPTCP enabled
+    netperf_interval:
+        time (in seconds) between two interim results of netperf
 
     Returns
     -------
@@ -747,6 +855,8 @@ def setup_tcp_flows(
         netperf_options = {}
         netperf_options["testname"] = "TCP_STREAM"
         netperf_options["cong_algo"] = options["cong_algo"]
+        if netperf_interval is not None:
+            netperf_options["interval"] = netperf_interval
         f_flow = "flow" if n_flows == 1 else "flows"
         logger.info(
             "Running %s netperf %s from %s (%s) to %s...",
@@ -893,7 +1003,7 @@ def setup_udp_flows(dependency, flow):
     return iperf3_runners
 
 
-def setup_ss_runners(dependency, ss_schedules, ss_filter):
+def setup_ss_runners(dependency, ss_schedules, ss_filter, interval=None):
     """
     setup SsRunners for collecting tcp socket statistics
 
@@ -903,6 +1013,10 @@ def setup_ss_runners(dependency, ss_schedules, ss_filter):
         whether ss is installed
     ss_schedules: dict
         start time and end time for SsRunners
+    ss_filter: str
+        ss filter for connections to be excluded
+    interval: float
+        time (in seconds) between two samples
 
     Returns
     -------
@@ -911,6 +1025,8 @@ def setup_ss_runners(dependency, ss_schedules, ss_filter):
     runners: List[SsRunners]
     """
     runners = []
+    if config.get_value("socket_stats_collector") == "sock_diag":
+        return setup_sock_diag_runners(ss_schedules, ss_filter, interval)
     if dependency:
         logger.info("Running ss on nodes...")
         for key, timings in ss_schedules.items():
@@ -924,6 +1040,7 @@ def setup_ss_runners(dependency, ss_schedules, ss_filter):
                 timings[1] - timings[0],
                 dst_ns,
                 ss_filter=ss_filter,
+                interval=interval,
             )
             runners.append(ss_runner)
     else:
@@ -931,7 +1048,36 @@ def setup_ss_runners(dependency, ss_schedules, ss_filter):
     return runners
 
 
-def setup_tc_runners(dependency, qdisc_stats, exp_end):
+def setup_sock_diag_runners(ss_schedules, ss_filter, interval=None):
+    """
+    setup SockDiagRunners for collecting tcp socket statistics, one
+    for every source namespace
+
+    Parameters
+    ----------
+    ss_schedules: dict
+        start time and end time for every source and destination pair
+    ss_filter: str
+        ss filter for connections to be excluded
+    interval: float
+        time (in seconds) between two samples
+
+    Returns
+    -------
+    runners: List[SockDiagRunner]
+    """
+    destinations = defaultdict(list)
+    for (src_ns, dst_ns, dst_addr), timings in ss_schedules.items():
+        destinations[src_ns].append((dst_ns, dst_addr, timings[0], timings[1]))
+
+    logger.info("Collecting socket stats on nodes...")
+    return [
+        SockDiagRunner(src_ns, src_destinations, ss_filter=ss_filter, interval=interval)
+        for src_ns, src_destinations in destinations.items()
+    ]
+
+
+def setup_tc_runners(dependency, qdisc_stats, exp_end, interval=None):
     """
     setup TcRunners for collecting qdisc statistics
 
@@ -943,6 +1089,8 @@ def setup_tc_runners(dependency, qdisc_stats, exp_end):
         info regarding nodes to run tc on
     exp_end: float
         time to stop running tc
+    interval: float
+        time (in seconds) between two samples
     Returns
     -------
     workers: List[multiprocessing.Process]
@@ -950,11 +1098,29 @@ def setup_tc_runners(dependency, qdisc_stats, exp_end):
     runners: List[TcRunners]
     """
     runners = []
+    if config.get_value("qdisc_stats_collector") == "netlink":
+        runners = setup_qdisc_netlink_runners(
+            [stat for stat in qdisc_stats if is_decoded(stat["qdisc"])],
+            exp_end,
+            interval,
+        )
+        # Stats of the other qdiscs would be incomplete
+        qdisc_stats = [stat for stat in qdisc_stats if not is_decoded(stat["qdisc"])]
+        if qdisc_stats:
+            logger.info(
+                "Stats of %s qdiscs can't be collected using netlink, using tc",
+                ", ".join(sorted({stat["qdisc"] for stat in qdisc_stats})),
+            )
     if dependency and len(qdisc_stats) > 0:
         logger.info("Running tc on requested interfaces...")
         for qdisc_stat in qdisc_stats:
             tc_runner = TcRunner(
-                qdisc_stat["ns_id"], qdisc_stat["int_id"], qdisc_stat["qdisc"], exp_end
+                qdisc_stat["ns_id"],
+                qdisc_stat["int_id"],
+                qdisc_stat["qdisc"],
+                exp_end,
+                stats=qdisc_stat["stats"],
+                interval=interval,
             )
             runners.append(tc_runner)
     elif not dependency:
@@ -962,6 +1128,125 @@ def setup_tc_runners(dependency, qdisc_stats, exp_end):
     return runners
 
 
+def setup_qdisc_netlink_runners(qdisc_stats, exp_end, interval=None):
+    """
+    setup QdiscNetlinkRunners for collecting qdisc statistics, one
+    for every namespace
+
+    Parameters
+    ----------
+    qdisc_stats: dict
+        info regarding interfaces to collect qdisc stats from
+    exp_end: float
+        time to stop collecting qdisc stats
+    interval: float
+        time (in seconds) between two samples
+
+    Returns
+    -------
+    runners: List[QdiscNetlinkRunner]
+    """
+    interfaces = defaultdict(list)
+    for qdisc_stat in qdisc_stats:
+        interfaces[qdisc_stat["ns_id"]].append(qdisc_stat)
+
+    if interfaces:
+        logger.info("Collecting qdisc stats on requested interfaces...")
+    return [
+        QdiscNetlinkRunner(ns_id, ns_interfaces, exp_end, interval)
+        for ns_id, ns_interfaces in interfaces.items()
+    ]
+
+
+def setup_snmp_runners(node_stats, flow_nodes, exp_end, interval=None):
+    """
+    setup SnmpRunners for sampling SNMP counters, one for every
+    requested namespace
+
+    Parameters
+    ----------
+    node_stats: List[dict]
+        namespaces (None for all the namespaces in `flow_nodes`)
+        and the counters required, as stored by `Experiment.require_node_stats`
+    flow_nodes: set
+        namespaces which send or receive flows
+    exp_end: float
+        time to stop sampling SNMP counters
+    interval: float
+        time (in seconds) between two samples
+
+    Returns
+    -------
+    runners: List[SnmpRunner]
+    """
+    stats = {}
+    for node_stat in node_stats:
+        ns_ids = flow_nodes if node_stat["ns_id"] is None else [node_stat["ns_id"]]
+        for ns_id in ns_ids:
+            # All counters are stored if any request is for all of them
+            if ns_id in stats and not (stats[ns_id] and node_stat["stats"]):
+                stats[ns_id] = []
+            else:
+                stats[ns_id] = stats.get(ns_id, []) + node_stat["stats"]
+
+    if stats:
+        logger.info("Sampling SNMP counters on requested nodes...")
+    return [
+        SnmpRunner(ns_id, exp_end, ns_stats, interval)
+        for ns_id, ns_stats in stats.items()
+    ]
+
+
+def setup_link_runners(link_stats, exp_end, interval=None):
+    """
+    setup a single LinkStatsRunner for sampling the counters of all
+    the requested interfaces
+
+    Parameters
+    ----------
+    link_stats: List[BaseInterface/None]
+        interfaces to be sampled (None for all the interfaces),
+        as stored by `Experiment.require_link_stats`
+    exp_end: float
+        time to stop sampling the counters
+    interval: float
+        time (in seconds) between two samples
+
+    Returns
+    -------
+    runners: List[LinkStatsRunner]
+    """
+    if not link_stats:
+        return []
+
+    if None in link_stats:
+        link_stats = [
+            interface
+            for node in TopologyMap.get_nodes().values()
+            for interface in node.interfaces
+        ]
+
+    # Namespace id mapped to (interface id, bandwidth) of its interfaces
+    interfaces = defaultdict(dict)
+    for interface in link_stats:
+        bandwidth = interface.get_bandwidth()
+        interfaces[interface.node_id][interface.id] = (
+            None if bandwidth is None else bandwidth.bits_per_second
+        )
+
+    logger.info("Sampling link stats on requested interfaces...")
+    return [
+        LinkStatsRunner(
+            {
+                ns_id: list(ns_interfaces.items())
+                for ns_id, ns_interfaces in interfaces.items()
+            },
+            exp_end,
+            interval,
+        )
+    ]
+
+
 def setup_ping_runners(dependency, ping_schedules):
     """
     setup PingRunners for collecting latency
@@ -1279,6 +1564,8 @@ def cleanup():
     SsResults.remove_all_results()
     NetperfResults.remove_all_results()
     TcResults.remove_all_results()
+    SnmpResults.remove_all_results()
+    LinkResults.remove_all_results()
     PingResults.remove_all_results()
     CoAPResults.remove_all_results()
     Iperf3Results.remove_all_results()
@@ -1287,6 +1574,8 @@ def cleanup():
     SipResults.remove_all_results()
     HTTPResults.remove_all_results()
 
+    ExperimentClock.reset()
+
     # Clean up the configured TCP modules and kill processes
     tcp_modules_clean_up()
     kill_processes()
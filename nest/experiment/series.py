@@ -0,0 +1,350 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Columnar storage of the samples of a flow"""
+
+import math
+from collections.abc import Sequence
+import numpy as np
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _to_column(values):
+    """
+    Convert the values of a parameter to an array. Missing values
+    (None) are stored as NaN in numeric columns.
+
+    Parameters
+    ----------
+    values : List
+        Value of the parameter in every sample
+
+    Returns
+    -------
+    numpy.ndarray
+        int64 if all values are integers, float64 if all are numbers
+        (or missing), else object. Numeric strings, as stored by older
+        versions of NeST, are converted to float64.
+    """
+    kinds = set(map(type, values))
+    if kinds <= {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return np.array(values, dtype=np.float64)
+    if kinds <= {int, float, type(None)}:
+        return np.array(values, dtype=np.float64)
+    if kinds <= {str, int, float, type(None)}:
+        try:
+            return np.array(
+                [np.nan if value is None else float(value) for value in values],
+                dtype=np.float64,
+            )
+        except ValueError:
+            # Not all values are numbers (For eg., "2ms")
+            pass
+    return np.array(values, dtype=object)
+
+
+def _missing(column, length):
+    """Column of `length` missing values, of the same kind as `column`"""
+    if column.dtype == object:
+        return np.full(length, None, dtype=object)
+    return np.full(length, np.nan)
+
+
+def is_record_list(value):
+    """
+    Whether `value` is a list of timestamped records, with scalar values,
+    optionally preceded by a "meta" item
+    """
+    if not isinstance(value, list) or not value:
+        return False
+    if not all(isinstance(record, dict) for record in value):
+        return False
+    records = value[1:] if value[0].get("meta") else value
+    return all(
+        "timestamp" in record
+        and all(isinstance(item, _SCALARS) for item in record.values())
+        for record in records
+    )
+
+
+def _is_missing(value):
+    """Whether `value` of a column is a missing value"""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+class FlowSeries(Sequence):
+    """
+    Samples of a flow stored column-wise: a timestamp array shared by
+    an array per parameter. Numeric parameters are stored as numbers,
+    with NaN in the samples which don't have them.
+
+    Also behaves as the list of records it replaces, i.e., the "meta"
+    item (if any) followed by a dict per sample, so that results can
+    still be indexed and iterated as before. The records are built only
+    when accessed.
+
+    Attributes
+    ----------
+    meta : dict/None
+        "meta" item with user given information. None for a series
+        which continues an earlier one.
+    """
+
+    def __init__(self, meta=None, timestamp=(), columns=None):
+        """
+        Parameters
+        ----------
+        meta : dict
+            "meta" item with user given information
+        timestamp : List/numpy.ndarray
+            Time at which each sample was taken
+        columns : dict
+            Parameter names mapped to their value in every sample
+        """
+        self.meta = meta
+        timestamp = np.asarray(timestamp, dtype=np.float64)
+        columns = {
+            name: column if isinstance(column, np.ndarray) else _to_column(column)
+            for name, column in (columns or {}).items()
+        }
+        # Series appended by `extend`, concatenated when accessed
+        self._parts = [(timestamp, columns)]
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a series from a list of records
+
+        Parameters
+        ----------
+        records : List[dict]
+            "meta" item (if any) followed by a dict, with a "timestamp",
+            per sample
+
+        Returns
+        -------
+        FlowSeries
+        """
+        if isinstance(records, FlowSeries):
+            return records
+        meta = None
+        if records and records[0].get("meta"):
+            meta = records[0]
+            records = records[1:]
+        builder = SeriesBuilder(meta)
+        for record in records:
+            values = dict(record)
+            builder.append(values.pop("timestamp"), values)
+        return builder.build()
+
+    def _consolidate(self):
+        """Concatenate the series appended by `extend`"""
+        if len(self._parts) == 1:
+            return self._parts[0]
+
+        lengths = [len(timestamp) for timestamp, _ in self._parts]
+        names = {}
+        for _, columns in self._parts:
+            for name, column in columns.items():
+                names.setdefault(name, column)
+
+        columns = {}
+        for name, first in names.items():
+            columns[name] = np.concatenate(
+                [
+                    (
+                        part_columns[name]
+                        if name in part_columns
+                        else _missing(first, length)
+                    )
+                    for (_, part_columns), length in zip(self._parts, lengths)
+                ]
+            )
+        timestamp = np.concatenate([timestamp for timestamp, _ in self._parts])
+        self._parts = [(timestamp, columns)]
+        return self._parts[0]
+
+    @property
+    def timestamp(self):
+        """Time at which each sample was taken, as a float64 array"""
+        return self._consolidate()[0]
+
+    @property
+    def columns(self):
+        """Parameter names mapped to their array of values"""
+        return self._consolidate()[1]
+
+    def column(self, name):
+        """
+        Values of a parameter in every sample
+
+        Parameters
+        ----------
+        name : str
+            Name of the parameter
+
+        Returns
+        -------
+        numpy.ndarray
+            float64 array (NaN for missing values) for numeric parameters,
+            all NaN if the parameter isn't present in any sample
+        """
+        column = self.columns.get(name)
+        if column is None:
+            return np.full(len(self.timestamp), np.nan)
+        if column.dtype == np.int64:
+            return column.astype(np.float64)
+        return column
+
+    def extend(self, series):
+        """
+        Append the samples of `series`, which continues this series
+
+        Parameters
+        ----------
+        series : FlowSeries/List[dict]
+        """
+        series = FlowSeries.from_records(series)
+        if self.meta is None:
+            self.meta = series.meta
+        self._parts.extend(series._parts)  # pylint: disable=protected-access
+
+    def to_records(self):
+        """
+        Convert the series to the list of records it replaces
+
+        Returns
+        -------
+        List[dict]
+            "meta" item (if any) followed by a dict per sample
+        """
+        timestamp, columns = self._consolidate()
+        values = {name: column.tolist() for name, column in columns.items()}
+        records = [] if self.meta is None else [self.meta]
+        for index, sample_time in enumerate(timestamp.tolist()):
+            record = {"timestamp": sample_time}
+            for name, column in values.items():
+                if not _is_missing(column[index]):
+                    record[name] = column[index]
+            records.append(record)
+        return records
+
+    def __len__(self):
+        return sum(len(timestamp) for timestamp, _ in self._parts) + (
+            self.meta is not None
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_records()[index]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FlowSeries index out of range")
+        if self.meta is not None:
+            if index == 0:
+                return self.meta
+            index -= 1
+
+        timestamp, columns = self._consolidate()
+        record = {"timestamp": timestamp[index].item()}
+        for name, column in columns.items():
+            value = column[index]
+            value = value.item() if isinstance(value, np.generic) else value
+            if not _is_missing(value):
+                record[name] = value
+        return record
+
+    def __eq__(self, other):
+        if isinstance(other, (FlowSeries, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return (
+            f"FlowSeries({len(self.timestamp)} samples of "
+            f"{', '.join(self.columns) or 'no parameters'})"
+        )
+
+
+class SeriesBuilder:
+    """
+    Collects samples of a flow one at a time, and converts them
+    to a `FlowSeries` once all of them are collected
+    """
+
+    def __init__(self, meta=None):
+        """
+        Parameters
+        ----------
+        meta : dict
+            "meta" item with user given information
+        """
+        self.meta = meta
+        self._timestamp = []
+        self._columns = {}
+
+    def append(self, timestamp, values):
+        """
+        Add a sample
+
+        Parameters
+        ----------
+        timestamp : float/str
+            Time at which the sample was taken
+        values : dict
+            Parameter names mapped to their values in the sample
+        """
+        index = len(self._timestamp)
+        self._timestamp.append(float(timestamp))
+        for name, value in values.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = [None] * index
+            elif len(column) < index:
+                column.extend([None] * (index - len(column)))
+            column.append(value)
+
+    def __len__(self):
+        return len(self._timestamp)
+
+    def build(self):
+        """
+        Convert the collected samples to a series
+
+        Returns
+        -------
+        FlowSeries
+        """
+        length = len(self._timestamp)
+        for column in self._columns.values():
+            column.extend([None] * (length - len(column)))
+        return FlowSeries(self.meta, self._timestamp, self._columns)
+
+
+def json_default(obj):
+    """
+    Convert the objects in results, which `json` can't serialize.
+    Pass as `default` to `json.dump`.
+
+    Parameters
+    ----------
+    obj : object
+
+    Returns
+    -------
+    object
+        A JSON serializable equivalent of `obj`
+    """
+    if isinstance(obj, FlowSeries):
+        return obj.to_records()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
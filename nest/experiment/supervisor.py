@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Supervise the tools run during an experiment.
+
+Instead of forking one python process for every runner (netperf, iperf3,
+ss, tc, ping...), the runners are run by threads of the experiment process.
+The tools themselves still run as separate (non-python) subprocesses, and
+runners block on them through the engine, so each runner has a thread of
+its own waiting on it (and samplers, such as sock_diag, sample from their
+thread). The number of threads is bounded by `max_runner_threads` config.
+
+Parsing and plotting, which are CPU bound, are done by a bounded pool of
+forked worker processes, each pool handing its jobs to its workers when
+they are forked. Forking while other threads run is unsafe (a
+lock held by such a thread stays held in the child), so the supervisor
+stops and joins all its threads before returning, and the pool is only
+used after that.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from tqdm import tqdm
+from nest import config
+from nest.clean_up import kill_ns_processes
+from .clock import ExperimentClock
+
+logger = logging.getLogger(__name__)
+
+# Jobs of the pool of a worker process. Only set in the worker processes,
+# by `_init_pool_worker`.
+_pool_jobs = []
+
+
+def _init_pool_worker(jobs):
+    """
+    Set the jobs of the pool of this worker process. The worker
+    processes are forked, hence they get the jobs (which need not be
+    picklable) without pickling, and only the index of a job is sent
+    to them.
+
+    Parameters
+    ----------
+    jobs : List[Callable]
+        Jobs of the pool
+    """
+    _pool_jobs[:] = jobs
+
+
+def _run_pool_job(index, collect=False):
+    """
+    Run job at `index` of the jobs of the pool. Called in the worker
+    processes.
+
+    Parameters
+    ----------
+    index : int
+        Index of the job to be run
+    collect : bool
+        Whether the return value of the job is sent back
+
+    Returns
+    -------
+    (int, object)
+        `index`, and the return value of the job (None if it failed,
+        or isn't collected)
+    """
+    try:
+        result = _pool_jobs[index]()
+        return index, result if collect else None
+    except Exception:  # pylint: disable=broad-except
+        # A failing job shouldn't stop the other jobs
+        logger.exception("Job %s in the worker pool failed", _pool_jobs[index])
+        return index, None
+
+
+def get_pool_size(num_jobs):
+    """
+    Number of worker processes to be used for `num_jobs` jobs
+
+    Parameters
+    ----------
+    num_jobs : int
+        Number of jobs to be run
+
+    Returns
+    -------
+    int
+        Pool size, bounded by the number of available cores
+    """
+    try:
+        num_cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        num_cores = os.cpu_count() or 1
+    return max(1, min(num_cores, num_jobs))
+
+
+# pylint: disable=too-many-arguments
+def run_in_pool(jobs, weights=None, description=None, processes=None, collect=False):
+    """
+    Run `jobs` in a bounded pool of worker processes and wait for
+    them to finish
+
+    Jobs are handed out one at a time, to whichever worker is free, so
+    a worker stuck with a long job doesn't hold up the jobs behind it.
+    The heaviest jobs are handed out first, so that they don't end up
+    running alone at the end.
+
+    Parameters
+    ----------
+    jobs : List[Callable]
+        Functions (taking no arguments) to be run
+    weights : List[num]
+        Relative cost of each job (For eg., size of the output to be
+        parsed). If None, jobs are handed out in the given order.
+    description : str
+        If given, progress is shown with this description
+        (when `show_progress_bar` config is enabled)
+    processes : int
+        Maximum number of worker processes (Default: number of cores),
+        For eg., to bound the memory used by jobs
+    collect : bool
+        Whether the return values of the jobs, which must then be
+        picklable, are collected
+
+    Returns
+    -------
+    List
+        Return value of every job (None for jobs which failed), if
+        `collect` is True
+    """
+    if not jobs:
+        return []
+
+    order = list(range(len(jobs)))
+    if weights is not None:
+        order.sort(key=lambda index: weights[index], reverse=True)
+
+    pool_size = get_pool_size(len(jobs))
+    if processes:
+        pool_size = min(pool_size, processes)
+
+    results = [None] * len(jobs)
+    context = multiprocessing.get_context("fork")
+    with context.Pool(
+        processes=pool_size, initializer=_init_pool_worker, initargs=(jobs,)
+    ) as pool:
+        completed = pool.imap_unordered(
+            partial(_run_pool_job, collect=collect), order, chunksize=1
+        )
+        if description is not None and config.get_value("show_progress_bar"):
+            completed = tqdm(completed, total=len(jobs), desc=description)
+        for index, result in completed:
+            results[index] = result
+        # Let the workers exit by themselves, since terminating them
+        # (on leaving the `with` block) runs NeST's SIGTERM handlers
+        pool.close()
+        pool.join()
+    return results
+
+
+class ExperimentSupervisor:
+    """
+    Runs the runners of an experiment in threads of the experiment
+    process.
+
+    Every runner blocks on the tool subprocess it has started, so each
+    of them is run by a thread of its own, rather than by a forked copy
+    of the experiment process.
+
+    Attributes
+    ----------
+    background : List[Tuple(Runner, threading.Thread)]
+        Runners started in background (For eg., iperf3 servers), with
+        their threads
+    """
+
+    # Time (in seconds) to wait for background runners to finish,
+    # after the foreground runners are done
+    BACKGROUND_GRACE_PERIOD = 5
+
+    def __init__(self):
+        self.background = []
+
+    def start_background(self, runner):
+        """
+        Start `runner` right away, without waiting for it to complete.
+        Used for servers which need to be up before the clients start.
+
+        Parameters
+        ----------
+        runner : Runner
+            Runner to be started
+        """
+        thread = threading.Thread(
+            target=runner.run, name="nest-background", daemon=True
+        )
+        thread.start()
+        self.background.append((runner, thread))
+
+    def run(self, runners, extra_jobs=None):
+        """
+        Run all `runners` concurrently and wait for them to finish.
+
+        The runners are all spawned before the epoch of the experiment
+        clock and wait on it for their start time. At most
+        `max_runner_threads` (config) jobs are run at a time; jobs beyond
+        that start once a thread is free, hence late.
+
+        Background runners are stopped and joined before returning, so
+        that no thread is left running when worker processes are forked.
+
+        Parameters
+        ----------
+        runners : List[Runner]
+            Runners whose `run` method is to be called
+        extra_jobs : List[Callable]
+            Other blocking functions to be run alongside the runners
+            (For eg., the progress bar)
+        """
+        jobs = [runner.run for runner in runners] + list(extra_jobs or [])
+        if not jobs:
+            return
+
+        max_workers = len(jobs)
+        max_threads = config.get_value("max_runner_threads")
+        if max_threads and max_workers > max_threads:
+            logger.warning(
+                "%d runners share %d threads, some of them will start late. "
+                "Increase `max_runner_threads` config to avoid this.",
+                max_workers,
+                max_threads,
+            )
+            max_workers = max_threads
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="nest-runner"
+        )
+        if not ExperimentClock.is_started():
+            ExperimentClock.start()
+        try:
+            futures = [executor.submit(job) for job in jobs]
+            wait(futures)
+        except KeyboardInterrupt:
+            # Release runners still waiting for their start time
+            ExperimentClock.abort()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        for future in futures:
+            if future.exception() is not None:
+                logger.error("Runner failed: %s", future.exception())
+        self.stop_background()
+
+    def stop_background(self):
+        """
+        Wait for the background runners to finish, and kill the tools of
+        those still running after `BACKGROUND_GRACE_PERIOD`
+        """
+        # Let the servers finish writing their output
+        deadline = time.monotonic() + self.BACKGROUND_GRACE_PERIOD
+        for _, thread in self.background:
+            thread.join(max(0, deadline - time.monotonic()))
+        not_done = [
+            (runner, thread) for runner, thread in self.background if thread.is_alive()
+        ]
+        if not_done:
+            logger.debug(
+                "Killing %s background runner(s) still running after the experiment",
+                len(not_done),
+            )
+            for ns_id in {runner.ns_id for runner, _ in not_done}:
+                kill_ns_processes(ns_id)
+            for _, thread in not_done:
+                thread.join(self.BACKGROUND_GRACE_PERIOD)
+            if any(thread.is_alive() for _, thread in not_done):
+                logger.warning("Background runners couldn't be stopped")
+        self.background.clear()
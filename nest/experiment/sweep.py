@@ -0,0 +1,350 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Run an experiment over a grid of parameters, on the same topology.
+
+The topology is built once. Between runs, only the parameters that
+change are applied to it: for eg., the qdisc of an interface is
+replaced with `set_qdisc`, and the congestion control algorithm of the
+flows is changed in the experiment. Every run is dumped in its own
+folder inside the folder of the sweep, which also has an index of the
+runs (`sweep_index.json`)::
+
+    sweep = Sweep(
+        exp,
+        {
+            "qdisc": qdisc_parameter(router_interface, ["fq_codel", "pie"]),
+            "rtt": link_parameter(router_interface, "delay", ["5ms", "50ms"]),
+            "cc": flow_option_parameter("cong_algo", ["cubic", "bbr"]),
+            "flows": flow_attribute_parameter("number_of_streams", [1, 4]),
+        },
+    )
+    sweep.run()
+
+The runs go through the grid with its last parameter changing the
+fastest, so the parameters that are costly to change are best listed
+first.
+
+Processes running in the topology when the sweep starts (For eg.,
+routing daemons) are kept running between the runs, which only stop
+the tools they started. Every run gets its own copy of the flows and
+qdisc stats of the experiment, while the topology and the applications
+are shared by all the runs.
+"""
+
+import copy
+import itertools
+import json
+import logging
+import os
+import random
+import time
+from collections import namedtuple
+from nest.clean_up import keep_running_processes
+from .pack import Pack
+from .series import json_default
+from .helpers.tcp_validations import TCPValidations
+
+logger = logging.getLogger(__name__)
+tcp_validator = TCPValidations()
+
+SWEEP_INDEX = "sweep_index.json"
+
+SweepParameter = namedtuple("SweepParameter", ["values", "apply"])
+SweepParameter.__doc__ = """
+Parameter of a sweep
+
+Attributes
+----------
+values : list
+    Values taken by the parameter
+apply : callable
+    Called as `apply(experiment, value)` to set a value of the parameter
+"""
+
+
+def _as_list(items):
+    """`items` as a list, if it is a single item"""
+    if items is None or isinstance(items, (list, tuple)):
+        return items
+    return [items]
+
+
+def _selected_flows(experiment, flows):
+    """Flows of the experiment at the indices `flows` (Default: all)"""
+    if flows is None:
+        return experiment.flows
+    return [experiment.flows[index] for index in flows]
+
+
+def qdisc_parameter(interfaces, values):
+    """
+    Qdisc of interfaces, set with `set_qdisc`. When the qdisc changes,
+    all the stats of the new qdisc are sampled from the interfaces whose
+    qdisc stats are required (See `require_qdisc_stats`).
+
+    Parameters
+    ----------
+    interfaces : BaseInterface or List[BaseInterface]
+    values : List[str or Tuple(str, dict)]
+        Qdiscs, or qdiscs with their parameters. For eg.,
+        `["pie", ("fq_codel", {"target": "5ms"})]`
+
+    Returns
+    -------
+    SweepParameter
+    """
+    interfaces = _as_list(interfaces)
+
+    def apply(experiment, value):
+        qdisc, kwargs = (value, {}) if isinstance(value, str) else value
+        for interface in interfaces:
+            interface.set_qdisc(qdisc, **kwargs)
+            # The stats to be sampled are named by the qdisc. Stats of
+            # the previous qdisc needn't exist in the new one, so all the
+            # stats of the new qdisc are sampled.
+            for qdisc_stat in experiment.qdisc_stats:
+                if (qdisc_stat["ns_id"], qdisc_stat["int_id"]) == (
+                    interface.node_id,
+                    interface.ifb_id,
+                ) and qdisc_stat["qdisc"] != qdisc:
+                    qdisc_stat["qdisc"] = qdisc
+                    qdisc_stat["stats"] = []
+
+    return SweepParameter(list(values), apply)
+
+
+def link_parameter(interfaces, attribute, values):
+    """
+    Attribute of the link of interfaces, set with its setter in
+    `BaseInterface`
+
+    Parameters
+    ----------
+    interfaces : BaseInterface or List[BaseInterface]
+    attribute : str
+        For eg., "bandwidth", "delay"
+    values : list
+        Values of the attribute. For eg., `["5ms", "50ms"]`
+
+    Returns
+    -------
+    SweepParameter
+    """
+    interfaces = _as_list(interfaces)
+    setters = [getattr(interface, f"set_{attribute}") for interface in interfaces]
+
+    def apply(_, value):
+        for interface, setter in zip(interfaces, setters):
+            setter(value)
+            # The qdisc has its own copy of the bandwidth
+            if attribute == "bandwidth" and interface.get_qdisc() is not None:
+                # pylint: disable=protected-access
+                interface._ifb.set_bandwidth(interface.get_bandwidth().string_value)
+
+    return SweepParameter(list(values), apply)
+
+
+def flow_option_parameter(option, values, flows=None):
+    """
+    Option of the flows of the experiment
+
+    Parameters
+    ----------
+    option : str
+        For eg., "cong_algo"
+    values : list
+    flows : List[int]
+        Indices of the flows, in the order they were added to the
+        experiment (Default: all)
+
+    Returns
+    -------
+    SweepParameter
+    """
+    if option == "cong_algo":
+        for value in values:
+            tcp_validator.verify_congestion_control_algorithm(value)
+
+    def apply(experiment, value):
+        for flow in _selected_flows(experiment, flows):
+            flow.set_option(option, value)
+
+    return SweepParameter(list(values), apply)
+
+
+def flow_attribute_parameter(attribute, values, flows=None):
+    """
+    Attribute of the flows of the experiment
+
+    Parameters
+    ----------
+    attribute : str
+        For eg., "number_of_streams", "stop_time"
+    values : list
+    flows : List[int]
+        Indices of the flows, in the order they were added to the
+        experiment (Default: all)
+
+    Returns
+    -------
+    SweepParameter
+    """
+
+    def apply(experiment, value):
+        for flow in _selected_flows(experiment, flows):
+            setattr(flow, attribute, value)
+            # iperf3 needs a port per stream
+            port_nos = flow.get_option("port_nos")
+            if attribute == "number_of_streams" and port_nos is not None:
+                port_nos = set(port_nos)
+                while len(port_nos) < value:
+                    port_nos.add(random.randrange(1024, 65536))
+                flow.set_option("port_nos", list(port_nos))
+
+    return SweepParameter(list(values), apply)
+
+
+class Sweep:
+    """
+    Experiment run over a grid of parameters
+
+    Attributes
+    ----------
+    experiment : Experiment
+        Template of the runs
+    grid : dict
+        Names of the parameters mapped to `SweepParameter`
+    """
+
+    def __init__(self, experiment, grid):
+        """
+        Parameters
+        ----------
+        experiment : Experiment
+            Template of the runs. Its flows are changed by the runs
+        grid : dict
+            Names of the parameters mapped to `SweepParameter`
+        """
+        for name, parameter in grid.items():
+            if not isinstance(parameter, SweepParameter):
+                raise TypeError(
+                    f"Parameter {name!r} of the sweep isn't a SweepParameter"
+                )
+            if not parameter.values:
+                raise ValueError(f"Parameter {name!r} of the sweep has no values")
+        self.experiment = experiment
+        self.grid = dict(grid)
+
+    def points(self):
+        """
+        Parameters of every run, with the parameters changed from the
+        previous run
+
+        Returns
+        -------
+        List[Tuple(dict, List[str])]
+        """
+        names = list(self.grid)
+        points = []
+        previous = {}
+        for values in itertools.product(*(self.grid[name].values for name in names)):
+            parameters = dict(zip(names, values))
+            changed = [
+                name
+                for name in names
+                if not previous or previous[name] != parameters[name]
+            ]
+            points.append((parameters, changed))
+            previous = parameters
+        return points
+
+    def _write_index(self, folder, runs):
+        """Write the index of the runs done so far"""
+        index = {
+            "experiment": self.experiment.name,
+            "parameters": list(self.grid),
+            "runs": runs,
+        }
+        path = os.path.join(folder, SWEEP_INDEX)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(index, file, indent=4, default=json_default)
+        Pack.set_owner(path)
+
+    def run(self):
+        """
+        Run the experiment at every point of the grid
+
+        Returns
+        -------
+        str or None
+            Folder of the sweep, None if it couldn't be created
+        """
+        template = self.experiment
+        timestamp = time.strftime("%d-%m-%Y-%H:%M:%S")
+        folder = os.path.join(
+            template.save_path if template.save_path else ".",
+            f"{template.name}({timestamp})_sweep",
+        )
+        try:
+            os.mkdir(folder)
+        except OSError:
+            logger.error(
+                "Failed to create sweep folder. Please check your dump path provided."
+            )
+            return None
+        Pack.set_owner(folder)
+
+        runs = []
+        points = self.points()
+        with keep_running_processes():
+            for index, (parameters, changed) in enumerate(points):
+                logger.info(
+                    "Sweep run %d/%d: %s",
+                    index + 1,
+                    len(points),
+                    ", ".join(f"{name}={parameters[name]}" for name in self.grid),
+                )
+                for name in changed:
+                    self.grid[name].apply(template, parameters[name])
+
+                dump = self._run_copy(f"{template.name}_{index}", folder)
+                runs.append(
+                    {
+                        "index": index,
+                        "name": f"{template.name}_{index}",
+                        "parameters": parameters,
+                        "dump": os.path.relpath(dump, folder) if dump else None,
+                    }
+                )
+                self._write_index(folder, runs)
+
+        logger.info("Sweep dumped at %s", folder)
+        return folder
+
+    def _run_copy(self, name, folder):
+        """
+        Run a copy of the experiment, with the parameters applied so far
+
+        Parameters
+        ----------
+        name : str
+            Name of the run
+        folder : str
+            Folder of the sweep
+
+        Returns
+        -------
+        str or None
+            Dump folder of the run
+        """
+        experiment = copy.copy(self.experiment)
+        # Changed by the parameters applied to later runs
+        experiment.flows = copy.deepcopy(self.experiment.flows)
+        experiment.qdisc_stats = copy.deepcopy(self.experiment.qdisc_stats)
+        experiment.name = name
+        # `Experiment.run` replaces the save path with its dump folder
+        experiment.save_path = folder
+        experiment.run()
+        return experiment.save_path
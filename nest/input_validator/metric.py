@@ -110,6 +110,22 @@ class Bandwidth(Metric):
         if self.unit not in Bandwidth.valid_units:
             raise ValueError(f"{self.unit} is not a valid unit for bandwidth.")
 
+    @property
+    def bits_per_second(self):
+        """
+        Get the bandwidth in bits per second. As in tc, "bps" units
+        are bytes per second.
+        """
+        prefixes = {"": 1, "k": 1e3, "m": 1e6, "g": 1e9, "t": 1e12}
+        prefix = self.unit[:-3]
+        if prefix.endswith("i"):
+            scale = 1024 ** list(prefixes).index(prefix[0])
+        else:
+            scale = prefixes[prefix]
+        if self.unit.endswith("bps"):
+            scale *= 8
+        return float(self.value) * scale
+
 
 class Delay(Metric):
     """
@@ -6,6 +6,7 @@ Base class for Routing daemons.
 """
 
 import os
+import hashlib
 from abc import ABC, abstractmethod
 import io
 import logging
@@ -29,6 +30,13 @@ class RoutingDaemonBase(ABC):
 
     Finally call `run` to create the config file and  run the daemon.
 
+    `render_config` can be used instead of `create_basic_config` to reuse
+    a configuration rendered earlier for the same router and protocol,
+    as long as the topology (interfaces and addresses) hasn't changed.
+    Rendered configurations outlive the topology, so a topology rebuilt
+    with the same names (For eg., with `assign_random_names` disabled)
+    reuses them.
+
     Note:
     (i): If you're using `RoutingHelper`, config files are created at the /tmp
     directory.
@@ -53,6 +61,11 @@ class RoutingDaemonBase(ABC):
         Default value is set to False.
     """
 
+    # Configurations rendered by `render_config`, keyed by the topology
+    # fingerprint. The oldest are dropped beyond `MAX_RENDERED_CONFIGS`.
+    _rendered_configs = {}
+    MAX_RENDERED_CONFIGS = 1024
+
     def __init__(
         self, router_ns_id, ipv6_routing, interfaces, daemon, conf_dir, **kwargs
     ):
@@ -116,6 +129,59 @@ class RoutingDaemonBase(ABC):
         self.create_config()
         engine_func()
 
+    def topology_fingerprint(self):
+        """
+        Fingerprint of everything the basic config of this daemon
+        depends on
+
+        Returns
+        -------
+        str
+            sha256 digest of the routing suite, the daemon, the router,
+            its log file, and its interfaces and addresses
+        """
+        fingerprint = hashlib.sha256()
+        fingerprint.update(
+            f"{config.get_value('routing_suite')}|{type(self).__name__}|"
+            f"{self.daemon}|{self.log_file}|{self.router_ns_id}|"
+            f"{self.ipv6_routing}".encode()
+        )
+        for interface in self.interfaces:
+            addresses = interface.get_address(
+                not self.ipv6_routing, self.ipv6_routing, True
+            )
+            fingerprint.update(f"|{interface.id}".encode())
+            for addr in addresses:
+                fingerprint.update(f",{addr.get_addr()}".encode())
+        return fingerprint.hexdigest()
+
+    def render_config(self):
+        """
+        Render the basic configuration of `daemon` into `self.conf`.
+
+        The configuration is rendered using `create_basic_config` only
+        if it wasn't rendered before for the same topology fingerprint.
+        Otherwise, the cached configuration is reused.
+        """
+        key = self.topology_fingerprint()
+        rendered = RoutingDaemonBase._rendered_configs.get(key)
+        if rendered is None:
+            self.create_basic_config()
+            rendered_configs = RoutingDaemonBase._rendered_configs
+            if len(rendered_configs) >= RoutingDaemonBase.MAX_RENDERED_CONFIGS:
+                del rendered_configs[next(iter(rendered_configs))]
+            rendered_configs[key] = self.conf.getvalue()
+        else:
+            self.conf = io.StringIO(rendered)
+            self.conf.seek(0, io.SEEK_END)
+
+    @staticmethod
+    def clear_rendered_configs():
+        """
+        Forget the configurations rendered by `render_config`
+        """
+        RoutingDaemonBase._rendered_configs.clear()
+
     def add_to_config(self, command):
         """
         Add a line to `self.conf`
@@ -129,15 +195,22 @@ class RoutingDaemonBase(ABC):
 
     def create_config(self):
         """
-        Creates config file on disk from `self.conf`
+        Creates config file on disk from `self.conf`.
+        The file isn't rewritten if it already has the same content
+        (For eg., if `create_basic_config` has already written it).
         """
+        content = self.conf.getvalue()
+        if os.path.isfile(self.conf_file):
+            with open(self.conf_file, "r") as conf:
+                if conf.read() == content:
+                    return
+
         with open(self.conf_file, "w") as conf:
             if config.get_value("routing_suite") == "bird":
                 shutil.chown(self.conf_file, user=pwd.getpwuid(os.getuid())[0])
             else:
                 shutil.chown(self.conf_file, user=config.get_value("routing_suite"))
-            self.conf.seek(0)
-            shutil.copyfileobj(self.conf, conf)
+            conf.write(content)
 
     def handle_dependecy_error(self):
         """
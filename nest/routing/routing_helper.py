@@ -284,7 +284,7 @@ class RoutingHelper:
             self.conf_dir,
             log_dir=self.log_dir,
         )
-        zebra.create_basic_config()
+        zebra.render_config()
         zebra.run()
         self.zebra_list.append(zebra)
 
@@ -309,7 +309,7 @@ class RoutingHelper:
                 self.conf_dir,
                 log_dir=self.log_dir,
             )
-        protocol.create_basic_config()
+        protocol.render_config()
         protocol.run()
         self.protocol_list.append(protocol)
 
@@ -330,7 +330,7 @@ class RoutingHelper:
             self.conf_dir,
             log_dir=self.log_dir,
         )
-        ldp.create_basic_config()
+        ldp.render_config()
         ldp.run()
         self.ldp_list.append(ldp)
 
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test the nest command, on the results of an experiment dump"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from nest import config
+from nest.cli import filter_results, main
+
+# pylint: disable=missing-docstring
+
+
+def _ss_flow(start, samples):
+    meta = {
+        "meta": True,
+        "destination_node": "h2",
+        "start_time": "0",
+        "stop_time": "10",
+    }
+    records = [
+        {"timestamp": str(start + index * 0.2), "cwnd": index, "rtt": 1.0}
+        for index in range(samples)
+    ]
+    return [meta] + records
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.dump = tempfile.mkdtemp()
+        self.results = {
+            "h1": [
+                {
+                    "10.0.0.2": {
+                        "5000": _ss_flow(100, 20),
+                        "5001": _ss_flow(100, 10),
+                    }
+                }
+            ]
+        }
+        with open(os.path.join(self.dump, "ss.json"), "w", encoding="utf-8") as file:
+            json.dump(self.results, file)
+
+    def tearDown(self):
+        shutil.rmtree(self.dump)
+        config.set_value("show_progress_bar", True)
+
+    def test_filter_results(self):
+        results = {"ss": self.results}
+        self.assertEqual(filter_results(results, tools=["tc"]), {})
+        self.assertEqual(filter_results(results, nodes=["h2"]), {})
+
+        filtered = filter_results(results, flows=["10.0.0.2:5001"])
+        self.assertEqual(list(filtered["ss"]["h1"][0]["10.0.0.2"]), ["5001"])
+
+        # An address matches its flows to all ports
+        self.assertEqual(filter_results(results, flows=["10.0.0.2"]), results)
+
+    def test_summarize(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(["summarize", self.dump, "--metric", "cwnd", "--json"])
+        self.assertEqual(status, 0)
+
+        rows = json.loads(output.getvalue())
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["flow"], "10.0.0.2:5000")
+        self.assertEqual(rows[0]["samples"], 20)
+        self.assertEqual(rows[0]["max"], 19)
+
+    def test_plot(self):
+        config.set_value("show_progress_bar", False)
+        status = main(
+            ["plot", self.dump, "--flow", "10.0.0.2:5000", "--metric", "cwnd"]
+        )
+        self.assertEqual(status, 0)
+
+        plots = os.listdir(os.path.join(self.dump, "ss"))
+        self.assertIn("cwnd_h1_to_h2(10.0.0.2:5000).png", plots)
+        self.assertNotIn("rtt_h1_to_h2(10.0.0.2:5000).png", plots)
+        self.assertNotIn("cwnd_h1_to_h2(10.0.0.2:5001).png", plots)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test collecting stats during an experiment"""
+
+import unittest
+from nest.topology import Node, connect
+from nest.experiment import Experiment, Flow
+from nest.clean_up import delete_namespaces
+from nest.topology_map import TopologyMap
+from nest import config
+
+
+# pylint: disable=missing-docstring
+# pylint: disable=invalid-name
+class TestCollectors(unittest.TestCase):
+    def setUp(self):
+        self.n0 = Node("n0")
+        self.n1 = Node("n1")
+
+        self.n0_n1, self.n1_n0 = connect(self.n0, self.n1)
+
+        self.n0_n1.set_address("10.1.1.1/24")
+        self.n1_n0.set_address("10.1.1.2/24")
+
+    def tearDown(self):
+        delete_namespaces()
+        TopologyMap.delete_all_mapping()
+
+    def experiment(self, name, qdisc=None):
+        self.n0_n1.set_attributes("10mbit", "20ms", qdisc)
+        self.n1_n0.set_attributes("10mbit", "20ms")
+
+        exp = Experiment(name, return_results=True)
+        flow = Flow(self.n0, self.n1, self.n1_n0.address, 0, 5, 2)
+        exp.add_tcp_flow(flow)
+        return exp
+
+    def test_sock_diag(self):
+        exp = self.experiment("test-experiment-sock-diag")
+
+        config.set_value("socket_stats_collector", "sock_diag")
+        try:
+            results = exp.run()
+        finally:
+            config.set_value("socket_stats_collector", "ss")
+
+        flows = results["ss"]["n0"][0]["10.1.1.2"]
+        self.assertTrue(flows)
+        for flow_stats in flows.values():
+            self.assertTrue(flow_stats[0]["meta"])
+            self.assertGreater(len(flow_stats), 1)
+            self.assertIn("cwnd", flow_stats[-1])
+            # Stats are stored column-wise, a value per sample
+            self.assertEqual(len(flow_stats.column("cwnd")), len(flow_stats) - 1)
+
+    def test_stream_parsing(self):
+        exp = self.experiment("test-experiment-stream-parsing", "codel")
+        exp.require_qdisc_stats(self.n0_n1)
+
+        config.set_value("stream_parsing", True)
+        try:
+            results = exp.run()
+        finally:
+            config.set_value("stream_parsing", False)
+
+        # Samples parsed in several chunks are merged into a single result
+        self.assertEqual(len(results["ss"]["n0"]), 1)
+        flows = results["ss"]["n0"][0]["10.1.1.2"]
+        self.assertTrue(flows)
+        for flow_stats in flows.values():
+            self.assertTrue(flow_stats[0]["meta"])
+            self.assertEqual(sum("meta" in stats for stats in flow_stats), 1)
+            self.assertGreater(len(flow_stats), 1)
+
+        rtts = results["ping"]["n0"][0]["10.1.1.2"]
+        self.assertTrue(rtts[0]["meta"])
+        self.assertGreater(len(rtts), 1)
+
+        self.assertEqual(len(results["netperf"]["n0"]), 2)
+        self.assertEqual(len(results["tc"]["n0"]), 1)
+
+    def test_node_stats(self):
+        exp = self.experiment("test-experiment-node-stats")
+        exp.require_node_stats(self.n0)
+        exp.require_node_stats(self.n1, ["TcpInSegs", "UdpInErrors"])
+
+        results = exp.run()
+
+        # Only the counters which changed are stored, unless requested
+        counters = results["snmp"]["n0"][0]["counters"]
+        self.assertIn("TcpOutSegs", counters)
+        self.assertTrue(all(any(deltas) for deltas in counters.values()))
+        self.assertEqual(
+            len(counters["TcpOutSegs"]), len(results["snmp"]["n0"][0]["timestamp"])
+        )
+
+        counters = results["snmp"]["n1"][0]["counters"]
+        self.assertEqual(list(counters), ["TcpInSegs", "UdpInErrors"])
+        self.assertGreater(sum(counters["TcpInSegs"]), 0)
+
+    def test_link_stats(self):
+        exp = self.experiment("test-experiment-link-stats")
+        exp.require_link_stats()
+
+        results = exp.run()
+
+        link = results["link"]["n0"][0][self.n0_n1.name]
+        self.assertEqual(link["meta"]["bandwidth"], 10e6)
+        self.assertEqual(len(link["utilization"]), len(link["timestamp"]))
+        self.assertGreater(max(link["utilization"]), 50)
+        self.assertIn(self.n1_n0.name, results["link"]["n1"][0])
+
+        with self.assertRaises(TypeError):
+            exp.require_link_stats("eth0")
+
+    def test_sampling_interval(self):
+        exp = Experiment("test-experiment-sampling-interval")
+        exp.set_sampling_interval(0.05, "socket_stats")
+        self.assertEqual(exp.get_sampling_interval("socket_stats"), 0.05)
+        self.assertEqual(
+            exp.get_sampling_interval("qdisc_stats"),
+            config.get_value("qdisc_stats_interval"),
+        )
+
+        exp.set_sampling_interval(1)
+        self.assertEqual(exp.get_sampling_interval("netperf"), 1)
+
+        with self.assertRaises(ValueError):
+            exp.set_sampling_interval(0.1, "ping")
+        with self.assertRaises(ValueError):
+            exp.set_sampling_interval(0)
+
+        self.assertIsNone(exp.get_max_sampling_interval())
+        exp.enable_adaptive_sampling(5)
+        self.assertEqual(exp.get_max_sampling_interval(), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
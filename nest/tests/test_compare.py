@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test comparing the results of several experiment dumps"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from nest import config
+from nest.experiment.compare import compare
+
+# pylint: disable=missing-docstring
+
+
+def _ss_flow(rate, samples=10):
+    records = [
+        {"timestamp": 100 + index * 0.2, "delivery_rate": rate, "rtt": 10.0}
+        for index in range(samples)
+    ]
+    return [{"meta": True}] + records
+
+
+class TestCompare(unittest.TestCase):
+    def setUp(self):
+        config.set_value("show_progress_bar", False)
+        self.folder = tempfile.mkdtemp()
+        self.dumps = []
+        # Ports differ between the experiments, flows are aligned by order
+        for name, ports, rates in (
+            ("cubic", ("5000", "5001"), (10, 30)),
+            ("bbr", ("6000", "6001"), (20, 20)),
+        ):
+            dump = os.path.join(self.folder, f"{name}_dump")
+            os.mkdir(dump)
+            flows = {port: _ss_flow(rate) for port, rate in zip(ports, rates)}
+            results = {"h1": [{"10.0.0.2": flows}]}
+            with open(os.path.join(dump, "ss.json"), "w", encoding="utf-8") as file:
+                json.dump(results, file)
+            self.dumps.append(dump)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        config.set_value("show_progress_bar", True)
+
+    def test_compare(self):
+        output = os.path.join(self.folder, "comparison")
+        flow_means, comparison = compare(self.dumps, output, ["throughput"])
+
+        self.assertEqual(list(flow_means.columns), ["cubic", "bbr"])
+        self.assertEqual(
+            flow_means.loc[("throughput", "ss", "h1->10.0.0.2#0")].tolist(), [10, 20]
+        )
+
+        bbr = comparison[comparison["experiment"] == "bbr"].iloc[0]
+        self.assertEqual(bbr["total"], 40)
+        self.assertEqual(bbr["total_change_%"], 0)
+        self.assertEqual(bbr["fairness"], 1)
+
+        for filename in ("comparison.csv", "comparison.html", "flows.csv"):
+            self.assertTrue(os.path.isfile(os.path.join(output, filename)))
+
+
+if __name__ == "__main__":
+    unittest.main()
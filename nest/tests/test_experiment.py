@@ -548,6 +548,13 @@ class TestExperiment(unittest.TestCase):
     def test_experiment_qdisc_fq_pie(self):
         self.test_experiment("fq_pie")
 
+    def test_experiment_qdisc_netlink(self):
+        config.set_value("qdisc_stats_collector", "netlink")
+        try:
+            self.test_experiment("fq_codel")
+        finally:
+            config.set_value("qdisc_stats_collector", "tc")
+
     def tearDown(self):
         delete_namespaces()
         TopologyMap.delete_all_mapping()
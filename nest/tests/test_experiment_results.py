@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test querying the results of an experiment, flow by flow"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from nest.experiment import ExperimentResults, FlowKey
+from nest.experiment.json_writer import write_json
+
+# pylint: disable=missing-docstring
+
+
+def _ss_flow(samples):
+    meta = {"meta": True, "destination_node": "h2"}
+    records = [
+        {"timestamp": 100 + index * 0.2, "cwnd": index, "rtt": 1.0}
+        for index in range(samples)
+    ]
+    return [meta] + records
+
+
+class TestExperimentResults(unittest.TestCase):
+    def setUp(self):
+        self.dump = tempfile.mkdtemp()
+        self.ss_results = {
+            "h1": [{"10.0.0.2": {"5000": _ss_flow(20), "5001": _ss_flow(10)}}]
+        }
+        self.netperf_results = {"h1": [{"10.0.0.2:12865": _ss_flow(5)}]}
+
+    def tearDown(self):
+        shutil.rmtree(self.dump)
+
+    def check_results(self, results):
+        self.assertEqual(
+            results.flows(tool="ss"),
+            [
+                FlowKey("ss", "h1", "10.0.0.2", "5000"),
+                FlowKey("ss", "h1", "10.0.0.2", "5001"),
+            ],
+        )
+        self.assertEqual(
+            results.flows(tool="netperf"),
+            [FlowKey("netperf", "h1", "10.0.0.2", "12865")],
+        )
+
+        timestamp, cwnd = results.metric(("ss", "h1", "10.0.0.2", "5001"), "cwnd")
+        np.testing.assert_array_equal(cwnd, np.arange(10))
+        self.assertAlmostEqual(timestamp[-1], 101.8)
+
+        frame = results.frame(results.flows(port=5000)[0])
+        self.assertEqual(list(frame.columns), ["timestamp", "cwnd", "rtt"])
+        self.assertEqual(len(frame), 20)
+
+        # Still indexed as the results it replaces
+        self.assertEqual(results["ss"]["h1"][0]["10.0.0.2"]["5000"][1]["cwnd"], 0)
+
+    def test_results(self):
+        self.check_results(
+            ExperimentResults({"ss": self.ss_results, "netperf": self.netperf_results})
+        )
+
+    def test_load(self):
+        write_json(os.path.join(self.dump, "ss.ndjson"), self.ss_results, "ndjson")
+        write_json(os.path.join(self.dump, "netperf.json"), self.netperf_results)
+        results = ExperimentResults.load(self.dump)
+        self.assertEqual(sorted(results), ["netperf", "ss"])
+        self.check_results(results)
+
+    def test_numeric_strings(self):
+        # Dumps of older versions of NeST store stats as strings
+        flow = _ss_flow(3)
+        for record in flow[1:]:
+            record["cwnd"] = str(record["cwnd"])
+            record["state"] = "ESTABLISHED"
+        results = ExperimentResults({"ss": {"h1": [{"10.0.0.2": {"5000": flow}}]}})
+        series = results.series(results.flows()[0])
+        np.testing.assert_array_equal(series.column("cwnd"), [0.0, 1.0, 2.0])
+        self.assertEqual(series.column("cwnd").dtype, np.float64)
+        self.assertEqual(series.column("state").dtype, object)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test serving the latest samples of an experiment while it runs"""
+
+import json
+import threading
+import unittest
+from http.client import HTTPConnection
+import numpy as np
+from nest.experiment.experiment_results import FlowKey
+from nest.experiment.live import LiveFeed, start_live_server, stop_live_server
+from nest.experiment.series import FlowSeries
+
+# pylint: disable=missing-docstring
+
+
+class TestLive(unittest.TestCase):
+    def setUp(self):
+        self.server = start_live_server(10, "127.0.0.1:0")
+        self.connection = HTTPConnection("127.0.0.1", self.server.server_address[1])
+
+    def tearDown(self):
+        self.connection.close()
+        stop_live_server(self.server)
+
+    def get(self, path):
+        self.connection.request("GET", path)
+        response = self.connection.getresponse()
+        self.assertEqual(response.status, 200)
+        return response.read().decode()
+
+    def test_live(self):
+        key = FlowKey("ss", "h1", "10.0.0.2", "5000")
+        # 300 samples are kept per flow (`live_samples` config)
+        for index in range(310):
+            LiveFeed.add_sample(key, {"timestamp": 100.0 + index, "cwnd": index})
+        LiveFeed.publish(
+            "ping",
+            "h1",
+            {
+                "10.0.0.2": FlowSeries(
+                    {"meta": True}, [1.0, 2.0], {"rtt": np.array([3.0, np.nan])}
+                )
+            },
+        )
+
+        metrics = self.get("/metrics").splitlines()
+        self.assertIn(
+            'nest_ss_cwnd{node="h1",destination="10.0.0.2",port="5000"} 309 409.0',
+            metrics,
+        )
+        # Latest value of a parameter missing in the latest sample
+        self.assertIn(
+            'nest_ping_rtt{node="h1",destination="10.0.0.2"} 3.0 1.0', metrics
+        )
+        self.assertEqual(metrics[-1], "# EOF")
+
+        flows = json.loads(self.get("/json?tool=ss"))["flows"]
+        self.assertEqual(len(flows), 1)
+        self.assertEqual(len(flows[0]["samples"]), 300)
+        self.assertEqual(flows[0]["samples"][0]["cwnd"], 10)
+
+    def test_stop(self):
+        self.get("/json")
+        stop_live_server(self.server)
+        # No thread is left running, for worker processes to be forked
+        self.assertEqual(threading.active_count(), 1)
+        self.assertFalse(LiveFeed.enabled)
+        self.server = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test decoding qdisc stats reported over netlink"""
+
+import struct
+import unittest
+from nest.experiment.parser.qdisc_netlink import decode_xstats, is_decoded
+
+# pylint: disable=missing-docstring
+
+PIE_STATS = {
+    "delay": 2000,
+    "avg_dq_rate": 15,
+    "pkts_in": 100,
+    "dropped": 3,
+    "overlimit": 4,
+    "maxq": 50,
+    "ecn_mark": 1,
+}
+
+
+class TestQdiscNetlink(unittest.TestCase):
+    def test_pie_xstats(self):
+        # Linux >= 5.6: 64 bit probability, and `dq_rate_estimating`
+        xstats = struct.pack("=QIII5I", 2**62, 2000, 15, 1, 100, 3, 4, 50, 1)
+        self.assertEqual(len(xstats), 40)
+        self.assertEqual(decode_xstats("pie", xstats), {"prob": 0.25, **PIE_STATS})
+
+    def test_pie_xstats_u32_prob(self):
+        # Linux 5.2 to 5.5: 32 bit probability, and `dq_rate_estimating`
+        xstats = struct.pack("=9I", 2**30, 2000, 15, 1, 100, 3, 4, 50, 1)
+        self.assertEqual(decode_xstats("pie", xstats), {"prob": 0.25, **PIE_STATS})
+
+    def test_pie_xstats_old(self):
+        xstats = struct.pack("=8I", 2**30, 2000, 15, 100, 3, 4, 50, 1)
+        self.assertEqual(decode_xstats("pie", xstats), {"prob": 0.25, **PIE_STATS})
+
+    def test_red_xstats(self):
+        xstats = struct.pack("=4I", 5, 2, 1, 7)
+        self.assertEqual(
+            decode_xstats("red", xstats),
+            {"early": 5, "pdrop": 2, "other": 1, "marked": 7},
+        )
+
+    def test_choke_xstats(self):
+        xstats = struct.pack("=5I", 5, 2, 1, 7, 3)
+        self.assertEqual(
+            decode_xstats("choke", xstats),
+            {"early": 5, "pdrop": 2, "other": 1, "marked": 7, "matched": 3},
+        )
+
+    def test_is_decoded(self):
+        for kind in ("codel", "pie", "cake", "red", "choke", "pfifo"):
+            self.assertTrue(is_decoded(kind), kind)
+        # Has stats of its own, which aren't decoded
+        self.assertFalse(is_decoded("fq"))
+
+
+if __name__ == "__main__":
+    unittest.main()
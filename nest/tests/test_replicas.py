@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test summarizing replicas of an experiment with confidence intervals"""
+
+import os
+import tempfile
+import unittest
+import pandas as pd
+from nest.experiment.pack import Pack
+from nest.experiment.replicas import _dump_csvs, confidence_intervals, t_critical
+
+# pylint: disable=missing-docstring
+
+
+class TestReplicas(unittest.TestCase):
+    def test_t_critical(self):
+        for dof, critical in ((1, 12.7062), (2, 4.3027), (9, 2.2622), (30, 2.0423)):
+            self.assertAlmostEqual(t_critical(0.95, dof), critical, places=4)
+
+    def test_confidence_intervals(self):
+        flows = pd.DataFrame(
+            {
+                "experiment": ["replica0", "replica1", "replica0", "replica1"],
+                "tool": ["ss", "ss", "tc", "tc"],
+                "role": ["h1->10.0.0.2#0"] * 2 + ["r1->eth1#0"] * 2,
+                "metric": ["throughput", "throughput", "drops", "drops"],
+                "mean": [1.0, 3.0, 50.0, 50.0],
+                "total": [10.0, 30.0, 4.0, 6.0],
+            }
+        )
+        aggregate = pd.DataFrame(
+            {
+                "experiment": ["replica0", "replica1"],
+                "metric": ["throughput", "throughput"],
+                "mean": [1.0, 3.0],
+                "median": [1.0, 3.0],
+                "p99": [1.0, 3.0],
+                "total": [1.0, 3.0],
+                "fairness": [1.0, 1.0],
+            }
+        )
+        flow_intervals, intervals = confidence_intervals(flows, aggregate)
+
+        throughput = flow_intervals.iloc[0]
+        self.assertEqual(throughput["replicas"], 2)
+        self.assertEqual(throughput["mean"], 2)
+        # Half width of t(0.975, 1) * std / sqrt(2), with std = sqrt(2)
+        self.assertAlmostEqual(throughput["ci_high"] - 2, 12.7062, places=4)
+        # Counters are summarized by their increase
+        self.assertEqual(flow_intervals.iloc[1]["mean"], 5)
+
+        fairness = intervals[intervals["stat"] == "fairness"].iloc[0]
+        self.assertEqual((fairness["ci_low"], fairness["ci_high"]), (1, 1))
+
+    def test_dump_csvs(self):
+        Pack.FOLDER = "experiment"
+        try:
+            with tempfile.TemporaryDirectory() as folder:
+                _dump_csvs(folder, {"flows.csv": pd.DataFrame({"mean": [1.0]})})
+                self.assertEqual(os.listdir(folder), ["flows.csv"])
+            # The folder of the experiment run last is kept
+            self.assertEqual(Pack.FOLDER, "experiment")
+        finally:
+            Pack.FOLDER = ""
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test storing the results of the tools"""
+
+import shutil
+import tempfile
+import unittest
+from nest.experiment.results import ResultStore
+
+# pylint: disable=missing-docstring
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = ResultStore(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_streams_merged(self):
+        self.store.add("ping", "n0", {"10.0.0.2": [{"rtt": "1"}]}, stream="a")
+        self.store.add("ping", "n1", {"10.0.0.1": [{"rtt": "3"}]})
+        self.store.add("ping", "n0", {"10.0.0.2": [{"rtt": "2"}]}, stream="a")
+        self.assertEqual(
+            self.store.get("ping"),
+            {
+                "n0": [{"10.0.0.2": [{"rtt": "1"}, {"rtt": "2"}]}],
+                "n1": [{"10.0.0.1": [{"rtt": "3"}]}],
+            },
+        )
+
+    def test_get_copy(self):
+        self.store.add("ping", "n0", {"10.0.0.2": [{"rtt": "1"}, {"rtt": "2"}]})
+        results = self.store.get("ping")
+        # For eg., filtering before plotting
+        results["n0"][0]["10.0.0.2"].pop()
+        del results["n0"]
+
+        self.assertEqual(
+            self.store.get("ping"), {"n0": [{"10.0.0.2": [{"rtt": "1"}, {"rtt": "2"}]}]}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test caching the configs rendered for routing daemons"""
+
+import unittest
+from nest.clean_up import delete_namespaces
+from nest.routing.route_daemons import RoutingDaemonBase
+
+# pylint: disable=missing-docstring
+# pylint: disable=too-few-public-methods
+
+
+class _Address:
+    def __init__(self, addr):
+        self.addr = addr
+
+    def get_addr(self):
+        return self.addr
+
+
+class _Interface:
+    def __init__(self, interface_id, addr):
+        self.id = interface_id  # pylint: disable=invalid-name
+        self.address = _Address(addr)
+
+    def get_address(self, *_):
+        return [self.address]
+
+
+class _Daemon(RoutingDaemonBase):
+    rendered = 0
+
+    def __init__(self, interfaces):
+        super().__init__("r1", False, interfaces, "zebra", "/tmp", log_dir=None)
+
+    def create_basic_config(self):
+        _Daemon.rendered += 1
+        for interface in self.interfaces:
+            self.add_to_config(f"interface {interface.id}")
+
+    def run(self, engine_func):
+        pass
+
+    def handle_dependecy_error(self):
+        pass
+
+
+class TestRouteDaemons(unittest.TestCase):
+    def setUp(self):
+        _Daemon.rendered = 0
+        self.interfaces = [_Interface("eth1", "10.0.0.1/24")]
+
+    def tearDown(self):
+        RoutingDaemonBase.clear_rendered_configs()
+
+    def test_render_config_cached(self):
+        for _ in range(2):
+            daemon = _Daemon(self.interfaces)
+            daemon.render_config()
+            self.assertEqual(daemon.conf.getvalue(), "interface eth1\n")
+        self.assertEqual(_Daemon.rendered, 1)
+
+        # Configs can be added to after they are reused
+        daemon.add_to_config("router ospf")
+        self.assertEqual(daemon.conf.getvalue(), "interface eth1\nrouter ospf\n")
+
+        # Rendered again once the topology changes
+        self.interfaces[0].address.addr = "10.0.1.1/24"
+        _Daemon(self.interfaces).render_config()
+        self.assertEqual(_Daemon.rendered, 2)
+
+    def test_kept_across_topologies(self):
+        _Daemon(self.interfaces).render_config()
+        delete_namespaces()
+        _Daemon(self.interfaces).render_config()
+        self.assertEqual(_Daemon.rendered, 1)
+
+    def test_bounded(self):
+        max_configs = RoutingDaemonBase.MAX_RENDERED_CONFIGS
+        RoutingDaemonBase.MAX_RENDERED_CONFIGS = 2
+        try:
+            for addr in ("10.0.0.1/24", "10.0.1.1/24", "10.0.2.1/24"):
+                self.interfaces[0].address.addr = addr
+                _Daemon(self.interfaces).render_config()
+            # The oldest config was dropped
+            self.interfaces[0].address.addr = "10.0.0.1/24"
+            _Daemon(self.interfaces).render_config()
+            self.assertEqual(_Daemon.rendered, 4)
+        finally:
+            RoutingDaemonBase.MAX_RENDERED_CONFIGS = max_configs
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test parsing the output of a tool while it runs"""
+
+import os
+import unittest
+from nest.experiment.parser.runnerbase import Runner
+
+# pylint: disable=missing-docstring
+
+
+class _LineRunner(Runner):
+    STREAM_SEPARATOR = b"\n"
+
+    def __init__(self):
+        super().__init__("ns", 0, 1)
+        self.calls = []
+
+    def parse_records(self, records):
+        self.calls.append(records)
+
+
+class TestRunnerBase(unittest.TestCase):
+    def parse(self, output):
+        runner = _LineRunner()
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, output)
+        os.close(write_fd)
+        runner._parse_stream(read_fd)  # pylint: disable=protected-access
+        self.assertTrue(runner.streamed)
+        return runner.calls
+
+    def test_parse_stream(self):
+        self.assertEqual(self.parse(b"a\nb\n"), [[b"a", b"b"], []])
+
+    def test_parse_stream_trailing_output(self):
+        # Output without a trailing separator is parsed, and still ends
+        # with an empty list
+        self.assertEqual(self.parse(b"a\nb"), [[b"a"], [b"b"], []])
+
+    def test_cannot_stream_by_default(self):
+        runner = Runner("ns", 0, 1)
+        self.assertFalse(runner.can_stream())
+        runner.parse_records([b"a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test decoding the TCP socket stats read through sock_diag"""
+
+import struct
+import unittest
+from nest.experiment.parser.sock_diag import decode_tcp_info
+
+# pylint: disable=missing-docstring
+
+# Offsets of the fields in struct tcp_info
+_OFFSETS = {"rtt": 68, "snd_cwnd": 80, "delivery_rate": 160, "delivered": 192}
+
+
+def _tcp_info(size=200, **fields):
+    info = bytearray(size)
+    struct.pack_into("=I", info, _OFFSETS["rtt"], fields.get("rtt", 0))
+    struct.pack_into("=I", info, _OFFSETS["snd_cwnd"], fields.get("snd_cwnd", 0))
+    if size > _OFFSETS["delivered"]:
+        struct.pack_into("=I", info, _OFFSETS["delivered"], fields.get("delivered", 0))
+    return bytes(info)
+
+
+class TestSockDiag(unittest.TestCase):
+    def test_decode_tcp_info(self):
+        record = decode_tcp_info(_tcp_info(rtt=20500, snd_cwnd=10, delivered=1234))
+        self.assertEqual(record["cwnd"], 10)
+        self.assertEqual(record["rtt"], 20.5)
+        self.assertEqual(record["delivered"], 1234)
+
+    def test_decode_older_tcp_info(self):
+        # Kernels older than 4.18 don't report `tcpi_delivered`, neither
+        # does ss when it is 0
+        record = decode_tcp_info(_tcp_info(168, snd_cwnd=10))
+        self.assertEqual(record["cwnd"], 10)
+        self.assertNotIn("delivered", record)
+
+
+if __name__ == "__main__":
+    unittest.main()
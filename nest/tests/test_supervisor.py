@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test running the runners of an experiment"""
+
+import threading
+import time
+import unittest
+from nest import config
+from nest.experiment.clock import ExperimentClock
+from nest.experiment.supervisor import ExperimentSupervisor, run_in_pool
+
+# pylint: disable=missing-docstring
+
+
+class _Runner:  # pylint: disable=too-few-public-methods
+    def __init__(self, tracker):
+        self.ns_id = "ns"
+        self.tracker = tracker
+
+    def run(self):
+        self.tracker.enter()
+        time.sleep(0.05)
+        self.tracker.leave()
+
+
+class _Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.most_running = 0
+
+    def enter(self):
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+
+    def leave(self):
+        with self.lock:
+            self.running -= 1
+
+
+class TestSupervisor(unittest.TestCase):
+    def tearDown(self):
+        ExperimentClock.reset()
+
+    def test_max_runner_threads(self):
+        tracker = _Tracker()
+        runners = [_Runner(tracker) for _ in range(6)]
+
+        config.set_value("max_runner_threads", 2)
+        try:
+            ExperimentSupervisor().run(runners)
+        finally:
+            config.set_value("max_runner_threads", 1024)
+
+        self.assertEqual(tracker.most_running, 2)
+        self.assertEqual(tracker.running, 0)
+
+    def test_background_joined(self):
+        tracker = _Tracker()
+        supervisor = ExperimentSupervisor()
+        supervisor.start_background(_Runner(tracker))
+        threads = [thread for _, thread in supervisor.background]
+
+        supervisor.run([_Runner(tracker)])
+
+        # No thread is left running, for worker processes to be forked
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(supervisor.background, [])
+
+    def test_failing_runner(self):
+        tracker = _Tracker()
+        runner = _Runner(tracker)
+        runner.run = lambda: 1 / 0
+        with self.assertLogs("nest.experiment.supervisor", "ERROR"):
+            ExperimentSupervisor().run([runner, _Runner(tracker)])
+        self.assertEqual(tracker.most_running, 1)
+
+
+class TestRunInPool(unittest.TestCase):
+    def test_collect(self):
+        # Jobs need not be picklable
+        jobs = [lambda value=value: value * 2 for value in range(5)]
+        self.assertEqual(
+            run_in_pool(jobs, weights=[1, 5, 2, 4, 3], collect=True), [0, 2, 4, 6, 8]
+        )
+
+    def test_concurrent_pools(self):
+        results = {}
+
+        def run(name, count):
+            jobs = [lambda value=value: (name, value) for value in range(count)]
+            results[name] = run_in_pool(jobs, processes=2, collect=True)
+
+        threads = [
+            threading.Thread(target=run, args=(name, count))
+            for name, count in (("a", 20), ("b", 30))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Every pool runs its own jobs
+        self.assertEqual(results["a"], [("a", value) for value in range(20)])
+        self.assertEqual(results["b"], [("b", value) for value in range(30)])
+
+
+if __name__ == "__main__":
+    unittest.main()
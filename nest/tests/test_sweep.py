@@ -0,0 +1,188 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""Test running an experiment over a grid of parameters"""
+
+import unittest
+from nest.experiment import Experiment
+from nest.experiment.sweep import (
+    Sweep,
+    SweepParameter,
+    flow_attribute_parameter,
+    flow_option_parameter,
+    link_parameter,
+    qdisc_parameter,
+)
+
+# pylint: disable=missing-docstring
+
+
+class _Qdisc:  # pylint: disable=too-few-public-methods
+    def __init__(self, qdisc, kwargs):
+        self.qdisc = qdisc
+        self.kwargs = kwargs
+
+
+class _Bandwidth:  # pylint: disable=too-few-public-methods
+    def __init__(self, string_value):
+        self.string_value = string_value
+
+
+class _Interface:
+    def __init__(self, node_id, ifb_id):
+        self.node_id = node_id
+        self.ifb_id = ifb_id
+        self.qdisc = None
+        self.delay = None
+        self.bandwidth = None
+        self._ifb = self
+
+    def set_qdisc(self, qdisc, **kwargs):
+        self.qdisc = _Qdisc(qdisc, kwargs)
+
+    def get_qdisc(self):
+        return self.qdisc
+
+    def set_delay(self, delay):
+        self.delay = delay
+
+    def set_bandwidth(self, bandwidth):
+        self.bandwidth = _Bandwidth(bandwidth)
+
+    def get_bandwidth(self):
+        return self.bandwidth
+
+
+class _Flow:
+    def __init__(self, options):
+        self.number_of_streams = 1
+        self.options = options
+
+    def get_option(self, option, default=None):
+        return self.options.get(option, default)
+
+    def set_option(self, option, value):
+        self.options[option] = value
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.applied = []
+        self.grid = {
+            "qdisc": SweepParameter(["pie", "fq_codel"], self.apply("qdisc")),
+            "cc": SweepParameter(["cubic", "bbr"], self.apply("cc")),
+        }
+
+    def apply(self, name):
+        return lambda experiment, value: self.applied.append((name, value))
+
+    def test_points(self):
+        points = Sweep(Experiment("sweep"), self.grid).points()
+        self.assertEqual(
+            [parameters for parameters, _ in points],
+            [
+                {"qdisc": "pie", "cc": "cubic"},
+                {"qdisc": "pie", "cc": "bbr"},
+                {"qdisc": "fq_codel", "cc": "cubic"},
+                {"qdisc": "fq_codel", "cc": "bbr"},
+            ],
+        )
+        # Only the parameters that change are applied between runs
+        self.assertEqual(
+            [changed for _, changed in points],
+            [["qdisc", "cc"], ["cc"], ["qdisc", "cc"], ["cc"]],
+        )
+
+    def test_invalid_grid(self):
+        with self.assertRaises(TypeError):
+            Sweep(Experiment("sweep"), {"cc": ["cubic", "bbr"]})
+        with self.assertRaises(ValueError):
+            Sweep(Experiment("sweep"), {"cc": SweepParameter([], self.apply("cc"))})
+
+
+class TestSweepParameters(unittest.TestCase):
+    def setUp(self):
+        self.interface = _Interface("n0", "n0-ifb")
+        self.exp = Experiment("sweep")
+        self.exp.qdisc_stats.append(
+            {"ns_id": "n0", "int_id": "n0-ifb", "qdisc": "pie", "stats": ["prob"]}
+        )
+        self.exp.flows = [_Flow({"port_nos": [5000]}), _Flow({})]
+
+    def test_qdisc_parameter(self):
+        parameter = qdisc_parameter(
+            self.interface, ["pie", ("fq_codel", {"target": "5ms"})]
+        )
+        qdisc_stat = self.exp.qdisc_stats[0]
+
+        # Stats of an unchanged qdisc are kept
+        parameter.apply(self.exp, "pie")
+        self.assertEqual(self.interface.get_qdisc().qdisc, "pie")
+        self.assertEqual(qdisc_stat["stats"], ["prob"])
+
+        parameter.apply(self.exp, ("fq_codel", {"target": "5ms"}))
+        self.assertEqual(self.interface.get_qdisc().kwargs, {"target": "5ms"})
+        self.assertEqual(qdisc_stat["qdisc"], "fq_codel")
+        self.assertEqual(qdisc_stat["stats"], [])
+
+    def test_qdisc_parameter_other_interface(self):
+        parameter = qdisc_parameter([_Interface("n1", "n1-ifb")], ["fq_codel"])
+        parameter.apply(self.exp, "fq_codel")
+        self.assertEqual(
+            self.exp.qdisc_stats[0],
+            {"ns_id": "n0", "int_id": "n0-ifb", "qdisc": "pie", "stats": ["prob"]},
+        )
+
+    def test_link_parameter(self):
+        link_parameter(self.interface, "delay", ["5ms"]).apply(self.exp, "5ms")
+        self.assertEqual(self.interface.delay, "5ms")
+
+        # The bandwidth of the qdisc follows that of the link
+        self.interface.set_qdisc("pie")
+        link_parameter(self.interface, "bandwidth", ["10mbit"]).apply(
+            self.exp, "10mbit"
+        )
+        self.assertEqual(self.interface.get_bandwidth().string_value, "10mbit")
+
+    def test_flow_option_parameter(self):
+        flow_option_parameter("target_bw", ["5mbit"], flows=[1]).apply(
+            self.exp, "5mbit"
+        )
+        self.assertNotIn("target_bw", self.exp.flows[0].options)
+        self.assertEqual(self.exp.flows[1].get_option("target_bw"), "5mbit")
+
+    def test_flow_attribute_parameter(self):
+        flow_attribute_parameter("number_of_streams", [1, 4]).apply(self.exp, 4)
+        for flow in self.exp.flows:
+            self.assertEqual(flow.number_of_streams, 4)
+
+        # iperf3 flows get a distinct port per stream
+        port_nos = self.exp.flows[0].get_option("port_nos")
+        self.assertEqual(len(set(port_nos)), 4)
+        self.assertIn(5000, port_nos)
+        self.assertNotIn("port_nos", self.exp.flows[1].options)
+
+    def test_runs_copied(self):
+        runs = []
+
+        class _Experiment(Experiment):
+            def run(self):
+                runs.append(self)
+
+        exp = _Experiment("sweep")
+        exp.flows = self.exp.flows
+        sweep = Sweep(exp, {})
+        parameter = flow_option_parameter("target_bw", ["5mbit", "10mbit"])
+
+        parameter.apply(exp, "5mbit")
+        sweep._run_copy("sweep_0", "")  # pylint: disable=protected-access
+        parameter.apply(exp, "10mbit")
+
+        # The flows of a run aren't changed for the later runs
+        self.assertEqual(runs[0].flows[0].get_option("target_bw"), "5mbit")
+        self.assertEqual(exp.flows[0].get_option("target_bw"), "10mbit")
+        self.assertEqual(runs[0].name, "sweep_0")
+
+
+if __name__ == "__main__":
+    unittest.main()
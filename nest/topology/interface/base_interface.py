@@ -245,6 +245,19 @@ class BaseInterface:
         else:
             raise ValueError(f"{delay} should be greater than or equal to 0")
 
+    def get_bandwidth(self):
+        """
+        Get the bandwidth set on the interface
+
+        Returns
+        -------
+        Bandwidth/None
+            None if the bandwidth hasn't been set
+        """
+        if self._bandwidth is None:
+            return None
+        return Bandwidth(self._bandwidth)
+
     def get_qdisc(self):
         """
         Note that this is the qdisc set inside
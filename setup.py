@@ -51,6 +51,9 @@ setup(
         "nest.experiment.plotter": ["seaborn-v0_8-paper.mplstyle"],
         "nest": ["config.json"],
     },
+    entry_points={
+        "console_scripts": ["nest=nest.cli:main"],
+    },
     python_requires=">=3.12, <4",
     install_requires=[
         "matplotlib",
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Benchmark the cost of importing `nest.experiment`.
+
+Compares the current import against the earlier behaviour of the results
+module, which started one `multiprocessing.Manager` server process per
+tool (ten in total) at import time.
+
+Run from NeST root folder as below:
+$ sudo python3 utils/benchmarks/import_time.py
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Prints the import time and the number of child processes
+# of the interpreter once the import is done
+MEASURE = """
+import os, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+children = 0
+for tid in os.listdir("/proc/self/task"):
+    with open(f"/proc/self/task/{{tid}}/children") as file:
+        children += len(file.read().split())
+print(elapsed, children)
+"""
+
+CURRENT = "import nest.experiment"
+
+# What `nest/experiment/results.py` used to do at import
+LEGACY = """
+import nest.experiment
+from multiprocessing import Manager
+queues = [Manager().Queue() for _ in range(10)]
+for queue in queues:
+    queue.put({})
+"""
+
+
+def measure(code, repeat):
+    """
+    Run `code` in fresh interpreters and collect import time and
+    process count
+
+    Parameters
+    ----------
+    code : str
+        Code to be measured
+    repeat : int
+        Number of fresh interpreters to run `code` in
+
+    Returns
+    -------
+    (List[float], int)
+        Import times (in seconds) and number of child processes
+    """
+    times = []
+    children = 0
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE.format(code=code)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[-2]))
+        children = int(output[-1])
+    return times, children
+
+
+def main():
+    """Run the benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per variant")
+    args = parser.parse_args()
+
+    print(f"{'variant':<10}{'median (ms)':>14}{'min (ms)':>12}{'processes':>12}")
+    for name, code in (("legacy", LEGACY), ("current", CURRENT)):
+        times, children = measure(code, args.repeat)
+        print(
+            f"{name:<10}{statistics.median(times) * 1e3:>14.1f}"
+            f"{min(times) * 1e3:>12.1f}{children:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
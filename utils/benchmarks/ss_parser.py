@@ -0,0 +1,220 @@
+# SPDX-License-Identifier: GPL-2.0-only
+# Copyright (c) 2019-2026 NITK Surathkal
+
+"""
+Benchmark parsing of the output of the ss iterator.
+
+Compares `nest.experiment.parser.ss.parse_ss_output` against the earlier
+parser, which split the whole output on `---` and built and ran one
+regex per parameter for every socket, on a synthetic ss output.
+
+Run from NeST root folder as below:
+$ python3 utils/benchmarks/ss_parser.py --size 300
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+
+# Use NeST from this repository, only to parse (no namespaces are needed)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+os.environ.setdefault("NEST_OFFLINE", "1")
+
+# pylint: disable=wrong-import-position,import-error
+from nest.experiment.parser.ss import parse_ss_output
+
+DESTINATION_IP = "10.0.1.2"
+
+HEADER = "State Recv-Q Send-Q Local Address:Port  Peer Address:Port Process\n"
+
+SOCKET = "ESTAB 0      {queue}   10.0.0.1:{sport}    {dst}:{dport}\n"
+
+STATS = (
+    "\t cubic wscale:7,7 rto:{rto} rtt:{rtt}/{rttvar} ato:40 mss:1448 "
+    "pmtu:1500 rcvmss:536 advmss:1448 cwnd:{cwnd} ssthresh:{ssthresh} "
+    "bytes_sent:{sent} bytes_retrans:2896 bytes_acked:{acked} segs_out:{segs} "
+    "segs_in:{segs} data_segs_out:{segs} send {send}Mbps lastrcv:{last} "
+    "pacing_rate {pacing}Mbps delivery_rate {delivery}Mbps delivered:{segs} "
+    "busy:{last}ms unacked:{unacked} retrans:0/2 lost:{lost} rcv_space:14480 "
+    "rcv_ssthresh:64088 minrtt:{minrtt} snd_wnd:{wnd}\n"
+)
+
+# Parameters parsed by the earlier parser
+LEGACY_PARAMS = [
+    "cwnd",
+    "rwnd",
+    "rtt",
+    "ssthresh",
+    "rto",
+    "delivery_rate",
+    "pacing_rate",
+]
+
+
+def generate(path, size_mb, flows):
+    """
+    Write a synthetic output of the ss iterator
+
+    Parameters
+    ----------
+    path : str
+        File to be written
+    size_mb : int
+        Approximate size of the output (in MB)
+    flows : int
+        Number of flows in every sample
+
+    Returns
+    -------
+    int
+        Number of samples written
+    """
+    samples = 0
+    with open(path, "w", encoding="utf-8") as file:
+        while file.tell() < size_mb * 1e6:
+            lines = [f"timestamp:{1700000000 + samples * 0.2:.9f}\n", HEADER]
+            for flow in range(flows):
+                value = samples + flow
+                lines.append(
+                    SOCKET.format(
+                        queue=value % 100,
+                        sport=40000 + flow,
+                        dst=DESTINATION_IP if flow % 4 else "10.0.2.2",
+                        dport=5000 + flow,
+                    )
+                )
+                lines.append(
+                    STATS.format(
+                        rto=204 + value % 50,
+                        rtt=20 + value % 17 / 10,
+                        rttvar=value % 5 / 10,
+                        cwnd=10 + value % 90,
+                        ssthresh=20 + value % 40,
+                        sent=value * 1448,
+                        acked=value * 1440,
+                        segs=value,
+                        send=value % 100 / 10,
+                        last=value % 1000,
+                        pacing=value % 120 / 10,
+                        delivery=value % 80 / 10,
+                        unacked=value % 30,
+                        lost=value % 3,
+                        minrtt=20 + value % 7 / 10,
+                        wnd=64000 + value % 1000,
+                    )
+                )
+            lines.append("---\n")
+            file.writelines(lines)
+            samples += 1
+    return samples
+
+
+def _legacy_convert_to(param_value, unit_out="Mbps"):
+    """Rate conversion of the earlier parser"""
+    converter = {"bps": 1, "Kbps": 1e3, "Mbps": 1e6, "Gbps": 1e9}
+    unit_in = re.sub(r"^\d*\.?\d*", "", param_value)
+    extracted_param_value = float(re.sub(r"[A-Za-z]*", "", param_value))
+    return str(extracted_param_value * converter[unit_in] / converter[unit_out])
+
+
+# pylint: disable=too-many-locals
+def legacy_parse(out, destination_ip, meta_item):
+    """
+    The earlier `SsRunner.parse`, without storing the results
+
+    Parameters
+    ----------
+    out : File
+        Output of the ss iterator
+    destination_ip : str
+        Only connections to this address are parsed
+    meta_item : dict
+        "meta" item of every connection
+
+    Returns
+    -------
+    dict
+    """
+    stats_dict_list = {}
+    raw_stats = out.read().decode().split("---")
+    for raw_stat in raw_stats[:-1]:
+        stats = raw_stat.strip().split("\n")
+        timestamp = stats[0].split(":")[-1]
+        ports_info = stats[2::2]
+        statistics_data = [row.strip() for row in stats[3::2]]
+        for i, ports in enumerate(ports_info):
+            each_ports_info = ports.strip().split()
+            if each_ports_info[-1].split(":")[0] != destination_ip:
+                continue
+            dst_port = each_ports_info[-1].split(":")[-1]
+            if dst_port not in stats_dict_list:
+                stats_dict_list[dst_port] = [dict(meta_item)]
+            stats_dict_list[dst_port].append({"timestamp": timestamp})
+            for param in LEGACY_PARAMS:
+                pattern = (
+                    r"\s"
+                    + re.escape(param)
+                    + r"[\s:](?P<value>\w+\.?\w*(?:[\/\,]\w+\.?\w*)*)\s"
+                )
+                try:
+                    param_value = re.search(pattern, statistics_data[i]).group(1)
+                except AttributeError:
+                    continue
+                if param_value.endswith("bps"):
+                    param_value = _legacy_convert_to(param_value)
+                if param == "rtt":
+                    avg_rtt, dev_rtt = param_value.split("/")[:2]
+                    stats_dict_list[dst_port][-1]["rtt"] = avg_rtt
+                    stats_dict_list[dst_port][-1]["dev_rtt"] = dev_rtt
+                else:
+                    stats_dict_list[dst_port][-1][param] = param_value
+    return stats_dict_list
+
+
+def measure(parser, path):
+    """
+    Parse the output at `path` with `parser`
+
+    Parameters
+    ----------
+    parser : Callable
+        `legacy_parse` or `parse_ss_output`
+    path : str
+        Output of the ss iterator
+
+    Returns
+    -------
+    (float, int)
+        Time taken (in seconds) and number of records parsed
+    """
+    with open(path, "rb") as out:
+        start = time.perf_counter()
+        result = parser(out, DESTINATION_IP, {"meta": True})
+        elapsed = time.perf_counter() - start
+    return elapsed, sum(len(records) - 1 for records in result.values())
+
+
+def main():
+    """Run the benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--size", type=int, default=300, help="output size (MB)")
+    parser.add_argument("--flows", type=int, default=20, help="flows per sample")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ss.out")
+        samples = generate(path, args.size, args.flows)
+        size = os.path.getsize(path) / 1e6
+        print(f"{samples} samples of {args.flows} flows, {size:.0f} MB")
+
+        print(f"{'parser':<10}{'time (s)':>10}{'MB/s':>10}{'records':>12}")
+        for name, function in (("legacy", legacy_parse), ("current", parse_ss_output)):
+            elapsed, records = measure(function, path)
+            print(f"{name:<10}{elapsed:>10.2f}{size / elapsed:>10.1f}{records:>12}")
+
+
+if __name__ == "__main__":
+    main()